@@ -0,0 +1,57 @@
+-- Outbox table written by the CDC triggers when the listener runs with CDC_MODE=outbox
+CREATE TABLE IF NOT EXISTS outbox(
+    id BIGSERIAL PRIMARY KEY,
+    payload JSONB NOT NULL,
+    created_at TIMESTAMPTZ DEFAULT now()
+);
+
+COMMENT ON TABLE outbox IS 'Pending CDC messages, drained in batches by the CDC listener with FOR UPDATE SKIP LOCKED.';
+
+-- Function to enqueue a change and wake up the listeners
+CREATE OR REPLACE FUNCTION enqueue_data_change()
+RETURNS TRIGGER AS $$
+BEGIN
+  -- Same payload as notify_data_change(), but stored instead of sent, so it has no size limit and survives restarts
+  INSERT INTO outbox(payload)
+  VALUES (
+    jsonb_build_object(
+      'table', TG_TABLE_NAME,
+      'operation', TG_OP,
+      'data', row_to_json(NEW)::JSONB
+    )
+  );
+
+  -- Wake-up signal only; identical notifications are merged per transaction, so a bulk insert sends one
+  PERFORM pg_notify('outbox_changes', '');
+
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON FUNCTION enqueue_data_change() IS 'Writes the inserted row to the outbox table and notifies the outbox_changes channel.';
+
+-- Outbox triggers are created disabled; the NOTIFY triggers from 0007-0009 stay the default.
+-- To switch to the outbox mode, set CDC_MODE=outbox for the listener and run:
+--   ALTER TABLE articles DISABLE TRIGGER articles_insert_trigger;
+--   ALTER TABLE articles ENABLE TRIGGER articles_outbox_trigger;
+-- (and the same for posts and repositories). Reverse the statements to switch back.
+DROP TRIGGER IF EXISTS articles_outbox_trigger ON articles;
+CREATE TRIGGER articles_outbox_trigger
+AFTER INSERT ON public.articles
+FOR EACH ROW
+EXECUTE FUNCTION enqueue_data_change();
+ALTER TABLE articles DISABLE TRIGGER articles_outbox_trigger;
+
+DROP TRIGGER IF EXISTS posts_outbox_trigger ON posts;
+CREATE TRIGGER posts_outbox_trigger
+AFTER INSERT ON public.posts
+FOR EACH ROW
+EXECUTE FUNCTION enqueue_data_change();
+ALTER TABLE posts DISABLE TRIGGER posts_outbox_trigger;
+
+DROP TRIGGER IF EXISTS repositories_outbox_trigger ON repositories;
+CREATE TRIGGER repositories_outbox_trigger
+AFTER INSERT ON public.repositories
+FOR EACH ROW
+EXECUTE FUNCTION enqueue_data_change();
+ALTER TABLE repositories DISABLE TRIGGER repositories_outbox_trigger;
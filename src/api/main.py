@@ -1,13 +1,16 @@
 import logging
 from contextlib import asynccontextmanager
 
-from fastapi import Depends, FastAPI
+from fastapi import Depends, FastAPI, Request
 
 from src.api.key_validation import get_api_key
 from src.api.routers.crawling import router as crawling_router
 from src.api.routers.inference import router as inference_router
-from src.core.db.qdrant import QdrantDatabaseConnector
+from src.core.clients import clients
+from src.core.config import settings
 from src.core.db.supabase_client import SupabaseClient
+from src.core.rag.cache_invalidation import CacheInvalidationSubscriber
+from src.core.rag.reranking import load_reranker
 from src.data_crawling.crawlers import CustomArticleCrawler, GithubCrawler, LinkedInCrawler, MediumCrawler
 from src.data_crawling.dispatcher import CrawlerDispatcher
 
@@ -20,8 +23,8 @@ logger = logging.getLogger(__name__)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # --- Variables to hold initialized resources ---
-    qdrant_connector_instance: QdrantDatabaseConnector | None = None
     supabase_client_instance: SupabaseClient | None = None
+    cache_invalidations: CacheInvalidationSubscriber | None = None
 
     # Startup: Load models and clients
     logger.info("API starting up...")
@@ -50,22 +53,32 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.exception(f"Failed to initialize Crawler Dispatcher: {e}")
 
-    # Load Qdrant Client
+    # Start the shared Qdrant and LangChain clients, warming up their connection pools before the first request
     try:
-        logger.info("Initializing Qdrant client...")
-        qdrant_connector_instance = QdrantDatabaseConnector()  # Instantiate connector
-        app.state.qdrant_client = qdrant_connector_instance._instance  # Store the actual client instance
-        if app.state.qdrant_client:
-            # Perform a simple check like getting cluster info
-            # cluster_info = app.state.qdrant_client.get_cluster_info()
-            # logger.info(f"Qdrant client initialized successfully. Cluster info: {cluster_info}")
-            logger.info("Qdrant client initialized successfully.")  # Keep it simple for now
-        else:
-            logger.error("Failed to initialize Qdrant client instance.")
+        logger.info("Initializing shared clients...")
+        await clients.astart()
+        app.state.clients = clients
+        app.state.qdrant_client = clients.qdrant._instance  # Store the actual client instance
+        logger.info("Shared clients initialized successfully.")
     except Exception as e:
-        logger.exception(f"Error initializing Qdrant client: {e}")
+        logger.exception(f"Error initializing shared clients: {e}")
         # Depending on severity, might want to raise exception to stop startup
 
+    # Load the reranking model in a worker thread, before the first request needs it
+    try:
+        await load_reranker()
+    except Exception as e:
+        logger.exception(f"Failed to load the reranker: {e}")
+
+    # Invalidate the cached search results of this worker when the feature pipeline writes new points
+    if settings.RETRIEVAL_CACHE_ENABLED:
+        try:
+            cache_invalidations = CacheInvalidationSubscriber()
+            await cache_invalidations.start()
+        except Exception as e:
+            cache_invalidations = None
+            logger.exception(f"Failed to subscribe to retrieval cache invalidations, relying on the TTL: {e}")
+
     # Load OpenAI Client
     try:
         logger.info("Initializing OpenAI client...")
@@ -83,7 +96,8 @@ async def lifespan(app: FastAPI):
 
     # --- Initialize Supabase Client Pool ---
     try:
-        supabase_client_instance = SupabaseClient()
+        # One pool per uvicorn worker process
+        supabase_client_instance = SupabaseClient.for_process()
         await supabase_client_instance.connect()
         app.state.supabase_client = supabase_client_instance
         logger.info("Supabase client pool initialized successfully.")
@@ -95,12 +109,17 @@ async def lifespan(app: FastAPI):
     # Shutdown: Cleanup
     logger.info("API shutting down...")
 
-    if qdrant_connector_instance:
+    try:
+        await clients.aclose()
+        logger.info("Shared clients closed.")
+    except Exception as e:
+        logger.error(f"Error closing shared clients: {e}")
+
+    if cache_invalidations:
         try:
-            qdrant_connector_instance.close()
-            logger.info("Qdrant connection closed.")
+            await cache_invalidations.close()
         except Exception as e:
-            logger.error(f"Error closing Qdrant connector: {e}")
+            logger.error(f"Error closing the retrieval cache invalidation subscriber: {e}")
 
     if supabase_client_instance:
         try:
@@ -125,3 +144,13 @@ app.include_router(inference_router, prefix="/inference", tags=["inference"])
 @app.get("/")
 async def root():
     return {"message": "API is running"}
+
+
+@app.get("/health/db")
+async def db_health(request: Request):
+    """Reports whether the database answers, along with the connection pool metrics of this worker."""
+    client: SupabaseClient | None = request.app.state.supabase_client
+    if client is None:
+        return {"healthy": False, "pool": None}
+
+    return {"healthy": await client.health_check(), "pool": client.pool_stats()}
@@ -1,4 +1,8 @@
+import json
+from typing import AsyncIterator
+
 from fastapi import APIRouter, HTTPException, Request, status  # Added Request
+from fastapi.responses import StreamingResponse
 
 from ...api.schemas.inference import InferenceRequest, InferenceResponse
 from ...core import logger_utils
@@ -67,3 +71,45 @@ async def generate_response(request: InferenceRequest, request_obj: Request):  #
         logger.error(f"Error during inference generation for query '{request.query}': {e}", exc_info=True)
         # Task 6.3.5: Basic error handling
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to generate response: {str(e)}")
+
+
+def format_sse(event: str, data) -> str:
+    """Formats one Server-Sent Event with a JSON encoded payload."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@router.post("/generate/stream", status_code=status.HTTP_200_OK)
+async def generate_response_stream(request: InferenceRequest, request_obj: Request):
+    """
+    Streams the LLM Twin response as Server-Sent Events.
+    Emits a "context" event with the retrieved context, one "token" event per generated chunk and a final "done" event.
+    Errors raised after the stream has started are reported as an "error" event.
+    """
+    logger.info(
+        f"Received streaming inference request: query='{request.query}', use_rag={request.use_rag}, collection_id={request.collection_id}"
+    )
+    llm_client = request_obj.app.state.llm_client
+    if not llm_client:
+        logger.error("LLM Client (OpenAIClient) not available in app state. Check startup logs.")
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="LLM service is not ready.")
+
+    async def event_stream() -> AsyncIterator[str]:
+        try:
+            async for event in llm_twin_instance.generate_stream(
+                query=request.query,
+                llm_client=llm_client,
+                collection_id=request.collection_id,
+                enable_rag=request.use_rag,
+            ):
+                yield format_sse(event["event"], event["data"])
+
+            yield format_sse("done", None)
+        except Exception as e:
+            logger.error(f"Error during streaming inference for query '{request.query}': {e}", exc_info=True)
+            yield format_sse("error", f"Failed to generate response: {str(e)}")
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
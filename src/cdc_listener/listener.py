@@ -4,12 +4,17 @@ import logging
 
 import asyncpg
 
+from src.cdc_listener.outbox import OutboxDrainer
+from src.cdc_listener.publisher import CDCPublisher, get_queue_name
+from src.cdc_listener.replication import ReplicationReader
 from src.core.config import settings
-from src.core.mq import publish_to_rabbitmq
 
 # Configure basic logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
+# Long-lived publisher shared by all notifications, started in main()
+publisher: CDCPublisher | None = None
+
 
 async def connect_db():
     """Establishes an asynchronous connection to the database."""
@@ -35,13 +40,17 @@ async def handle_notification(connection, pid, channel, payload):
         data = json.loads(payload)
         logging.info(f"  PID: {pid}, Payload: {json.dumps(data, indent=2)}")
 
-        # Use queue name from settings
-        queue_name = settings.RABBITMQ_QUEUE_NAME
+        # Same routing as the outbox and replication modes
+        queue_name = get_queue_name(data, fallback_shard_key=payload)
+
+        if publisher is None:
+            logging.error("CDC publisher is not started. Dropping notification.")
+            return
+
         try:
-            # Run the synchronous publish function in a separate thread
-            # Pass the original payload string, not the parsed data dict
-            await asyncio.to_thread(publish_to_rabbitmq, queue_name, payload)
-            logging.info(f"Successfully published notification payload to queue '{queue_name}'.")
+            # Hand the original payload string over to the batching publisher; waits while its queue is full
+            await publisher.publish(queue_name, payload)
+            logging.debug(f"Queued notification payload for queue '{queue_name}'.")
         except Exception as e:
             logging.error(f"Failed to publish notification to queue '{queue_name}': {e}")
 
@@ -78,11 +87,21 @@ async def listen_for_notifications(conn):
 if __name__ == "__main__":
 
     async def main():
+        global publisher
+
         logging.info("Starting CDC listener...")
         conn = None
         try:
+            publisher = CDCPublisher()
+            await publisher.start()
             conn = await connect_db()
-            if conn:
+            if conn and settings.CDC_MODE == "outbox":
+                # Drain the outbox table, using NOTIFY only as a wake-up signal
+                await OutboxDrainer(conn, publisher).run()
+            elif conn and settings.CDC_MODE == "replication":
+                # Read row changes from the logical replication slot
+                await ReplicationReader(conn, publisher).run()
+            elif conn:
                 # Start listening for notifications
                 await listen_for_notifications(conn)
             else:
@@ -95,6 +114,8 @@ if __name__ == "__main__":
             if conn and not conn.is_closed():
                 await conn.close()
                 logging.info("Database connection closed.")
+            if publisher is not None:
+                await publisher.close()
             logging.info("Listener stopped.")
 
     # Use asyncio.run() which handles the event loop lifecycle
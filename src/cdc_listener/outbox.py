@@ -0,0 +1,74 @@
+import asyncio
+import json
+import logging
+
+import asyncpg
+
+from src.cdc_listener.publisher import CDCPublisher, get_queue_name
+from src.core.config import settings
+
+OUTBOX_CHANNEL = "outbox_changes"  # Channel defined in migration 0011
+
+
+class OutboxDrainer:
+    """
+    Drains the outbox table written by enqueue_data_change() and publishes its rows to RabbitMQ.
+
+    Rows are claimed in batches with FOR UPDATE SKIP LOCKED and deleted in the same transaction once the broker
+    confirmed them, so several listener replicas can drain the outbox concurrently and a failed publish leaves
+    the rows in place. NOTIFY is only used to wake the drainer up; the outbox is also polled as a safety net.
+    """
+
+    def __init__(
+        self,
+        conn: asyncpg.Connection,
+        publisher: CDCPublisher,
+        batch_size: int = settings.CDC_OUTBOX_BATCH_SIZE,
+    ) -> None:
+        self.conn = conn
+        self.publisher = publisher
+        self.batch_size = batch_size
+        self._wake_up = asyncio.Event()
+
+    def _on_notification(self, connection, pid, channel, payload) -> None:
+        self._wake_up.set()
+
+    async def drain_batch(self) -> int:
+        """Publishes and deletes one batch of outbox rows. Returns the number of rows drained."""
+        async with self.conn.transaction():
+            rows = await self.conn.fetch(
+                "SELECT id, payload::text AS payload FROM outbox ORDER BY id LIMIT $1 FOR UPDATE SKIP LOCKED",
+                self.batch_size,
+            )
+            if not rows:
+                return 0
+
+            for row in rows:
+                await self.publisher.publish(get_queue_name(json.loads(row["payload"]), str(row["id"])), row["payload"])
+
+            if not await self.publisher.flush():
+                # Rolls back, so the rows are retried by the next drain
+                raise RuntimeError("Failed to publish outbox rows.")
+
+            await self.conn.execute("DELETE FROM outbox WHERE id = ANY($1::bigint[])", [row["id"] for row in rows])
+
+        logging.info(f"Drained {len(rows)} outbox row(s).")
+
+        return len(rows)
+
+    async def run(self, poll_interval: float = settings.CDC_OUTBOX_POLL_INTERVAL_SECONDS) -> None:
+        await self.conn.add_listener(OUTBOX_CHANNEL, self._on_notification)
+        logging.info(f"Started draining the outbox, woken up by channel '{OUTBOX_CHANNEL}'...")
+        try:
+            while True:
+                self._wake_up.clear()
+                # Keep draining while there is a backlog
+                while await self.drain_batch() == self.batch_size:
+                    pass
+
+                try:
+                    await asyncio.wait_for(self._wake_up.wait(), timeout=poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            await self.conn.remove_listener(OUTBOX_CHANNEL, self._on_notification)
@@ -0,0 +1,125 @@
+import asyncio
+import logging
+
+import aio_pika
+
+from src.core.config import settings
+from src.core.mq import get_shard_queue_name
+
+
+def get_queue_name(message: dict | None, fallback_shard_key: str) -> str:
+    """Returns the queue of a CDC message, sharded by row id so every change to a row lands on the same queue."""
+    row = message.get("data") if isinstance(message, dict) else None
+    shard_key = str(row["id"]) if isinstance(row, dict) and row.get("id") is not None else fallback_shard_key
+
+    return get_shard_queue_name(settings.RABBITMQ_QUEUE_NAME, shard_key, settings.RABBITMQ_NUM_SHARDS)
+
+
+class CDCPublisher:
+    """
+    Publishes CDC payloads to RabbitMQ over one long-lived channel.
+
+    Payloads go through a bounded in-memory queue: publish() waits when it is full, which pushes back on the
+    notification handlers while the broker is slow. A single worker drains the queue in batches and publishes
+    each batch concurrently, so the publisher confirms of a batch are awaited together instead of one by one.
+    """
+
+    def __init__(
+        self,
+        url: str | None = None,
+        max_queue_size: int = settings.CDC_PUBLISH_QUEUE_SIZE,
+        batch_size: int = settings.CDC_PUBLISH_BATCH_SIZE,
+        max_retries: int = settings.CDC_PUBLISH_MAX_RETRIES,
+    ) -> None:
+        self.url = url or (
+            f"amqp://{settings.RABBITMQ_DEFAULT_USERNAME}:{settings.RABBITMQ_DEFAULT_PASSWORD}"
+            f"@{settings.RABBITMQ_HOST}:{settings.RABBITMQ_PORT}/"
+        )
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+
+        self._queue: asyncio.Queue[tuple[str, str]] = asyncio.Queue(maxsize=max_queue_size)
+        self._connection: aio_pika.abc.AbstractRobustConnection | None = None
+        self._channel: aio_pika.abc.AbstractChannel | None = None
+        self._declared_queues: set[str] = set()
+        self._worker: asyncio.Task | None = None
+        self._num_dropped = 0
+
+    async def start(self) -> None:
+        # connect_robust reconnects and restores the channel on its own after broker restarts
+        self._connection = await aio_pika.connect_robust(self.url)
+        self._channel = await self._connection.channel(publisher_confirms=True)
+        self._worker = asyncio.create_task(self._run())
+        logging.info("CDC publisher connected to RabbitMQ.")
+
+    async def publish(self, queue_name: str, payload: str) -> None:
+        await self._queue.put((queue_name, payload))
+
+    async def flush(self) -> bool:
+        """Waits until every queued payload is handled. Returns False if any was dropped since the last flush."""
+        await self._queue.join()
+        num_dropped, self._num_dropped = self._num_dropped, 0
+
+        return num_dropped == 0
+
+    async def close(self) -> None:
+        """Waits for the queued payloads to be published, then closes the connection."""
+        if self._worker is not None:
+            await self._queue.join()
+            self._worker.cancel()
+            self._worker = None
+
+        if self._connection is not None:
+            await self._connection.close()
+            self._connection = None
+            logging.info("CDC publisher connection closed.")
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            try:
+                await self._publish_batch(batch)
+            except Exception as e:
+                logging.error(f"Failed to publish {len(batch)} CDC payload(s): {e}")
+                self._num_dropped += len(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _publish_batch(self, batch: list[tuple[str, str]]) -> None:
+        assert self._channel is not None
+        pending = batch
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                for queue_name in {queue_name for queue_name, _ in pending} - self._declared_queues:
+                    await self._channel.declare_queue(queue_name, durable=True)
+                    self._declared_queues.add(queue_name)
+            except Exception as e:
+                # E.g. while the robust connection reconnects: retry the whole attempt after the backoff
+                logging.warning(f"Failed to declare the CDC queues: {e}")
+                failed = pending
+            else:
+                results = await asyncio.gather(
+                    *[
+                        self._channel.default_exchange.publish(
+                            aio_pika.Message(body=payload.encode(), delivery_mode=aio_pika.DeliveryMode.PERSISTENT),
+                            routing_key=queue_name,
+                        )
+                        for queue_name, payload in pending
+                    ],
+                    return_exceptions=True,
+                )
+                failed = [item for item, result in zip(pending, results) if isinstance(result, BaseException)]
+                logging.info(f"Published {len(pending) - len(failed)} CDC payload(s) to RabbitMQ.")
+                if not failed:
+                    return
+
+            logging.warning(f"{len(failed)} CDC payload(s) were not confirmed (attempt {attempt}/{self.max_retries}).")
+            pending = failed
+            await asyncio.sleep(2**attempt)
+
+        logging.error(f"Dropping {len(pending)} CDC payload(s) after {self.max_retries} failed attempts.")
+        self._num_dropped += len(pending)
@@ -0,0 +1,108 @@
+import asyncio
+import json
+import logging
+
+import asyncpg
+
+from src.cdc_listener.publisher import CDCPublisher, get_queue_name
+from src.core.config import settings
+
+# Like the notify and outbox triggers, which only fire on INSERT, updates are not published
+OPERATIONS = {"I": "INSERT"}
+JSON_TYPES = {"json", "jsonb"}
+
+
+def change_to_message(change: dict) -> dict | None:
+    """
+    Converts a wal2json (format-version 2) change into the CDC message published by notify_data_change(),
+    i.e. {"table", "operation", "data"}. Returns None for changes other than inserts.
+    """
+    operation = OPERATIONS.get(change.get("action"))
+    if operation is None:
+        return None
+
+    data = {}
+    for column in change.get("columns", []):
+        value = column.get("value")
+        if column.get("type") in JSON_TYPES and isinstance(value, str):
+            value = json.loads(value)
+        data[column["name"]] = value
+
+    return {"table": change["table"], "operation": operation, "data": data}
+
+
+class ReplicationReader:
+    """
+    Reads row changes from a wal2json logical replication slot and publishes them to RabbitMQ.
+
+    Changes are peeked a batch of whole transactions at a time and the slot is only advanced past a transaction
+    once all of its changes were confirmed by the broker. The slot itself is the checkpoint: after a restart,
+    reading resumes at the first unpublished transaction, and changes made while the reader was down are kept
+    in the WAL instead of being lost.
+    """
+
+    def __init__(
+        self,
+        conn: asyncpg.Connection,
+        publisher: CDCPublisher,
+        slot_name: str = settings.CDC_REPLICATION_SLOT,
+        tables: str = settings.CDC_REPLICATION_TABLES,
+        batch_size: int = settings.CDC_REPLICATION_BATCH_SIZE,
+    ) -> None:
+        self.conn = conn
+        self.publisher = publisher
+        self.slot_name = slot_name
+        self.tables = tables
+        self.batch_size = batch_size
+
+    async def ensure_slot(self) -> None:
+        exists = await self.conn.fetchval("SELECT 1 FROM pg_replication_slots WHERE slot_name = $1", self.slot_name)
+        if not exists:
+            await self.conn.execute("SELECT pg_create_logical_replication_slot($1, 'wal2json')", self.slot_name)
+            logging.info(f"Created logical replication slot '{self.slot_name}'.")
+
+    async def poll_once(self) -> int:
+        """Publishes the next batch of committed transactions and checkpoints the slot. Returns the number of changes."""
+        rows = await self.conn.fetch(
+            "SELECT lsn::text AS lsn, data FROM pg_logical_slot_peek_changes("
+            "$1, NULL, $2, 'format-version', '2', 'include-transaction', 'true', 'add-tables', $3)",
+            self.slot_name,
+            self.batch_size,
+            self.tables,
+        )
+        if not rows:
+            return 0
+
+        num_changes = 0
+        commit_lsn = None
+        for row in rows:
+            change = json.loads(row["data"])
+            if change.get("action") == "C":
+                commit_lsn = row["lsn"]
+                continue
+
+            message = change_to_message(change)
+            if message is None:
+                continue
+
+            payload = json.dumps(message)
+            await self.publisher.publish(get_queue_name(message, fallback_shard_key=payload), payload)
+            num_changes += 1
+
+        if not await self.publisher.flush():
+            logging.error("Some changes were not confirmed by RabbitMQ. Not advancing the replication slot.")
+            raise RuntimeError("Failed to publish replicated changes.")
+
+        if commit_lsn is not None:
+            await self.conn.execute("SELECT pg_replication_slot_advance($1, $2::pg_lsn)", self.slot_name, commit_lsn)
+            logging.info(f"Published {num_changes} replicated change(s), checkpointed slot at {commit_lsn}.")
+
+        return num_changes
+
+    async def run(self, poll_interval: float = settings.CDC_REPLICATION_POLL_INTERVAL_SECONDS) -> None:
+        await self.ensure_slot()
+        logging.info(f"Started reading logical replication slot '{self.slot_name}'...")
+        while True:
+            # Keep draining while there is a backlog, otherwise wait for new changes
+            if await self.poll_once() == 0:
+                await asyncio.sleep(poll_interval)
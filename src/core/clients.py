@@ -0,0 +1,133 @@
+import threading
+from typing import TYPE_CHECKING
+
+from src.core import logger_utils
+from src.core.config import settings
+from src.core.db.minio_client import AsyncMinioClient, MinioClient
+from src.core.db.qdrant import AsyncQdrantDatabaseConnector, QdrantDatabaseConnector
+
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+
+logger = logger_utils.get_logger(__name__)
+
+
+class ClientRegistry:
+    """
+    Process-wide clients of the external services, created once and shared so every request and dataflow step reuses
+    the same connection pools instead of paying the TCP/TLS setup again.
+
+    Clients are created lazily on first use; warm_up()/astart() create them up front and open their connections,
+    close()/aclose() release them on shutdown. The FastAPI lifespan and the bytewax worker start and close the
+    module-level `clients` registry.
+    """
+
+    def __init__(self) -> None:
+        self._qdrant: QdrantDatabaseConnector | None = None
+        self._async_qdrant: AsyncQdrantDatabaseConnector | None = None
+        self._minio: MinioClient | None = None
+        self._async_minio: AsyncMinioClient | None = None
+        self._chat_models: dict[float | None, "ChatOpenAI"] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def qdrant(self) -> QdrantDatabaseConnector:
+        if self._qdrant is None:
+            with self._lock:
+                if self._qdrant is None:
+                    self._qdrant = QdrantDatabaseConnector()
+
+        return self._qdrant
+
+    @property
+    def async_qdrant(self) -> AsyncQdrantDatabaseConnector:
+        if self._async_qdrant is None:
+            with self._lock:
+                if self._async_qdrant is None:
+                    self._async_qdrant = AsyncQdrantDatabaseConnector()
+
+        return self._async_qdrant
+
+    @property
+    def minio(self) -> MinioClient:
+        if self._minio is None:
+            with self._lock:
+                if self._minio is None:
+                    self._minio = MinioClient()
+
+        return self._minio
+
+    @property
+    def async_minio(self) -> AsyncMinioClient:
+        if self._async_minio is None:
+            minio = self.minio
+            with self._lock:
+                if self._async_minio is None:
+                    self._async_minio = AsyncMinioClient(client=minio)
+
+        return self._async_minio
+
+    def chat_model(self, temperature: float | None = None) -> "ChatOpenAI":
+        """Returns the shared ChatOpenAI model for the given temperature. Its HTTP clients are reused across calls."""
+        model = self._chat_models.get(temperature)
+        if model is None:
+            from langchain_openai import ChatOpenAI
+
+            with self._lock:
+                model = self._chat_models.get(temperature)
+                if model is None:
+                    kwargs = {} if temperature is None else {"temperature": temperature}
+                    model = ChatOpenAI(model=settings.OPENAI_MODEL_ID, api_key=settings.OPENAI_API_KEY, **kwargs)
+                    self._chat_models[temperature] = model
+
+        return model
+
+    def warm_up(self, minio: bool = True) -> None:
+        """Creates the blocking clients and opens their first connections, so the first request does not pay for it."""
+        try:
+            self.qdrant.get_collections()
+        except Exception:
+            logger.warning("Could not warm up the Qdrant client.", exc_info=True)
+
+        if minio:
+            try:
+                self.minio.ensure_bucket_exists("documents")
+            except Exception:
+                logger.warning("Could not warm up the MinIO client.", exc_info=True)
+
+    async def astart(self) -> None:
+        """Creates and warms up every client used on the inference path."""
+        self.warm_up(minio=False)
+        try:
+            await self.async_qdrant.get_collections()
+        except Exception:
+            logger.warning("Could not warm up the async Qdrant client.", exc_info=True)
+
+        self.chat_model()
+        self.chat_model(temperature=0)
+        logger.info("Clients started.")
+
+    def close(self) -> None:
+        """Closes the blocking clients. They are created again if used afterwards."""
+        if self._qdrant is not None:
+            self._qdrant.close()
+            self._qdrant = None
+        self._minio = None
+        self._async_minio = None
+
+    async def aclose(self) -> None:
+        """Closes every client, including the async ones and the HTTP clients of the chat models."""
+        if self._async_qdrant is not None:
+            await self._async_qdrant.close()
+            self._async_qdrant = None
+
+        for model in self._chat_models.values():
+            await model.root_async_client.close()
+            model.root_client.close()
+        self._chat_models.clear()
+
+        self.close()
+        logger.info("Clients closed.")
+
+
+clients = ClientRegistry()
@@ -14,6 +14,14 @@ class AppSettings(BaseSettings):
     API_KEY: str | None
     # Supabase config
     SUPABASE_DB_URL: str
+    # Connection pool, per process: the database sees up to workers * SUPABASE_POOL_MAX_SIZE connections
+    SUPABASE_POOL_MIN_SIZE: int = 1
+    SUPABASE_POOL_MAX_SIZE: int = 10
+    SUPABASE_POOL_ACQUIRE_TIMEOUT_SECONDS: float = 5.0
+    SUPABASE_POOL_MAX_INACTIVE_CONNECTION_LIFETIME_SECONDS: float = 300.0  # Recycle idle connections
+    SUPABASE_COMMAND_TIMEOUT_SECONDS: float = 30.0  # Client-side timeout of every query
+    SUPABASE_STATEMENT_TIMEOUT_MS: int = 30_000  # Server-side statement_timeout
+    SUPABASE_STATEMENT_CACHE_SIZE: int = 100  # Set to 0 behind a transaction-mode pooler (pgbouncer/supavisor)
     # SUPABASE_URL: str
     # SUPABASE_KEY: str
 
@@ -23,6 +31,19 @@ class AppSettings(BaseSettings):
     MINIO_ACCESS_KEY: str
     MINIO_SECRET_KEY: str
     MINIO_USE_SSL: str
+    MINIO_MAX_POOL_CONNECTIONS: int = 32  # Shared HTTP connection pool
+    MINIO_MAX_CONCURRENCY: int = 16  # Concurrent uploads/downloads of batched and async operations
+    MINIO_CONNECT_TIMEOUT_SECONDS: float = 5.0
+    MINIO_READ_TIMEOUT_SECONDS: float = 60.0
+    MINIO_MULTIPART_PART_SIZE: int = 16 * 1024 * 1024  # Larger uploads are sent as multipart, min 5 MiB
+    MINIO_STREAM_CHUNK_SIZE: int = 1024 * 1024
+    # Content-addressed storage: objects are keyed by the sha256 of their content (so identical documents are
+    # stored once) and zstd-compressed. Reads handle both these and older raw uuid-keyed objects.
+    MINIO_CONTENT_ADDRESSED: bool = True
+    MINIO_ZSTD_LEVEL: int = 3
+
+    # Bulk inserts: rows per COPY into the staging table
+    BULK_INSERT_BATCH_SIZE: int = 5000
 
     # MQ config
     RABBITMQ_DEFAULT_USERNAME: str = "guest"
@@ -30,6 +51,21 @@ class AppSettings(BaseSettings):
     RABBITMQ_HOST: str = "mq"
     RABBITMQ_PORT: int = 5672
     RABBITMQ_QUEUE_NAME: str = "data_changes_queue"  # Default queue name for CDC
+    RABBITMQ_NUM_SHARDS: int = 1  # > 1 routes each row to "<queue>.<shard>" by its id
+
+    # CDC listener publishing
+    CDC_PUBLISH_QUEUE_SIZE: int = 10_000
+    CDC_PUBLISH_BATCH_SIZE: int = 500
+    CDC_PUBLISH_MAX_RETRIES: int = 3
+    # "notify" listens to pg_notify from the insert triggers, "outbox" drains the outbox table (migration 0011),
+    # "replication" reads a wal2json logical replication slot
+    CDC_MODE: str = "notify"
+    CDC_OUTBOX_BATCH_SIZE: int = 500
+    CDC_OUTBOX_POLL_INTERVAL_SECONDS: float = 5.0  # Safety net for missed wake-ups
+    CDC_REPLICATION_SLOT: str = "llm_twin_cdc"
+    CDC_REPLICATION_TABLES: str = "public.articles,public.posts,public.repositories"
+    CDC_REPLICATION_BATCH_SIZE: int = 1000  # Changes per peek, rounded up to whole transactions
+    CDC_REPLICATION_POLL_INTERVAL_SECONDS: float = 1.0
 
     # QdrantDB config
     QDRANT_CLOUD_URL: str = "str"
@@ -37,6 +73,23 @@ class AppSettings(BaseSettings):
     QDRANT_DATABASE_PORT: int = 6333
     USE_QDRANT_CLOUD: bool = False
     QDRANT_APIKEY: str | None = None
+    # Layout of the vector_* collections, see src/core/db/qdrant_profiles.py: "default" (float32 in RAM), "scalar"
+    # (int8 quantized) or "binary" (binary quantized). Existing collections are migrated with
+    # python -m src.core.db.migrate_qdrant_collections. The settings below override the profile when set.
+    QDRANT_COLLECTION_PROFILE: str = "default"
+    QDRANT_HNSW_M: int | None = None
+    QDRANT_HNSW_EF_CONSTRUCT: int | None = None
+    QDRANT_VECTORS_ON_DISK: bool | None = None
+    QDRANT_SEARCH_HNSW_EF: int | None = None
+    QDRANT_SEARCH_OVERSAMPLING: float | None = None
+    # Keyword payload indexes on collection_id, author_id and type are created with every collection. With
+    # QDRANT_TENANT_INDEX, collection_id is indexed as the tenant key, so points of a tenant are stored together.
+    QDRANT_TENANT_INDEX: bool = False
+    # With QDRANT_SLIM_PAYLOADS, the chunk and cleaned document texts are stored in the CHUNK_CONTENT_BUCKET MinIO
+    # bucket and the points only keep a content_ref next to their ids and filter fields. The retriever fetches the
+    # texts of the search candidates in one batch. Points written before keep their content and are read as is.
+    QDRANT_SLIM_PAYLOADS: bool = False
+    CHUNK_CONTENT_BUCKET: str = "chunks"
 
     # OpenAI config
     OPENAI_MODEL_ID: str = "gpt-4o-mini"
@@ -65,6 +118,31 @@ class AppSettings(BaseSettings):
     KEEP_TOP_K: int = 5
     EXPAND_N_QUERY: int = 5
 
+    # Pipelined retrieval: the original query is searched while the expansion is streamed, the expanded queries are
+    # embedded and searched in batches as they arrive, and reranking starts once RAG_MIN_CANDIDATES unique hits
+    # arrived or RAG_RETRIEVAL_BUDGET_SECONDS elapsed.
+    RAG_PIPELINED_RETRIEVAL: bool = True
+    RAG_MIN_CANDIDATES: int = 5
+    RAG_EXPANSION_BUDGET_SECONDS: float = 3.0
+    RAG_RETRIEVAL_BUDGET_SECONDS: float = 4.0
+    RAG_RERANK_BUDGET_SECONDS: float = 5.0
+
+    # Reranking config: "cross_encoder" (local) or "llm"
+    RERANKER_BACKEND: str = "cross_encoder"
+    RERANKER_MODEL_ID: str = "cross-encoder/ms-marco-MiniLM-L-6-v2"
+    RERANKER_DEVICE: str = "cpu"
+    RERANKER_BATCH_SIZE: int = 32
+
+    # Retrieval cache config. The feature pipeline announces the collection_ids it wrote to on the
+    # RETRIEVAL_CACHE_INVALIDATION_EXCHANGE fanout exchange and every API process invalidates their cached search
+    # results. SEARCH_RESULT_CACHE_TTL_SECONDS bounds how long a missed announcement keeps new documents invisible.
+    RETRIEVAL_CACHE_ENABLED: bool = True
+    RETRIEVAL_CACHE_INVALIDATION_EXCHANGE: str = "retrieval_cache_invalidations"
+    QUERY_EMBEDDING_CACHE_SIZE: int = 10_000
+    QUERY_EMBEDDING_CACHE_TTL_SECONDS: float = 24 * 60 * 60
+    SEARCH_RESULT_CACHE_SIZE: int = 10_000
+    SEARCH_RESULT_CACHE_TTL_SECONDS: float = 5 * 60
+
     def patch_localhost(self) -> None:
         # self.MONGO_DATABASE_HOST = "mongodb://localhost:30001,localhost:30002,localhost:30003/?replicaSet=my-replica-set" # Removed
         self.QDRANT_DATABASE_HOST = "localhost"
@@ -0,0 +1,74 @@
+from src.core import logger_utils
+from src.core.clients import clients
+from src.core.config import settings
+from src.core.db.minio_client import AsyncMinioClient, MinioClient
+
+logger = logger_utils.get_logger(__name__)
+
+# Payload field pointing to the MinIO object holding the text of a slim point
+CONTENT_REF_FIELD = "content_ref"
+
+
+class ContentStore:
+    """
+    Stores the texts of slim Qdrant points (QDRANT_SLIM_PAYLOADS) in MinIO and puts them back in search hits.
+
+    Objects are content addressed (MINIO_CONTENT_ADDRESSED), so a chunk written again is not uploaded twice. The
+    clients default to the shared ones of src.core.clients.
+    """
+
+    def __init__(
+        self,
+        minio: MinioClient | None = None,
+        async_minio: AsyncMinioClient | None = None,
+        bucket_name: str = settings.CHUNK_CONTENT_BUCKET,
+    ) -> None:
+        self._minio = minio
+        self._async_minio = async_minio
+        self.bucket_name = bucket_name
+
+    @property
+    def minio(self) -> MinioClient:
+        return self._minio or clients.minio
+
+    @property
+    def async_minio(self) -> AsyncMinioClient:
+        return self._async_minio or clients.async_minio
+
+    def offload(self, payloads: list[dict], field: str) -> list[dict]:
+        """Uploads the field of every payload in one batch and returns the payloads with a content_ref instead."""
+        stored = self.minio.store_documents([payload[field] for payload in payloads], bucket_name=self.bucket_name)
+
+        return [
+            {key: value for key, value in payload.items() if key != field} | {CONTENT_REF_FIELD: object_id}
+            for payload, (object_id, _) in zip(payloads, stored)
+        ]
+
+    async def hydrate(self, hits: list, field: str = "content") -> list:
+        """
+        Fetches the text of every hit stored without it in one batch and returns copies of those hits with the text
+        set back in field. Hits whose text could not be fetched are dropped.
+        """
+        refs = [hit.payload[CONTENT_REF_FIELD] for hit in hits if field not in hit.payload and CONTENT_REF_FIELD in hit.payload]
+        if not refs:
+            return hits
+
+        contents = await self.async_minio.retrieve_documents(refs, bucket_name=self.bucket_name)
+
+        hydrated = []
+        for hit in hits:
+            if field in hit.payload or CONTENT_REF_FIELD not in hit.payload:
+                hydrated.append(hit)
+                continue
+
+            content = contents.get(hit.payload[CONTENT_REF_FIELD])
+            if content is None:
+                logger.warning("Could not fetch the content of a hit, dropping it.", point_id=hit.id)
+                continue
+            # Copied, as the hits can be shared with the retrieval cache
+            hydrated.append(hit.model_copy(update={"payload": hit.payload | {field: content}}))
+
+        return hydrated
+
+
+content_store = ContentStore()
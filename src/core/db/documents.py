@@ -1,3 +1,4 @@
+import json
 import typing  # Added import
 import uuid
 from typing import Type, TypeVar
@@ -6,8 +7,10 @@ import asyncpg
 from pydantic import UUID4, BaseModel, ConfigDict, Field
 
 from .. import logger_utils
-from .minio_client import MinioClient
+from ..clients import clients
+from ..config import settings
 from .supabase_client import SupabaseClient
+from .table_mapper import TableMapper
 
 # Generic type variable for Pydantic models
 T = TypeVar("T", bound=BaseModel)
@@ -16,6 +19,86 @@ T = TypeVar("T", bound=BaseModel)
 logger = logger_utils.get_logger(__name__)
 
 
+def _to_copy_record(data: dict, model_columns: list[str]) -> tuple:
+    """Orders a model dump by model_columns; dicts are serialized for JSON(B) columns, which COPY expects as text."""
+    return tuple(json.dumps(data.get(col)) if isinstance(data.get(col), dict) else data.get(col) for col in model_columns)
+
+
+async def _copy_insert(
+    db_client: SupabaseClient,
+    table_name: str,
+    db_columns: list[str],
+    records: list[tuple],
+    conflict_target_db: str,
+    batch_size: int = settings.BULK_INSERT_BATCH_SIZE,
+) -> None:
+    """
+    Bulk loads records with COPY into a temporary staging table, then moves them over with a single
+    INSERT ... SELECT ... ON CONFLICT DO NOTHING per batch.
+
+    Unlike a multi-row VALUES statement this is not bound by the 32767 parameter limit and its SQL text does not
+    depend on the number of rows. Each batch runs in its own transaction, which also drops the staging table.
+    """
+    staging_table = f"{table_name}_staging"
+    columns_sql = ", ".join(f'"{c}"' for c in db_columns)
+
+    async with db_client.get_connection() as conn:
+        for start in range(0, len(records), batch_size):
+            batch = records[start : start + batch_size]
+            async with conn.transaction():
+                await conn.execute(
+                    f"CREATE TEMPORARY TABLE {staging_table} (LIKE {table_name} INCLUDING DEFAULTS) ON COMMIT DROP"
+                )
+                await conn.copy_records_to_table(staging_table, records=batch, columns=db_columns)
+                await conn.execute(
+                    f"INSERT INTO {table_name} ({columns_sql}) SELECT {columns_sql} FROM {staging_table} "
+                    f"ON CONFLICT ({conflict_target_db}) DO NOTHING"
+                )
+            logger.debug(f"Copied {len(batch)} rows into {table_name}.")
+
+
+async def _find_one(cls: Type[T], db_client: SupabaseClient, criteria: dict) -> typing.Optional[T]:
+    """Finds a single instance of a document class through its table mapper."""
+    if not criteria:
+        logger.warning(f"find_one called without any criteria for {cls.__name__}.")
+        return None
+
+    filters = {}
+    for key, value in criteria.items():
+        if key not in cls.model_fields:
+            logger.warning(f"Invalid filter key '{key}' provided for {cls.__name__}. Skipping.")
+            continue  # Skip keys not present in the model
+        filters[key] = value
+
+    if not filters:  # If all criteria were invalid keys
+        logger.error(f"find_one for {cls.__name__} called with no valid criteria: {criteria}")
+        return None
+
+    try:
+        record = await cls._mapper.select_one(db_client, filters)
+        if record is None:
+            logger.debug("No document found.", model=cls.__name__)
+            return None
+
+        model_data = cls._mapper.to_model_data(record, cls.model_fields)
+        if not model_data:
+            logger.error(f"DB record {dict(record)} for {cls.__name__} resulted in empty model data after mapping.")
+            return None
+
+        try:
+            return cls(**model_data)
+        except Exception as e:  # Catch Pydantic validation errors etc.
+            logger.error(f"Error instantiating {cls.__name__} from DB record (mapped: {model_data}): {e}")
+            return None
+
+    except asyncpg.PostgresError as e:
+        logger.error(f"Database error finding {cls.__name__} with criteria {criteria}: {e}")
+        return None
+    except Exception as e:
+        logger.error(f"Unexpected error finding {cls.__name__} with criteria {criteria}: {e}")
+        return None
+
+
 # BaseDocument removed - contained MongoDB-specific logic
 
 
@@ -24,133 +107,39 @@ class UserDocument(BaseModel):
     username: str
 
     model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+    # Assuming 'id' is the conflict target as 'platform_user_id' is not in the model
+    _mapper: typing.ClassVar[TableMapper] = TableMapper("users", conflict_target="id")
 
     @classmethod
     async def save(cls: Type[T], instance: T, db_client: SupabaseClient) -> T:
         """Saves (inserts or updates) a UserDocument instance to the database."""
-
         try:
-            table_name = "users"
-            # Assuming 'id' is the conflict target as 'platform_user_id' is not in the model
-            # If 'platform_user_id' should be used, the model needs updating.
-            conflict_target = "id"
             data = instance.model_dump(exclude_unset=True)
 
             # Ensure id is present
             if "id" not in data:
-                data["id"] = uuid.uuid4()  # Should be set by default_factory, but ensure
-
-            columns = list(data.keys())
-            insert_cols = ", ".join(columns)
-            insert_placeholders = ", ".join(f"${i + 1}" for i in range(len(columns)))
-
-            # Build UPDATE SET clause excluding conflict target ('id') and 'created_at', 'updated_at'
-            update_set_parts = []
-            update_params = []
-            param_index = len(columns) + 1
-            for i, col in enumerate(columns):
-                if col not in ("id", "created_at", "updated_at"):
-                    update_set_parts.append(f"{col} = ${param_index}")
-                    update_params.append(data[col])
-                    param_index += 1
-            update_set_clause = ", ".join(update_set_parts)
-
-            sql = f"""
-            INSERT INTO {table_name} ({insert_cols})
-            VALUES ({insert_placeholders})
-            ON CONFLICT ({conflict_target}) DO UPDATE SET {update_set_clause}
-            RETURNING *;
-            """
-            params = list(data.values()) + update_params
-
-            record = await db_client.fetch_one(sql, params)
+                data["id"] = uuid.uuid4()
+
+            record = await cls._mapper.upsert(db_client, data)
 
             if record:
-                # Update instance with potentially new/updated fields from DB (like created_at, updated_at)
-                # Use construct to avoid re-validation if possible, or just update fields
-                updated_data = {**instance.model_dump(), **dict(record)}
-                return cls(**updated_data)  # Re-create instance with DB data
+                # Update instance with fields from DB (like created_at, updated_at), mapped back to model names
+                return cls(**{**instance.model_dump(), **cls._mapper.to_model_data(record, cls.model_fields)})
             else:
                 logger.warning(f"Failed to save or retrieve record for UserDocument with id {getattr(instance, 'id', 'unknown')}")
-                return instance  # Return original instance on failure
+                return instance
 
         except asyncpg.PostgresError as e:
             logger.error(f"Database error saving UserDocument with id {getattr(instance, 'id', 'unknown')}: {e}")
-            # Re-raise or handle as appropriate
             raise Exception(f"Failed to save UserDocument: {e}") from e
         except Exception as e:
             logger.error(f"Unexpected error saving UserDocument with id {getattr(instance, 'id', 'unknown')}: {e}")
-            raise  # Re-raise unexpected errors
+            raise
 
     @classmethod
     async def find_one(cls: Type["UserDocument"], db_client: SupabaseClient, **kwargs) -> typing.Optional["UserDocument"]:
         """Finds a single UserDocument instance based on keyword arguments."""
-        if not kwargs:
-            logger.warning(f"find_one called without any criteria for {cls.__name__}.")
-            return None
-
-        # Define table name and mappings specific to the class
-        table_name = "users"
-        db_column_map = {}  # No mapping needed for UserDocument based on save method
-
-        try:
-            conditions = []
-            params = []
-            valid_keys_provided = False
-            param_index = 1
-            for key, value in kwargs.items():
-                if key not in cls.model_fields:
-                    logger.warning(f"Invalid filter key '{key}' provided for {cls.__name__}. Skipping.")
-                    continue  # Skip keys not present in the model
-
-                valid_keys_provided = True
-                db_key = db_column_map.get(key, key)  # Map to DB column name for WHERE clause
-                conditions.append(f"{db_key} = ${param_index}")
-                params.append(value)
-                param_index += 1
-
-            if not valid_keys_provided:  # If all kwargs were invalid keys or no kwargs given initially
-                logger.error(f"find_one for {cls.__name__} called with no valid criteria: {kwargs}")
-                return None
-
-            where_clause = " AND ".join(conditions)
-            sql = f"SELECT * FROM {table_name} WHERE {where_clause} LIMIT 1;"
-            logger.debug(f"Executing SQL for {cls.__name__}: {sql} with params: {params}")
-
-            record = await db_client.fetch_one(sql, params)
-
-            if record:
-                try:
-                    record_dict = dict(record)
-                    # Map DB keys back to model keys for instantiation
-                    model_data = {}
-                    reverse_db_map = {v: k for k, v in db_column_map.items()}
-                    for db_key, value in record_dict.items():
-                        model_key = reverse_db_map.get(db_key, db_key)
-                        # Only include keys that are actual model fields
-                        if model_key in cls.model_fields:
-                            model_data[model_key] = value
-
-                    if not model_data:
-                        logger.error(f"DB record {record_dict} for {cls.__name__} resulted in empty model data after mapping.")
-                        return None
-
-                    instance = cls(**model_data)
-                    logger.info(f"Found {cls.__name__} with criteria: {kwargs}")
-                    return instance
-                except Exception as e:  # Catch Pydantic validation errors etc.
-                    logger.error(f"Error instantiating {cls.__name__} from DB record {record_dict} (mapped: {model_data}): {e}")
-                    return None
-            else:
-                logger.info(f"No {cls.__name__} found with criteria: {kwargs}")
-                return None
-
-        except asyncpg.PostgresError as e:
-            logger.error(f"Database error finding {cls.__name__} with criteria {kwargs}: {e}")
-            return None
-        except Exception as e:
-            logger.error(f"Unexpected error finding {cls.__name__} with criteria {kwargs}: {e}")
-            return None
+        return await _find_one(cls, db_client, kwargs)
 
     @classmethod
     async def get_or_create(
@@ -160,11 +149,11 @@ class UserDocument(BaseModel):
         # Attempt to find the user first using the existing static method
         existing_user = await cls.find_one(db_client=db_client, **kwargs)
         if existing_user is not None:
-            logger.info(f"Found existing UserDocument with criteria: {kwargs}")
+            logger.debug("Found existing UserDocument.", criteria=kwargs)
             return existing_user
 
         # If not found, prepare data for creation
-        logger.info(f"No UserDocument found with criteria: {kwargs}. Creating new one.")
+        logger.debug("No UserDocument found. Creating new one.", criteria=kwargs)
         create_data = kwargs.copy()
         if defaults:
             # Ensure defaults don't overwrite explicit kwargs provided in the call
@@ -178,7 +167,7 @@ class UserDocument(BaseModel):
 
             # Use the existing static save method. cls is passed implicitly.
             saved_user = await cls.save(new_user, db_client)
-            logger.info(f"Successfully created and saved new UserDocument with data: {create_data}")
+            logger.debug("Created new UserDocument.", data=create_data)
             return saved_user
         except (TypeError, ValueError) as e:  # Catch Pydantic validation errors (TypeError/ValueError)
             # Log a more specific error if possible, indicating missing fields might be the cause
@@ -200,63 +189,24 @@ class RepositoryDocument(BaseModel):
     owner_id: str = Field(alias="owner_id")  # TODO: Alias might not be needed depending on Supabase mapping
 
     model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+    # DB schema has 'url' unique constraint, model has 'link'
+    _mapper: typing.ClassVar[TableMapper] = TableMapper("repositories", conflict_target="url", column_map={"link": "url"})
 
     @classmethod
     async def save(cls: Type[T], instance: T, db_client: SupabaseClient) -> T:
         """Saves (inserts or updates) a RepositoryDocument instance to the database."""
         try:
-            table_name = "repositories"
-            # DB schema has 'url' unique constraint, model has 'link'
-            conflict_target_db = "url"
-            # DB schema has 'owner_platform_user_id', model has 'owner_id'
-            db_column_map = {"link": "url", "owner_id": "owner_platform_user_id"}
-
             data = instance.model_dump(exclude_unset=True)
 
             # Ensure id is present
             if "id" not in data:
                 data["id"] = uuid.uuid4()
 
-            # Map model fields to DB columns for SQL construction
-            columns_model = list(data.keys())
-            columns_db = [db_column_map.get(col, col) for col in columns_model]
-            insert_cols = ", ".join(columns_db)
-            insert_placeholders = ", ".join(f"${i + 1}" for i in range(len(columns_db)))
-
-            # Build UPDATE SET clause excluding conflict target ('url') and 'id', 'created_at', 'updated_at'
-            update_set_parts = []
-            update_params = []
-            param_index = len(columns_db) + 1
-            for i, col_db in enumerate(columns_db):
-                # Use DB column name for exclusion check
-                if col_db not in (conflict_target_db, "id", "created_at", "updated_at"):
-                    update_set_parts.append(f"{col_db} = ${param_index}")
-                    # Use original model data value for the parameter
-                    update_params.append(data[columns_model[i]])
-                    param_index += 1
-            update_set_clause = ", ".join(update_set_parts)
-
-            sql = f"""
-            INSERT INTO {table_name} ({insert_cols})
-            VALUES ({insert_placeholders})
-            ON CONFLICT ({conflict_target_db}) DO UPDATE SET {update_set_clause}
-            RETURNING *;
-            """
-            params = list(data.values()) + update_params
-
-            record = await db_client.fetch_one(sql, params)
+            record = await cls._mapper.upsert(db_client, data)
 
             if record:
-                # Map DB record back to model fields if necessary
-                record_dict = dict(record)
-                model_data = {**instance.model_dump()}  # Start with current model data
-                # Update with DB values, mapping DB names back to model names
-                reverse_db_map = {v: k for k, v in db_column_map.items()}
-                for db_key, value in record_dict.items():
-                    model_key = reverse_db_map.get(db_key, db_key)
-                    if model_key in instance.model_fields:
-                        model_data[model_key] = value
-                return cls(**model_data)
+                # Update instance with fields from DB (like created_at, updated_at), mapped back to model names
+                return cls(**{**instance.model_dump(), **cls._mapper.to_model_data(record, cls.model_fields)})
             else:
                 logger.warning(f"Failed to save or retrieve record for RepositoryDocument with link {getattr(instance, 'link', 'unknown')}")
                 return instance
@@ -271,72 +221,7 @@ class RepositoryDocument(BaseModel):
     @classmethod
     async def find_one(cls: Type["RepositoryDocument"], db_client: SupabaseClient, **kwargs) -> typing.Optional["RepositoryDocument"]:
         """Finds a single RepositoryDocument instance based on keyword arguments."""
-        if not kwargs:
-            logger.warning(f"find_one called without any criteria for {cls.__name__}.")
-            return None
-
-        # Define table name and mappings specific to the class
-        table_name = "repositories"
-        db_column_map = {"link": "url", "owner_id": "owner_platform_user_id"}  # From save method
-
-        try:
-            conditions = []
-            params = []
-            valid_keys_provided = False
-            param_index = 1
-            for key, value in kwargs.items():
-                if key not in cls.model_fields:
-                    logger.warning(f"Invalid filter key '{key}' provided for {cls.__name__}. Skipping.")
-                    continue  # Skip keys not present in the model
-
-                valid_keys_provided = True
-                db_key = db_column_map.get(key, key)  # Map to DB column name for WHERE clause
-                conditions.append(f"{db_key} = ${param_index}")
-                params.append(value)
-                param_index += 1
-
-            if not valid_keys_provided:  # If all kwargs were invalid keys or no kwargs given initially
-                logger.error(f"find_one for {cls.__name__} called with no valid criteria: {kwargs}")
-                return None
-
-            where_clause = " AND ".join(conditions)
-            sql = f"SELECT * FROM {table_name} WHERE {where_clause} LIMIT 1;"
-            logger.debug(f"Executing SQL for {cls.__name__}: {sql} with params: {params}")
-
-            record = await db_client.fetch_one(sql, params)
-
-            if record:
-                try:
-                    record_dict = dict(record)
-                    # Map DB keys back to model keys for instantiation
-                    model_data = {}
-                    reverse_db_map = {v: k for k, v in db_column_map.items()}
-                    for db_key, value in record_dict.items():
-                        model_key = reverse_db_map.get(db_key, db_key)
-                        # Only include keys that are actual model fields
-                        if model_key in cls.model_fields:
-                            model_data[model_key] = value
-
-                    if not model_data:
-                        logger.error(f"DB record {record_dict} for {cls.__name__} resulted in empty model data after mapping.")
-                        return None
-
-                    instance = cls(**model_data)
-                    logger.info(f"Found {cls.__name__} with criteria: {kwargs}")
-                    return instance
-                except Exception as e:  # Catch Pydantic validation errors etc.
-                    logger.error(f"Error instantiating {cls.__name__} from DB record {record_dict} (mapped: {model_data}): {e}")
-                    return None
-            else:
-                logger.info(f"No {cls.__name__} found with criteria: {kwargs}")
-                return None
-
-        except asyncpg.PostgresError as e:
-            logger.error(f"Database error finding {cls.__name__} with criteria {kwargs}: {e}")
-            return None
-        except Exception as e:
-            logger.error(f"Unexpected error finding {cls.__name__} with criteria {kwargs}: {e}")
-            return None
+        return await _find_one(cls, db_client, kwargs)
 
     @classmethod
     async def bulk_insert(cls: Type["RepositoryDocument"], instances: typing.List["RepositoryDocument"], db_client: SupabaseClient) -> None:
@@ -346,10 +231,8 @@ class RepositoryDocument(BaseModel):
             return
 
         try:
-            table_name = "repositories"
+            table_name = cls._mapper.table_name
             conflict_target_db = "url"  # As per instructions
-            # Map model field names to database column names
-            db_column_map = {"link": "url", "owner_id": "owner_platform_user_id"}
 
             # Get columns from the first instance, excluding 'id'
             first_instance_data = instances[0].model_dump()
@@ -359,40 +242,12 @@ class RepositoryDocument(BaseModel):
                 logger.warning("No columns determined for bulk insert of RepositoryDocument (excluding id).")
                 return
 
-            # Map to DB column names for the SQL query, ensuring they are strings
-            db_columns = [db_column_map.get(col, col) for col in model_columns]
-            # Filter out potential None values just in case, though unlikely with model keys
-            db_columns = [col for col in db_columns if isinstance(col, str)]
-            insert_cols_sql = ", ".join(f'"{c}"' for c in db_columns)  # Quote column names for safety
-
-            num_columns = len(db_columns)
-            num_rows = len(instances)
-
-            # Create placeholders for all rows: ($1,$2), ($3,$4), ...
-            all_rows_placeholders = []
-            param_index = 1
-            for _ in range(num_rows):
-                row_placeholders = ", ".join(f"${param_index + i}" for i in range(num_columns))
-                all_rows_placeholders.append(f"({row_placeholders})")
-                param_index += num_columns
-            values_sql = ", ".join(all_rows_placeholders)
-
-            # Prepare flat list of parameters in the correct order
-            params = []
-            for instance in instances:
-                instance_data = instance.model_dump()
-                for model_col in model_columns:  # Iterate using model columns to ensure correct order
-                    params.append(instance_data.get(model_col))
-
-            sql = f"""
-            INSERT INTO {table_name} ({insert_cols_sql})
-            VALUES {values_sql}
-            ON CONFLICT ({conflict_target_db}) DO NOTHING;
-            """
-
-            logger.debug(f"Executing bulk insert for {num_rows} RepositoryDocuments. SQL: {sql[:500]}...")  # Log truncated SQL
-            await db_client.execute(sql, params)
-            logger.info(f"Successfully executed bulk insert for {num_rows} RepositoryDocuments.")
+            # Map to DB column names for the staging table and the final INSERT
+            db_columns = cls._mapper.to_db_columns(model_columns)
+            records = [_to_copy_record(instance.model_dump(), model_columns) for instance in instances]
+
+            await _copy_insert(db_client, table_name, db_columns, records, conflict_target_db)
+            logger.info(f"Successfully executed bulk insert for {len(records)} RepositoryDocuments.")
 
         except asyncpg.PostgresError as e:
             logger.error(f"Database error during bulk insert for RepositoryDocument: {e}")
@@ -410,61 +265,25 @@ class PostDocument(BaseModel):
     author_id: str = Field(alias="author_id")  # TODO: Alias might not be needed
 
     model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+    # DB schema has unique constraint on (platform, platform_post_id), model lacks platform_post_id, so 'id' is the
+    # conflict target. Model fields match the column names
+    _mapper: typing.ClassVar[TableMapper] = TableMapper("posts", conflict_target="id")
 
     @classmethod
     async def save(cls: Type[T], instance: T, db_client: SupabaseClient) -> T:
         """Saves (inserts or updates) a PostDocument instance to the database."""
         try:
-            table_name = "posts"
-            # DB schema has unique constraint on (platform, platform_post_id), model lacks platform_post_id.
-            # Instructions mention 'url' example, but model lacks it. Using 'id' as fallback conflict target.
-            conflict_target = "id"
-            # DB schema has 'author_platform_user_id', model has 'author_id'
-            db_column_map = {"author_id": "author_platform_user_id"}
-
             data = instance.model_dump(exclude_unset=True)
 
             # Ensure id is present
             if "id" not in data:
                 data["id"] = uuid.uuid4()
 
-            # Map model fields to DB columns for SQL construction
-            columns_model = list(data.keys())
-            columns_db = [db_column_map.get(col, col) for col in columns_model]
-            insert_cols = ", ".join(columns_db)
-            insert_placeholders = ", ".join(f"${i + 1}" for i in range(len(columns_db)))
-
-            # Build UPDATE SET clause excluding conflict target ('id') and 'created_at', 'updated_at'
-            update_set_parts = []
-            update_params = []
-            param_index = len(columns_db) + 1
-            for i, col_db in enumerate(columns_db):
-                if col_db not in (conflict_target, "created_at", "updated_at"):  # Exclude 'id' implicitly as it's the conflict target
-                    update_set_parts.append(f"{col_db} = ${param_index}")
-                    update_params.append(data[columns_model[i]])
-                    param_index += 1
-            update_set_clause = ", ".join(update_set_parts)
-
-            sql = f"""
-            INSERT INTO {table_name} ({insert_cols})
-            VALUES ({insert_placeholders})
-            ON CONFLICT ({conflict_target}) DO UPDATE SET {update_set_clause}
-            RETURNING *;
-            """
-            params = list(data.values()) + update_params
-
-            record = await db_client.fetch_one(sql, params)
+            record = await cls._mapper.upsert(db_client, data)
 
             if record:
-                # Map DB record back to model fields
-                record_dict = dict(record)
-                model_data = {**instance.model_dump()}
-                reverse_db_map = {v: k for k, v in db_column_map.items()}
-                for db_key, value in record_dict.items():
-                    model_key = reverse_db_map.get(db_key, db_key)
-                    if model_key in instance.model_fields:
-                        model_data[model_key] = value
-                return cls(**model_data)
+                # Update instance with fields from DB (like created_at, updated_at), mapped back to model names
+                return cls(**{**instance.model_dump(), **cls._mapper.to_model_data(record, cls.model_fields)})
             else:
                 logger.warning(f"Failed to save or retrieve record for PostDocument with id {getattr(instance, 'id', 'unknown')}")
                 return instance
@@ -479,72 +298,7 @@ class PostDocument(BaseModel):
     @classmethod
     async def find_one(cls: Type["PostDocument"], db_client: SupabaseClient, **kwargs) -> typing.Optional["PostDocument"]:
         """Finds a single PostDocument instance based on keyword arguments."""
-        if not kwargs:
-            logger.warning(f"find_one called without any criteria for {cls.__name__}.")
-            return None
-
-        # Define table name and mappings specific to the class
-        table_name = "posts"
-        db_column_map = {"author_id": "author_platform_user_id"}  # From save method
-
-        try:
-            conditions = []
-            params = []
-            valid_keys_provided = False
-            param_index = 1
-            for key, value in kwargs.items():
-                if key not in cls.model_fields:
-                    logger.warning(f"Invalid filter key '{key}' provided for {cls.__name__}. Skipping.")
-                    continue  # Skip keys not present in the model
-
-                valid_keys_provided = True
-                db_key = db_column_map.get(key, key)  # Map to DB column name for WHERE clause
-                conditions.append(f"{db_key} = ${param_index}")
-                params.append(value)
-                param_index += 1
-
-            if not valid_keys_provided:  # If all kwargs were invalid keys or no kwargs given initially
-                logger.error(f"find_one for {cls.__name__} called with no valid criteria: {kwargs}")
-                return None
-
-            where_clause = " AND ".join(conditions)
-            sql = f"SELECT * FROM {table_name} WHERE {where_clause} LIMIT 1;"
-            logger.debug(f"Executing SQL for {cls.__name__}: {sql} with params: {params}")
-
-            record = await db_client.fetch_one(sql, params)
-
-            if record:
-                try:
-                    record_dict = dict(record)
-                    # Map DB keys back to model keys for instantiation
-                    model_data = {}
-                    reverse_db_map = {v: k for k, v in db_column_map.items()}
-                    for db_key, value in record_dict.items():
-                        model_key = reverse_db_map.get(db_key, db_key)
-                        # Only include keys that are actual model fields
-                        if model_key in cls.model_fields:
-                            model_data[model_key] = value
-
-                    if not model_data:
-                        logger.error(f"DB record {record_dict} for {cls.__name__} resulted in empty model data after mapping.")
-                        return None
-
-                    instance = cls(**model_data)
-                    logger.info(f"Found {cls.__name__} with criteria: {kwargs}")
-                    return instance
-                except Exception as e:  # Catch Pydantic validation errors etc.
-                    logger.error(f"Error instantiating {cls.__name__} from DB record {record_dict} (mapped: {model_data}): {e}")
-                    return None
-            else:
-                logger.info(f"No {cls.__name__} found with criteria: {kwargs}")
-                return None
-
-        except asyncpg.PostgresError as e:
-            logger.error(f"Database error finding {cls.__name__} with criteria {kwargs}: {e}")
-            return None
-        except Exception as e:
-            logger.error(f"Unexpected error finding {cls.__name__} with criteria {kwargs}: {e}")
-            return None
+        return await _find_one(cls, db_client, kwargs)
 
     @classmethod
     async def bulk_insert(cls: Type["PostDocument"], instances: typing.List["PostDocument"], db_client: SupabaseClient) -> None:
@@ -554,11 +308,9 @@ class PostDocument(BaseModel):
             return
 
         try:
-            table_name = "posts"
+            table_name = cls._mapper.table_name
             # TODO: Verify 'url' is the correct conflict target for 'posts' table as model lacks it. Following instructions.
             conflict_target_db = "url"
-            # Map model field names to database column names
-            db_column_map = {"author_id": "author_platform_user_id"}
 
             # Get columns from the first instance, excluding 'id'
             first_instance_data = instances[0].model_dump()
@@ -568,38 +320,12 @@ class PostDocument(BaseModel):
                 logger.warning("No columns determined for bulk insert of PostDocument (excluding id).")
                 return
 
-            # Map to DB column names for the SQL query
-            db_columns = [db_column_map.get(col, col) for col in model_columns]
-            insert_cols_sql = ", ".join(f'"{c}"' for c in db_columns)  # Quote column names
-
-            num_columns = len(db_columns)
-            num_rows = len(instances)
-
-            # Create placeholders for all rows: ($1,$2), ($3,$4), ...
-            all_rows_placeholders = []
-            param_index = 1
-            for _ in range(num_rows):
-                row_placeholders = ", ".join(f"${param_index + i}" for i in range(num_columns))
-                all_rows_placeholders.append(f"({row_placeholders})")
-                param_index += num_columns
-            values_sql = ", ".join(all_rows_placeholders)
-
-            # Prepare flat list of parameters in the correct order
-            params = []
-            for instance in instances:
-                instance_data = instance.model_dump()
-                for model_col in model_columns:
-                    params.append(instance_data.get(model_col))
-
-            sql = f"""
-            INSERT INTO {table_name} ({insert_cols_sql})
-            VALUES {values_sql}
-            ON CONFLICT ({conflict_target_db}) DO NOTHING;
-            """
-
-            logger.debug(f"Executing bulk insert for {num_rows} PostDocuments. SQL: {sql[:500]}...")
-            await db_client.execute(sql, params)
-            logger.info(f"Successfully executed bulk insert for {num_rows} PostDocuments.")
+            # Map to DB column names for the staging table and the final INSERT
+            db_columns = cls._mapper.to_db_columns(model_columns)
+            records = [_to_copy_record(instance.model_dump(), model_columns) for instance in instances]
+
+            await _copy_insert(db_client, table_name, db_columns, records, conflict_target_db)
+            logger.info(f"Successfully executed bulk insert for {len(records)} PostDocuments.")
 
         except asyncpg.PostgresError as e:
             logger.error(f"Database error during bulk insert for PostDocument: {e}")
@@ -618,17 +344,13 @@ class ArticleDocument(BaseModel):
     collection_id: str
 
     model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+    # DB schema has 'url' unique constraint, model has 'link'
+    _mapper: typing.ClassVar[TableMapper] = TableMapper("articles", conflict_target="url", column_map={"link": "url"})
 
     @classmethod
     async def save(cls: Type[T], instance: T, db_client: SupabaseClient) -> T:
         """Saves (inserts or updates) an ArticleDocument instance to the database."""
         try:
-            table_name = "articles"
-            # DB schema has 'url' unique constraint, model has 'link'
-            conflict_target_db = "url"
-            # DB schema has 'author_platform_user_id', model has 'author_id'
-            db_column_map = {"link": "url"}
-
             data = instance.model_dump(exclude_unset=True)
 
             # Ensure id is present
@@ -636,52 +358,16 @@ class ArticleDocument(BaseModel):
                 data["id"] = uuid.uuid4()
 
             content = data.get("content", "")
-            content_s3_uri = None
-
             if content:
-                minio_client = MinioClient()
-                object_id, content_s3_uri = minio_client.store_document(content)
-
-            # Replace content with S3 URI
-            data["content"] = f"s3://{object_id}"
-
-            # Map model fields to DB columns for SQL construction
-            columns_model = list(data.keys())
-            columns_db = [db_column_map.get(col, col) for col in columns_model]
-            insert_cols = ", ".join(columns_db)
-            insert_placeholders = ", ".join(f"${i + 1}" for i in range(len(columns_db)))
-
-            # Build UPDATE SET clause excluding conflict target ('url') and 'id', 'created_at', 'updated_at'
-            update_set_parts = []
-            update_params = []
-            param_index = len(columns_db) + 1
-            for i, col_db in enumerate(columns_db):
-                if col_db not in (conflict_target_db, "id", "created_at", "updated_at"):
-                    update_set_parts.append(f"{col_db} = ${param_index}")
-                    update_params.append(data[columns_model[i]])
-                    param_index += 1
-            update_set_clause = ", ".join(update_set_parts)
-
-            sql = f"""
-            INSERT INTO {table_name} ({insert_cols})
-            VALUES ({insert_placeholders})
-            ON CONFLICT ({conflict_target_db}) DO UPDATE SET {update_set_clause}
-            RETURNING *;
-            """
-            params = list(data.values()) + update_params
-
-            record = await db_client.fetch_one(sql, params)
+                # Replace content with S3 URI
+                object_id, _ = await clients.async_minio.store_document(content)
+                data["content"] = f"s3://{object_id}"
+
+            record = await cls._mapper.upsert(db_client, data)
 
             if record:
-                # Map DB record back to model fields
-                record_dict = dict(record)
-                model_data = {**instance.model_dump()}
-                reverse_db_map = {v: k for k, v in db_column_map.items()}
-                for db_key, value in record_dict.items():
-                    model_key = reverse_db_map.get(db_key, db_key)
-                    if model_key in instance.model_fields:
-                        model_data[model_key] = value
-                return cls(**model_data)
+                # Update instance with fields from DB (like created_at, updated_at), mapped back to model names
+                return cls(**{**instance.model_dump(), **cls._mapper.to_model_data(record, cls.model_fields)})
             else:
                 logger.warning(f"Failed to save or retrieve record for ArticleDocument with link {getattr(instance, 'link', 'unknown')}")
                 return instance
@@ -696,72 +382,7 @@ class ArticleDocument(BaseModel):
     @classmethod
     async def find_one(cls: Type["ArticleDocument"], db_client: SupabaseClient, **kwargs) -> typing.Optional["ArticleDocument"]:
         """Finds a single ArticleDocument instance based on keyword arguments."""
-        if not kwargs:
-            logger.warning(f"find_one called without any criteria for {cls.__name__}.")
-            return None
-
-        # Define table name and mappings specific to the class
-        table_name = "articles"
-        db_column_map = {"link": "url", "author_id": "author_platform_user_id"}  # From save method
-
-        try:
-            conditions = []
-            params = []
-            valid_keys_provided = False
-            param_index = 1
-            for key, value in kwargs.items():
-                if key not in cls.model_fields:
-                    logger.warning(f"Invalid filter key '{key}' provided for {cls.__name__}. Skipping.")
-                    continue  # Skip keys not present in the model
-
-                valid_keys_provided = True
-                db_key = db_column_map.get(key, key)  # Map to DB column name for WHERE clause
-                conditions.append(f"{db_key} = ${param_index}")
-                params.append(value)
-                param_index += 1
-
-            if not valid_keys_provided:  # If all kwargs were invalid keys or no kwargs given initially
-                logger.error(f"find_one for {cls.__name__} called with no valid criteria: {kwargs}")
-                return None
-
-            where_clause = " AND ".join(conditions)
-            sql = f"SELECT * FROM {table_name} WHERE {where_clause} LIMIT 1;"
-            logger.debug(f"Executing SQL for {cls.__name__}: {sql} with params: {params}")
-
-            record = await db_client.fetch_one(sql, params)
-
-            if record:
-                try:
-                    record_dict = dict(record)
-                    # Map DB keys back to model keys for instantiation
-                    model_data = {}
-                    reverse_db_map = {v: k for k, v in db_column_map.items()}
-                    for db_key, value in record_dict.items():
-                        model_key = reverse_db_map.get(db_key, db_key)
-                        # Only include keys that are actual model fields
-                        if model_key in cls.model_fields:
-                            model_data[model_key] = value
-
-                    if not model_data:
-                        logger.error(f"DB record {record_dict} for {cls.__name__} resulted in empty model data after mapping.")
-                        return None
-
-                    instance = cls(**model_data)
-                    logger.info(f"Found {cls.__name__} with criteria: {kwargs}")
-                    return instance
-                except Exception as e:  # Catch Pydantic validation errors etc.
-                    logger.error(f"Error instantiating {cls.__name__} from DB record {record_dict} (mapped: {model_data}): {e}")
-                    return None
-            else:
-                logger.info(f"No {cls.__name__} found with criteria: {kwargs}")
-                return None
-
-        except asyncpg.PostgresError as e:
-            logger.error(f"Database error finding {cls.__name__} with criteria {kwargs}: {e}")
-            return None
-        except Exception as e:
-            logger.error(f"Unexpected error finding {cls.__name__} with criteria {kwargs}: {e}")
-            return None
+        return await _find_one(cls, db_client, kwargs)
 
     @classmethod
     async def get_content(cls, instance: "ArticleDocument") -> str:
@@ -771,8 +392,7 @@ class ArticleDocument(BaseModel):
         # Check if content is stored in MinIO
         if content and content.startswith("s3://"):
             object_id = content.replace("s3://", "")
-            minio_client = MinioClient()
-            retrieved_content = minio_client.retrieve_document(object_id)
+            retrieved_content = await clients.async_minio.retrieve_document(object_id)
 
             if retrieved_content:
                 return retrieved_content
@@ -799,16 +419,14 @@ class ArticleDocument(BaseModel):
 
     @classmethod
     async def bulk_insert(cls: Type["ArticleDocument"], instances: typing.List["ArticleDocument"], db_client: SupabaseClient) -> None:
-        """Efficiently inserts multiple ArticleDocument instances into the database."""
+        """Efficiently inserts multiple ArticleDocument instances into the database, storing their content in MinIO."""
         if not instances:
             logger.info("bulk_insert called with empty list for ArticleDocument.")
             return
 
         try:
-            table_name = "articles"
+            table_name = cls._mapper.table_name
             conflict_target_db = "url"  # As per instructions
-            # Map model field names to database column names
-            db_column_map = {"link": "url", "author_id": "author_platform_user_id"}
 
             # Get columns from the first instance, excluding 'id'
             first_instance_data = instances[0].model_dump()
@@ -818,38 +436,19 @@ class ArticleDocument(BaseModel):
                 logger.warning("No columns determined for bulk insert of ArticleDocument (excluding id).")
                 return
 
-            # Map to DB column names for the SQL query
-            db_columns = [db_column_map.get(col, col) for col in model_columns]
-            insert_cols_sql = ", ".join(f'"{c}"' for c in db_columns)  # Quote column names
-
-            num_columns = len(db_columns)
-            num_rows = len(instances)
-
-            # Create placeholders for all rows: ($1,$2), ($3,$4), ...
-            all_rows_placeholders = []
-            param_index = 1
-            for _ in range(num_rows):
-                row_placeholders = ", ".join(f"${param_index + i}" for i in range(num_columns))
-                all_rows_placeholders.append(f"({row_placeholders})")
-                param_index += num_columns
-            values_sql = ", ".join(all_rows_placeholders)
-
-            # Prepare flat list of parameters in the correct order
-            params = []
-            for instance in instances:
-                instance_data = instance.model_dump()
-                for model_col in model_columns:
-                    params.append(instance_data.get(model_col))
-
-            sql = f"""
-            INSERT INTO {table_name} ({insert_cols_sql})
-            VALUES {values_sql}
-            ON CONFLICT ({conflict_target_db}) DO NOTHING;
-            """
-
-            logger.debug(f"Executing bulk insert for {num_rows} ArticleDocuments. SQL: {sql[:500]}...")
-            await db_client.execute(sql, params)
-            logger.info(f"Successfully executed bulk insert for {num_rows} ArticleDocuments.")
+            # Upload the contents concurrently and replace them with their S3 URIs, as save() does
+            rows = [instance.model_dump() for instance in instances]
+            with_content = [row for row in rows if row.get("content")]
+            stored = await clients.async_minio.store_documents([row["content"] for row in with_content])
+            for row, (object_id, _) in zip(with_content, stored):
+                row["content"] = f"s3://{object_id}"
+
+            # Map to DB column names for the staging table and the final INSERT
+            db_columns = cls._mapper.to_db_columns(model_columns)
+            records = [_to_copy_record(row, model_columns) for row in rows]
+
+            await _copy_insert(db_client, table_name, db_columns, records, conflict_target_db)
+            logger.info(f"Successfully executed bulk insert for {len(records)} ArticleDocuments.")
 
         except asyncpg.PostgresError as e:
             logger.error(f"Database error during bulk insert for ArticleDocument: {e}")
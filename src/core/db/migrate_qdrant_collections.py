@@ -0,0 +1,60 @@
+"""
+Applies a collection profile (quantization, on-disk vectors, HNSW config) to the existing vector_* collections and
+creates their missing payload indexes.
+
+Qdrant rebuilds the segments in the background and keeps serving searches meanwhile; the collection status is
+"yellow" until the optimization finished. Set QDRANT_COLLECTION_PROFILE to the same profile so new collections and
+search-time parameters match.
+
+Usage (from the repository root):
+    python -m src.core.db.migrate_qdrant_collections --profile scalar
+    python -m src.core.db.migrate_qdrant_collections --profile default --collections vector_articles --dry-run
+"""
+
+import argparse
+
+from src.core import logger_utils
+from src.core.db.qdrant import QdrantDatabaseConnector
+from src.core.db.qdrant_profiles import COLLECTION_PROFILES, get_collection_profile
+
+logger = logger_utils.get_logger(__name__)
+
+VECTOR_COLLECTIONS = ["vector_articles", "vector_posts", "vector_repositories"]
+
+
+def migrate(connector: QdrantDatabaseConnector, profile_name: str, collection_names: list[str], dry_run: bool = False) -> list[str]:
+    """Applies the profile to every existing collection among collection_names and returns the migrated ones."""
+    profile = get_collection_profile(profile_name)
+    existing = {collection.name for collection in connector.get_collections().collections}
+
+    migrated = []
+    for collection_name in collection_names:
+        if collection_name not in existing:
+            logger.warning("Collection does not exist, skipping it.", collection_name=collection_name)
+            continue
+
+        logger.info("Applying collection profile.", collection_name=collection_name, profile=profile, dry_run=dry_run)
+        if not dry_run:
+            connector.apply_collection_profile(collection_name, profile)
+            connector.ensure_payload_indexes(collection_name)
+        migrated.append(collection_name)
+
+    return migrated
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Apply a collection profile to the existing Qdrant vector collections.")
+    parser.add_argument("--profile", choices=list(COLLECTION_PROFILES), required=True)
+    parser.add_argument("--collections", default=",".join(VECTOR_COLLECTIONS), help="Comma separated collection names.")
+    parser.add_argument("--dry-run", action="store_true", help="Only log the changes.")
+    args = parser.parse_args()
+
+    connector = QdrantDatabaseConnector()
+    try:
+        migrate(connector, args.profile, args.collections.split(","), dry_run=args.dry_run)
+    finally:
+        connector.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,12 @@
+import asyncio
+import hashlib
 import io
 import uuid
-from typing import Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, ClassVar, Iterator, Optional, Tuple
 
+import urllib3
+import zstandard
 from minio import Minio
 from minio.error import S3Error
 
@@ -10,26 +15,47 @@ from src.core.logger_utils import get_logger
 
 logger = get_logger(__name__)
 
+# Object metadata recording how the stored bytes are encoded, returned as x-amz-meta-* headers
+CODEC_METADATA_KEY = "content-codec"
+HASH_METADATA_KEY = "content-sha256"
+ZSTD_CODEC = "zstd"
+
+# Shared by every client, so connections to MinIO are reused instead of opened per request
+_http_client = urllib3.PoolManager(
+    maxsize=settings.MINIO_MAX_POOL_CONNECTIONS,
+    timeout=urllib3.Timeout(connect=settings.MINIO_CONNECT_TIMEOUT_SECONDS, read=settings.MINIO_READ_TIMEOUT_SECONDS),
+    retries=urllib3.Retry(total=3, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504]),
+)
+# Runs the blocking MinIO calls of batched and async operations
+_executor = ThreadPoolExecutor(max_workers=settings.MINIO_MAX_CONCURRENCY, thread_name_prefix="minio")
+
 
 class MinioClient:
+    """MinIO client over the shared HTTP connection pool. Long-lived processes share one through src.core.clients."""
+
     _instance: Optional[Minio] = None
+    _known_buckets: ClassVar[set[str]] = set()
 
     def __init__(self):
-        if self._instance is None:
-            self._instance = Minio(
-                endpoint=f"{settings.MINIO_HOST}:{settings.MINIO_PORT}",
-                access_key=settings.MINIO_ACCESS_KEY,
-                secret_key=settings.MINIO_SECRET_KEY,
-                secure=True if settings.MINIO_USE_SSL.lower() == "true" else False,
-            )
+        self._instance = Minio(
+            endpoint=f"{settings.MINIO_HOST}:{settings.MINIO_PORT}",
+            access_key=settings.MINIO_ACCESS_KEY,
+            secret_key=settings.MINIO_SECRET_KEY,
+            secure=True if settings.MINIO_USE_SSL.lower() == "true" else False,
+            http_client=_http_client,
+        )
 
     def ensure_bucket_exists(self, bucket_name: str):
-        """Create bucket if it doesn't exist"""
+        """Create bucket if it doesn't exist. Buckets seen once are cached for the lifetime of the process."""
         assert self._instance is not None
+        if bucket_name in self._known_buckets:
+            return
+
         try:
             if not self._instance.bucket_exists(bucket_name):
                 self._instance.make_bucket(bucket_name)
                 logger.info(f"Created bucket '{bucket_name}'")
+            self._known_buckets.add(bucket_name)
         except S3Error as e:
             logger.error(f"Error ensuring bucket exists: {e}")
             raise
@@ -40,22 +66,37 @@ class MinioClient:
         try:
             self.ensure_bucket_exists(bucket_name)
 
-            # Generate a unique object ID
-            object_id = str(uuid.uuid4())
-
             # Convert string content to bytes
             content_bytes = content.encode("utf-8")
-            content_stream = io.BytesIO(content_bytes)
-            content_size = len(content_bytes)
+            metadata = None
+
+            if settings.MINIO_CONTENT_ADDRESSED:
+                # Identical contents share one object, so an unchanged document is never uploaded twice
+                object_id = hashlib.sha256(content_bytes).hexdigest()
+                if self._object_exists(bucket_name, object_id):
+                    logger.debug(f"Document s3://{bucket_name}/{object_id} already stored, skipping upload")
+                    return object_id, f"s3://{bucket_name}/{object_id}"
+
+                content_bytes = zstandard.ZstdCompressor(level=settings.MINIO_ZSTD_LEVEL).compress(content_bytes)
+                metadata = {CODEC_METADATA_KEY: ZSTD_CODEC, HASH_METADATA_KEY: object_id}
+            else:
+                # Generate a unique object ID
+                object_id = str(uuid.uuid4())
 
-            # Upload the document
+            # Upload the document, as a multipart upload when it is larger than one part
             self._instance.put_object(
-                bucket_name=bucket_name, object_name=object_id, data=content_stream, length=content_size, content_type="text/plain"
+                bucket_name=bucket_name,
+                object_name=object_id,
+                data=io.BytesIO(content_bytes),
+                length=len(content_bytes),
+                content_type="text/plain",
+                metadata=metadata,
+                part_size=settings.MINIO_MULTIPART_PART_SIZE,
             )
 
             # Return both the object ID and full S3 URI
             s3_uri = f"s3://{bucket_name}/{object_id}"
-            logger.info(f"Stored document as {s3_uri}")
+            logger.debug(f"Stored document as {s3_uri}")
             return object_id, s3_uri
 
         except S3Error as e:
@@ -63,14 +104,113 @@ class MinioClient:
             raise
 
     def retrieve_document(self, object_id: str, bucket_name: str = "documents") -> Optional[str]:
-        """Retrieve document content from MinIO"""
+        """Retrieve document content from MinIO, decompressing it if it was stored compressed"""
         assert self._instance is not None
         try:
             response = self._instance.get_object(bucket_name, object_id)
-            content = response.read().decode("utf-8")
-            response.close()
-            response.release_conn()
-            return content
+            try:
+                content_bytes = response.read()
+                if _codec(response) == ZSTD_CODEC:
+                    content_bytes = zstandard.ZstdDecompressor().decompress(content_bytes)
+            finally:
+                response.close()
+                response.release_conn()
+            return content_bytes.decode("utf-8")
         except S3Error as e:
             logger.error(f"Error retrieving document {object_id}: {e}")
             return None
+
+    def _object_exists(self, bucket_name: str, object_id: str) -> bool:
+        assert self._instance is not None
+        try:
+            self._instance.stat_object(bucket_name, object_id)
+            return True
+        except S3Error as e:
+            if e.code in ("NoSuchKey", "NoSuchObject", "ResourceNotFound"):
+                return False
+            raise
+
+    def stream_document(
+        self, object_id: str, bucket_name: str = "documents", chunk_size: int = settings.MINIO_STREAM_CHUNK_SIZE
+    ) -> Iterator[bytes]:
+        """Yield the bytes of a document in chunks, decompressed, without loading the whole object in memory"""
+        assert self._instance is not None
+        response = self._instance.get_object(bucket_name, object_id)
+        try:
+            if _codec(response) == ZSTD_CODEC:
+                # Decompress incrementally, chunk sizes then follow the decompressed output
+                decompressor = zstandard.ZstdDecompressor().decompressobj()
+                for chunk in response.stream(chunk_size):
+                    if decompressed := decompressor.decompress(chunk):
+                        yield decompressed
+            else:
+                yield from response.stream(chunk_size)
+        finally:
+            response.close()
+            response.release_conn()
+
+    def store_documents(self, contents: list[str], bucket_name: str = "documents") -> list[Tuple[str, str]]:
+        """Store many documents concurrently and return their object IDs and URIs, in order"""
+        self.ensure_bucket_exists(bucket_name)
+        # Identical contents in the batch are uploaded once
+        unique_contents = list(dict.fromkeys(contents))
+        stored = dict(zip(unique_contents, _executor.map(lambda content: self.store_document(content, bucket_name), unique_contents)))
+
+        return [stored[content] for content in contents]
+
+    def retrieve_documents(self, object_ids: list[str], bucket_name: str = "documents") -> dict[str, Optional[str]]:
+        """Retrieve many documents concurrently, mapping each object ID to its content (None if it failed)"""
+        unique_ids = list(dict.fromkeys(object_ids))
+        contents = _executor.map(lambda object_id: self.retrieve_document(object_id, bucket_name), unique_ids)
+
+        return dict(zip(unique_ids, contents))
+
+
+def _codec(response) -> Optional[str]:
+    return response.headers.get(f"x-amz-meta-{CODEC_METADATA_KEY}")
+
+
+class AsyncMinioClient:
+    """
+    Async facade over MinioClient for use from the event loop.
+
+    The MinIO SDK is blocking, so every call runs on the shared MinIO thread pool, bounded by MINIO_MAX_CONCURRENCY,
+    and reuses the shared HTTP connection pool.
+    """
+
+    def __init__(self, client: Optional[MinioClient] = None) -> None:
+        self.client = client or MinioClient()
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(_executor, func, *args)
+
+    async def store_document(self, content: str, bucket_name: str = "documents") -> Tuple[str, str]:
+        return await self._run(self.client.store_document, content, bucket_name)
+
+    async def retrieve_document(self, object_id: str, bucket_name: str = "documents") -> Optional[str]:
+        return await self._run(self.client.retrieve_document, object_id, bucket_name)
+
+    async def store_documents(self, contents: list[str], bucket_name: str = "documents") -> list[Tuple[str, str]]:
+        await self._run(self.client.ensure_bucket_exists, bucket_name)
+        # Identical contents in the batch are uploaded once
+        unique_contents = list(dict.fromkeys(contents))
+        results = await asyncio.gather(*(self.store_document(content, bucket_name) for content in unique_contents))
+        stored = dict(zip(unique_contents, results))
+
+        return [stored[content] for content in contents]
+
+    async def retrieve_documents(self, object_ids: list[str], bucket_name: str = "documents") -> dict[str, Optional[str]]:
+        unique_ids = list(dict.fromkeys(object_ids))
+        contents = await asyncio.gather(*(self.retrieve_document(object_id, bucket_name) for object_id in unique_ids))
+
+        return dict(zip(unique_ids, contents))
+
+    async def stream_document(
+        self, object_id: str, bucket_name: str = "documents", chunk_size: int = settings.MINIO_STREAM_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        chunks = self.client.stream_document(object_id, bucket_name, chunk_size)
+        try:
+            while (chunk := await self._run(next, chunks, None)) is not None:
+                yield chunk
+        finally:
+            chunks.close()
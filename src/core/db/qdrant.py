@@ -1,47 +1,111 @@
-from qdrant_client import QdrantClient, models
-from qdrant_client.http.models import Batch, Distance, VectorParams
+from qdrant_client import AsyncQdrantClient, QdrantClient, models
+from qdrant_client.http.models import Batch
 
 from .. import logger_utils
 from ..config import settings
+from .qdrant_profiles import CollectionProfile, get_collection_profile
 
 logger = logger_utils.get_logger(__name__)
 
+# Payload fields searches filter on, indexed so Qdrant plans filtered searches from the index
+PAYLOAD_INDEX_FIELDS = ("collection_id", "author_id", "type")
+TENANT_FIELD = "collection_id"
+
+
+def payload_index_schema(field_name: str, is_tenant: bool = False) -> models.KeywordIndexParams:
+    """Keyword index of a payload field. A tenant index also groups the points of each value together on disk."""
+    return models.KeywordIndexParams(
+        type=models.KeywordIndexType.KEYWORD, is_tenant=True if is_tenant and field_name == TENANT_FIELD else None
+    )
+
 
 class QdrantDatabaseConnector:
+    """
+    Blocking Qdrant connector. Every connector opens its own client and connection pool, so long-lived processes
+    share one through src.core.clients instead of creating connectors per call.
+    """
+
     _instance: QdrantClient | None = None
 
     def __init__(self) -> None:
-        if self._instance is None:
-            if settings.USE_QDRANT_CLOUD:
-                self._instance = QdrantClient(
-                    url=settings.QDRANT_CLOUD_URL,
-                    api_key=settings.QDRANT_APIKEY,
-                )
-            else:
-                self._instance = QdrantClient(
-                    host=settings.QDRANT_DATABASE_HOST,
-                    port=settings.QDRANT_DATABASE_PORT,
-                )
+        if settings.USE_QDRANT_CLOUD:
+            self._instance = QdrantClient(
+                url=settings.QDRANT_CLOUD_URL,
+                api_key=settings.QDRANT_APIKEY,
+            )
+        else:
+            self._instance = QdrantClient(
+                host=settings.QDRANT_DATABASE_HOST,
+                port=settings.QDRANT_DATABASE_PORT,
+            )
 
     def get_collection(self, collection_name: str):
         assert self._instance is not None
         return self._instance.get_collection(collection_name=collection_name)
 
+    def get_collections(self):
+        assert self._instance is not None
+        return self._instance.get_collections()
+
     def create_non_vector_collection(self, collection_name: str):
         assert self._instance is not None
         self._instance.create_collection(collection_name=collection_name, vectors_config={})
+        self.ensure_payload_indexes(collection_name)
 
-    def create_vector_collection(self, collection_name: str):
+    def create_vector_collection(self, collection_name: str, profile: CollectionProfile | None = None):
+        """Creates a vector collection laid out by the given profile, QDRANT_COLLECTION_PROFILE by default."""
         assert self._instance is not None
+        profile = profile or get_collection_profile()
         self._instance.create_collection(
             collection_name=collection_name,
-            vectors_config=VectorParams(size=settings.EMBEDDING_SIZE, distance=Distance.COSINE),
+            vectors_config=profile.vectors_config(size=settings.EMBEDDING_SIZE),
+            hnsw_config=profile.hnsw_config(),
+            quantization_config=profile.quantization_config(),
         )
+        self.ensure_payload_indexes(collection_name)
 
-    def write_data(self, collection_name: str, points: Batch):
+    def ensure_payload_indexes(self, collection_name: str) -> list[str]:
+        """Creates the missing keyword payload indexes of the collection and returns the fields it indexed."""
+        assert self._instance is not None
+        indexed = self._instance.get_collection(collection_name=collection_name).payload_schema
+        created = []
+        for field_name in PAYLOAD_INDEX_FIELDS:
+            if field_name in indexed:
+                continue
+
+            self._instance.create_payload_index(
+                collection_name=collection_name,
+                field_name=field_name,
+                field_schema=payload_index_schema(field_name, is_tenant=settings.QDRANT_TENANT_INDEX),
+            )
+            created.append(field_name)
+
+        if created:
+            logger.info("Created payload indexes.", collection_name=collection_name, fields=created)
+
+        return created
+
+    def apply_collection_profile(self, collection_name: str, profile: CollectionProfile) -> None:
+        """
+        Migrates an existing vector collection to the profile. Qdrant applies the new layout in the background by
+        rebuilding the segments, the collection stays searchable meanwhile.
+        """
+        assert self._instance is not None
+        self._instance.update_collection(
+            collection_name=collection_name,
+            vectors_config={"": models.VectorParamsDiff(on_disk=profile.vectors_on_disk)},
+            hnsw_config=profile.hnsw_config(),
+            quantization_config=profile.quantization_config() or models.Disabled.DISABLED,
+        )
+
+    def write_data(self, collection_name: str, points: Batch, wait: bool = True) -> models.UpdateResult:
+        """
+        Upserts the points. With wait=False, Qdrant returns as soon as the operation is persisted to its write-ahead log,
+        before it is applied and indexed.
+        """
         assert self._instance is not None
         try:
-            self._instance.upsert(collection_name=collection_name, points=points)
+            return self._instance.upsert(collection_name=collection_name, points=points, wait=wait)
         except Exception:
             logger.exception("An error occurred while inserting data.")
 
@@ -62,6 +126,10 @@ class QdrantDatabaseConnector:
             limit=limit,
         )
 
+    def search_batch(self, collection_name: str, requests: list[models.SearchRequest]) -> list[list]:
+        assert self._instance is not None
+        return self._instance.search_batch(collection_name=collection_name, requests=requests)
+
     def scroll(self, collection_name: str, limit: int):
         assert self._instance is not None
         return self._instance.scroll(collection_name=collection_name, limit=limit)
@@ -71,3 +139,55 @@ class QdrantDatabaseConnector:
             self._instance.close()
 
             logger.info("Connected to database has been closed.")
+
+
+class AsyncQdrantDatabaseConnector:
+    """
+    Async counterpart of QdrantDatabaseConnector used on the inference path.
+    The AsyncQdrantClient is shared by every connector in the process so concurrent requests reuse one connection pool.
+    """
+
+    _instance: AsyncQdrantClient | None = None
+
+    def __init__(self) -> None:
+        if AsyncQdrantDatabaseConnector._instance is None:
+            if settings.USE_QDRANT_CLOUD:
+                AsyncQdrantDatabaseConnector._instance = AsyncQdrantClient(
+                    url=settings.QDRANT_CLOUD_URL,
+                    api_key=settings.QDRANT_APIKEY,
+                )
+            else:
+                AsyncQdrantDatabaseConnector._instance = AsyncQdrantClient(
+                    host=settings.QDRANT_DATABASE_HOST,
+                    port=settings.QDRANT_DATABASE_PORT,
+                )
+
+    async def search(
+        self,
+        collection_name: str,
+        query_vector: list,
+        query_filter: models.Filter | None = None,
+        limit: int = 3,
+    ) -> list:
+        assert self._instance is not None
+        return await self._instance.search(
+            collection_name=collection_name,
+            query_vector=query_vector,
+            query_filter=query_filter,
+            limit=limit,
+        )
+
+    async def get_collections(self):
+        assert self._instance is not None
+        return await self._instance.get_collections()
+
+    async def search_batch(self, collection_name: str, requests: list[models.SearchRequest]) -> list[list]:
+        assert self._instance is not None
+        return await self._instance.search_batch(collection_name=collection_name, requests=requests)
+
+    async def close(self):
+        if AsyncQdrantDatabaseConnector._instance:
+            await AsyncQdrantDatabaseConnector._instance.close()
+            AsyncQdrantDatabaseConnector._instance = None
+
+            logger.info("Async connection to database has been closed.")
@@ -0,0 +1,82 @@
+from dataclasses import dataclass, replace
+
+from qdrant_client import models
+
+from ..config import settings
+
+
+@dataclass(frozen=True)
+class CollectionProfile:
+    """
+    Storage and index layout of the vector_* collections, along with the matching search-time parameters.
+
+    With quantization, the compressed vectors stay in RAM for the HNSW search while the original float32 vectors can
+    live on disk: the top limit * oversampling candidates are rescored with the original vectors.
+    """
+
+    name: str
+    quantization: str | None = None  # None, "scalar" (int8) or "binary"
+    vectors_on_disk: bool = False
+    always_ram: bool = True  # Keep the quantized vectors in RAM
+    hnsw_m: int = 16
+    hnsw_ef_construct: int = 100
+    search_hnsw_ef: int | None = None  # None uses the collection's ef_construct
+    rescore: bool = True
+    oversampling: float | None = None
+
+    def vectors_config(self, size: int) -> models.VectorParams:
+        return models.VectorParams(size=size, distance=models.Distance.COSINE, on_disk=self.vectors_on_disk)
+
+    def hnsw_config(self) -> models.HnswConfigDiff:
+        return models.HnswConfigDiff(m=self.hnsw_m, ef_construct=self.hnsw_ef_construct)
+
+    def quantization_config(self) -> models.ScalarQuantization | models.BinaryQuantization | None:
+        if self.quantization == "scalar":
+            return models.ScalarQuantization(
+                scalar=models.ScalarQuantizationConfig(
+                    type=models.ScalarType.INT8, quantile=0.99, always_ram=self.always_ram
+                )
+            )
+        if self.quantization == "binary":
+            return models.BinaryQuantization(binary=models.BinaryQuantizationConfig(always_ram=self.always_ram))
+        if self.quantization is not None:
+            raise ValueError(f"Unsupported quantization: {self.quantization}")
+
+        return None
+
+    def search_params(self) -> models.SearchParams | None:
+        quantization = None
+        if self.quantization is not None:
+            quantization = models.QuantizationSearchParams(rescore=self.rescore, oversampling=self.oversampling)
+
+        if quantization is None and self.search_hnsw_ef is None:
+            return None
+
+        return models.SearchParams(hnsw_ef=self.search_hnsw_ef, quantization=quantization)
+
+
+COLLECTION_PROFILES = {
+    # float32 vectors and HNSW graph in RAM: ~6 KB per 1536-d chunk
+    "default": CollectionProfile(name="default"),
+    # int8 vectors in RAM (4x smaller), originals on disk for rescoring
+    "scalar": CollectionProfile(name="scalar", quantization="scalar", vectors_on_disk=True, oversampling=2.0),
+    # 1 bit per dimension in RAM (32x smaller), needs more oversampling to keep the recall
+    "binary": CollectionProfile(name="binary", quantization="binary", vectors_on_disk=True, oversampling=3.0),
+}
+
+
+def get_collection_profile(name: str | None = None) -> CollectionProfile:
+    """Returns the profile selected by QDRANT_COLLECTION_PROFILE (or name), with the tuning overrides from settings."""
+    name = name or settings.QDRANT_COLLECTION_PROFILE
+    if name not in COLLECTION_PROFILES:
+        raise ValueError(f"Unsupported Qdrant collection profile: {name}")
+
+    overrides = {
+        "hnsw_m": settings.QDRANT_HNSW_M,
+        "hnsw_ef_construct": settings.QDRANT_HNSW_EF_CONSTRUCT,
+        "search_hnsw_ef": settings.QDRANT_SEARCH_HNSW_EF,
+        "vectors_on_disk": settings.QDRANT_VECTORS_ON_DISK,
+        "oversampling": settings.QDRANT_SEARCH_OVERSAMPLING,
+    }
+
+    return replace(COLLECTION_PROFILES[name], **{key: value for key, value in overrides.items() if value is not None})
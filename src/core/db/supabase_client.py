@@ -1,7 +1,11 @@
 # llm-twin-course/src/core/db/supabase_client.py
+import asyncio
+import bisect
 import contextlib
 import logging
-from typing import Any, AsyncGenerator, List, Optional  # Added List and Any
+import os
+import time
+from typing import Any, AsyncGenerator, ClassVar, Dict, List, Optional  # Added List and Any
 
 import asyncpg
 
@@ -10,12 +14,65 @@ from src.core.config import settings
 logger = logging.getLogger(__name__)
 
 
+class PoolMetrics:
+    """
+    In-process metrics of the connection pool: connections in use, a histogram of the time spent waiting
+    for a connection and the number of acquire timeouts.
+    """
+
+    WAIT_BUCKETS_SECONDS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+    def __init__(self) -> None:
+        self.in_use = 0
+        self.acquired = 0
+        self.acquire_timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_histogram = [0] * (len(self.WAIT_BUCKETS_SECONDS) + 1)  # Last bucket is +Inf
+
+    def observe_wait(self, seconds: float) -> None:
+        self.acquired += 1
+        self.wait_seconds_total += seconds
+        self.wait_histogram[bisect.bisect_left(self.WAIT_BUCKETS_SECONDS, seconds)] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        buckets = [str(bound) for bound in self.WAIT_BUCKETS_SECONDS] + ["+Inf"]
+        return {
+            "in_use": self.in_use,
+            "acquired": self.acquired,
+            "acquire_timeouts": self.acquire_timeouts,
+            "wait_seconds_total": self.wait_seconds_total,
+            "wait_seconds_histogram": dict(zip(buckets, self.wait_histogram)),
+        }
+
+
 class SupabaseClient:
     """
     Manages an asyncpg connection pool for interacting with the Supabase database.
+
+    A pool must not be shared across processes. With several uvicorn workers, use SupabaseClient.for_process()
+    so each worker lazily gets its own client and pool; the database then sees up to
+    workers * SUPABASE_POOL_MAX_SIZE connections.
     """
 
-    _pool: Optional[asyncpg.Pool] = None
+    _clients_by_pid: ClassVar[Dict[int, "SupabaseClient"]] = {}
+
+    def __init__(self) -> None:
+        self._pool: Optional[asyncpg.Pool] = None
+        self.metrics = PoolMetrics()
+
+    @classmethod
+    def for_process(cls) -> "SupabaseClient":
+        """
+        Returns the client of the current process, creating it on first use.
+
+        Keyed by pid, so a worker forked after the parent created its client gets a fresh one instead of
+        inheriting the parent's pool.
+        """
+        pid = os.getpid()
+        if pid not in cls._clients_by_pid:
+            cls._clients_by_pid[pid] = cls()
+
+        return cls._clients_by_pid[pid]
 
     async def connect(self) -> None:
         """
@@ -26,8 +83,12 @@ class SupabaseClient:
                 logger.info("Creating Supabase connection pool...")
                 self._pool = await asyncpg.create_pool(
                     dsn=settings.SUPABASE_DB_URL,
-                    min_size=1,  # Minimum number of connections in the pool
-                    max_size=10,  # Maximum number of connections in the pool
+                    min_size=settings.SUPABASE_POOL_MIN_SIZE,  # Minimum number of connections in the pool
+                    max_size=settings.SUPABASE_POOL_MAX_SIZE,  # Maximum number of connections in the pool
+                    max_inactive_connection_lifetime=settings.SUPABASE_POOL_MAX_INACTIVE_CONNECTION_LIFETIME_SECONDS,
+                    command_timeout=settings.SUPABASE_COMMAND_TIMEOUT_SECONDS,  # Default timeout of every operation
+                    statement_cache_size=settings.SUPABASE_STATEMENT_CACHE_SIZE,
+                    server_settings={"statement_timeout": str(settings.SUPABASE_STATEMENT_TIMEOUT_MS)},
                 )
                 logger.info("Supabase connection pool created successfully.")
             except (asyncpg.PostgresError, OSError) as e:
@@ -61,10 +122,22 @@ class SupabaseClient:
 
         connection: Optional[asyncpg.Connection] = None
         try:
-            connection = await self._pool.acquire()
+            started_at = time.perf_counter()
+            try:
+                connection = await self._pool.acquire(timeout=settings.SUPABASE_POOL_ACQUIRE_TIMEOUT_SECONDS)
+            except asyncio.TimeoutError:
+                self.metrics.acquire_timeouts += 1
+                logger.error(
+                    f"Timed out after {settings.SUPABASE_POOL_ACQUIRE_TIMEOUT_SECONDS}s acquiring a Supabase connection. "
+                    f"Pool metrics: {self.metrics.snapshot()}"
+                )
+                raise
+            self.metrics.observe_wait(time.perf_counter() - started_at)
+
             if connection is None:
                 # Should not happen with default acquire settings unless timeout occurs quickly
                 raise asyncpg.PostgresError("Failed to acquire connection from pool (returned None).")
+            self.metrics.in_use += 1
             yield connection
         except asyncpg.PostgresError as e:
             logger.error(f"Error acquiring or using Supabase connection: {e}")
@@ -72,9 +145,36 @@ class SupabaseClient:
         finally:
             if connection:
                 # return connection to pool
+                self.metrics.in_use -= 1
                 await self._pool.release(connection)
                 logger.debug("connection returned to pool")
 
+    async def health_check(self) -> bool:
+        """
+        Checks that a connection can be acquired and answers a trivial query.
+
+        Returns:
+            True if the database answered, False otherwise.
+        """
+        try:
+            async with self.get_connection() as conn:
+                return await conn.fetchval("SELECT 1") == 1
+        except (ConnectionError, asyncpg.PostgresError, OSError, asyncio.TimeoutError) as e:
+            logger.warning(f"Supabase health check failed: {e}")
+            return False
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """
+        Returns the pool metrics, plus the current pool size and idle connections once connected.
+        """
+        stats = self.metrics.snapshot()
+        if self._pool is not None:
+            stats["size"] = self._pool.get_size()
+            stats["idle"] = self._pool.get_idle_size()
+            stats["max_size"] = self._pool.get_max_size()
+
+        return stats
+
     async def execute(self, sql: str, params: Optional[List[Any]] = None) -> str:
         """
         Executes a non-SELECT SQL statement (e.g., INSERT, UPDATE, DELETE).
@@ -95,9 +195,9 @@ class SupabaseClient:
 
         try:
             async with self.get_connection() as conn:
-                logger.debug(f"Executing SQL: {sql} with params: {params}")
+                logger.debug("Executing SQL: %s with params: %s", sql, params)
                 status = await conn.execute(sql, *params if params else [])
-                logger.debug(f"Execution successful, status: {status}")
+                logger.debug("Execution successful, status: %s", status)
                 return status
         except asyncpg.PostgresError as e:
             logger.error(f"Error executing SQL: {sql} with params: {params} - Error: {e}")
@@ -124,9 +224,9 @@ class SupabaseClient:
 
         try:
             async with self.get_connection() as conn:
-                logger.debug(f"Fetching one with SQL: {sql} and params: {params}")
+                logger.debug("Fetching one with SQL: %s and params: %s", sql, params)
                 record = await conn.fetchrow(sql, *params if params else [])
-                logger.debug(f"Fetch one successful, record: {'Found' if record else 'None'}")
+                logger.debug("Fetch one successful, record: %s", "Found" if record else "None")
                 return record
         except asyncpg.PostgresError as e:
             logger.error(f"Error fetching one with SQL: {sql}, params: {params} - Error: {e}")
@@ -152,9 +252,9 @@ class SupabaseClient:
 
         try:
             async with self.get_connection() as conn:
-                logger.debug(f"Fetching all with SQL: {sql} and params: {params}")
+                logger.debug("Fetching all with SQL: %s and params: %s", sql, params)
                 records = await conn.fetch(sql, *params if params else [])
-                logger.debug(f"Fetch all successful, {len(records)} records found.")
+                logger.debug("Fetch all successful, %d records found.", len(records))
                 return records
         except asyncpg.PostgresError as e:
             logger.error(f"Error fetching all with SQL: {sql}, params: {params} - Error: {e}")
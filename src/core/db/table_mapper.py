@@ -0,0 +1,78 @@
+import typing
+
+import asyncpg
+
+from .supabase_client import SupabaseClient
+
+# Columns never overwritten by an upsert
+IMMUTABLE_COLUMNS = ("id", "created_at", "updated_at")
+
+
+class TableMapper:
+    """
+    Maps a document model onto its Postgres table.
+
+    The SQL text is generated once per (operation, column set) and reused, so asyncpg's per-connection statement
+    cache serves every later call from an already prepared statement. Records are mapped back to model fields with
+    a plan computed once per record shape instead of rebuilding the reverse column map for every row.
+    """
+
+    def __init__(self, table_name: str, conflict_target: str, column_map: dict[str, str] | None = None) -> None:
+        self.table_name = table_name
+        self.conflict_target = conflict_target
+        self.column_map = column_map or {}
+
+        self._field_by_column = {column: field for field, column in self.column_map.items()}
+        self._upsert_sql: dict[tuple[str, ...], str] = {}
+        self._select_one_sql: dict[tuple[str, ...], str] = {}
+        self._record_plans: dict[tuple[tuple[str, ...], int], list[tuple[str, str]]] = {}
+
+    def to_db_columns(self, fields: typing.Iterable[str]) -> list[str]:
+        return [self.column_map.get(field, field) for field in fields]
+
+    def upsert_sql(self, fields: tuple[str, ...]) -> str:
+        sql = self._upsert_sql.get(fields)
+        if sql is None:
+            columns = self.to_db_columns(fields)
+            placeholders = ", ".join(f"${i + 1}" for i in range(len(columns)))
+            updates = [col for col in columns if col not in (self.conflict_target, *IMMUTABLE_COLUMNS)]
+            # DO UPDATE always returns the row; with nothing to update, a no-op assignment keeps RETURNING working
+            set_clause = ", ".join(f"{col} = EXCLUDED.{col}" for col in updates or [self.conflict_target])
+
+            sql = (
+                f"INSERT INTO {self.table_name} ({', '.join(columns)}) VALUES ({placeholders}) "
+                f"ON CONFLICT ({self.conflict_target}) DO UPDATE SET {set_clause} RETURNING *;"
+            )
+            self._upsert_sql[fields] = sql
+
+        return sql
+
+    def select_one_sql(self, fields: tuple[str, ...]) -> str:
+        sql = self._select_one_sql.get(fields)
+        if sql is None:
+            conditions = " AND ".join(f"{col} = ${i + 1}" for i, col in enumerate(self.to_db_columns(fields)))
+            sql = f"SELECT * FROM {self.table_name} WHERE {conditions} LIMIT 1;"
+            self._select_one_sql[fields] = sql
+
+        return sql
+
+    def to_model_data(self, record: asyncpg.Record, model_fields: typing.Mapping[str, typing.Any]) -> dict:
+        """Maps a DB record onto the model fields it holds, dropping columns the model does not define."""
+        columns = tuple(record.keys())
+        plan_key = (columns, id(model_fields))
+        plan = self._record_plans.get(plan_key)
+        if plan is None:
+            plan = []
+            for column in columns:
+                field = self._field_by_column.get(column, column)
+                if field in model_fields:
+                    plan.append((column, field))
+            self._record_plans[plan_key] = plan
+
+        return {field: record[column] for column, field in plan}
+
+    async def upsert(self, db_client: SupabaseClient, data: dict) -> asyncpg.Record | None:
+        return await db_client.fetch_one(self.upsert_sql(tuple(data)), list(data.values()))
+
+    async def select_one(self, db_client: SupabaseClient, criteria: dict) -> asyncpg.Record | None:
+        return await db_client.fetch_one(self.select_one_sql(tuple(criteria)), list(criteria.values()))
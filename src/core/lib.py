@@ -20,3 +20,14 @@ def flatten(nested_list: list) -> list:
     """Flatten a list of lists into a single list."""
 
     return [item for sublist in nested_list for item in sublist]
+
+
+def merge_hits_by_max_score(hits: list) -> list:
+    """Deduplicate vector DB hits by point id, keeping the highest score, sorted by descending score."""
+
+    best_hits = {}
+    for hit in hits:
+        if hit.id not in best_hits or hit.score > best_hits[hit.id].score:
+            best_hits[hit.id] = hit
+
+    return sorted(best_hits.values(), key=lambda hit: hit.score, reverse=True)
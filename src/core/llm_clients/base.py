@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Dict, List
 
 
 class LLMClientInterface(ABC):
@@ -17,3 +17,18 @@ class LLMClientInterface(ABC):
             The generated text response from the LLM.
         """
         pass
+
+    async def generate_stream(self, messages: List[Dict[str, str]], **kwargs: Any) -> AsyncIterator[str]:
+        """
+        Streams the text response as it is generated.
+
+        Clients that do not support streaming yield the full response as a single chunk.
+
+        Args:
+            messages: A list of message dictionaries, see `generate`.
+            **kwargs: Additional keyword arguments to pass to the underlying LLM API.
+
+        Yields:
+            Chunks of the generated text response, in order.
+        """
+        yield await self.generate(messages, **kwargs)
@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Dict, List
 
 import openai
 
@@ -50,36 +50,8 @@ class OpenAIClient(LLMClientInterface):
         try:
             logger.debug(f"Calling OpenAI API with model: {settings.OPENAI_MODEL_ID}")
 
-            # Map the input dictionaries to the required OpenAI message types
-            typed_messages: List[ChatCompletionMessageParam] = []
-            for msg in messages:
-                role = msg.get("role")
-                content = msg.get("content")
-                if not role or not content:
-                    logger.warning(f"Skipping message with missing role or content: {msg}")
-                    continue
-
-                if role == "user":
-                    typed_messages.append(ChatCompletionUserMessageParam(role="user", content=content))
-                elif role == "assistant":
-                    typed_messages.append(ChatCompletionAssistantMessageParam(role="assistant", content=content))
-                elif role == "system":
-                    typed_messages.append(ChatCompletionSystemMessageParam(role="system", content=content))
-                # Add other roles like 'tool' if needed later
-                else:
-                    logger.error(f"Invalid role '{role}' encountered in messages.")
-                    raise ValueError(f"Invalid role '{role}' in messages.")
-
-            if not typed_messages:
-                logger.error("No valid messages to send to OpenAI API after filtering.")
-                raise ValueError("No valid messages provided.")
-
-            # Prepare generation parameters, merging defaults with kwargs
-            generation_params = {
-                "temperature": 0.7,
-                "max_tokens": 512,
-                **kwargs,  # Allow overriding defaults
-            }
+            typed_messages = self._to_typed_messages(messages)
+            generation_params = self._generation_params(**kwargs)
 
             response = await self.client.chat.completions.create(
                 model=settings.OPENAI_MODEL_ID,
@@ -112,3 +84,72 @@ class OpenAIClient(LLMClientInterface):
         except Exception as e:
             logger.error(f"An unexpected error occurred during OpenAI API call: {e}", exc_info=True)
             raise Exception(f"An unexpected error occurred: {e}") from e
+
+    async def generate_stream(self, messages: List[Dict[str, str]], **kwargs: Any) -> AsyncIterator[str]:
+        """
+        Streams the response tokens from the OpenAI API as they are generated.
+
+        Args:
+            messages: A list of message dictionaries, see `generate`.
+            **kwargs: Additional keyword arguments to pass to the OpenAI API.
+
+        Yields:
+            The generated text deltas, in order.
+
+        Raises:
+            Exception: If the API call fails.
+            ValueError: If an invalid role is provided in the messages.
+        """
+        try:
+            logger.debug(f"Streaming from OpenAI API with model: {settings.OPENAI_MODEL_ID}")
+
+            stream = await self.client.chat.completions.create(
+                model=settings.OPENAI_MODEL_ID,
+                messages=self._to_typed_messages(messages),
+                stream=True,
+                **self._generation_params(**kwargs),
+            )
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+        except openai.APIError as e:
+            logger.error(f"OpenAI API Error while streaming: {e}", exc_info=True)
+            raise Exception(f"OpenAI API Error: {e}") from e
+        except ValueError:
+            raise
+
+    def _to_typed_messages(self, messages: List[Dict[str, str]]) -> List[ChatCompletionMessageParam]:
+        """Maps the input dictionaries to the required OpenAI message types."""
+        typed_messages: List[ChatCompletionMessageParam] = []
+        for msg in messages:
+            role = msg.get("role")
+            content = msg.get("content")
+            if not role or not content:
+                logger.warning(f"Skipping message with missing role or content: {msg}")
+                continue
+
+            if role == "user":
+                typed_messages.append(ChatCompletionUserMessageParam(role="user", content=content))
+            elif role == "assistant":
+                typed_messages.append(ChatCompletionAssistantMessageParam(role="assistant", content=content))
+            elif role == "system":
+                typed_messages.append(ChatCompletionSystemMessageParam(role="system", content=content))
+            # Add other roles like 'tool' if needed later
+            else:
+                logger.error(f"Invalid role '{role}' encountered in messages.")
+                raise ValueError(f"Invalid role '{role}' in messages.")
+
+        if not typed_messages:
+            logger.error("No valid messages to send to OpenAI API after filtering.")
+            raise ValueError("No valid messages provided.")
+
+        return typed_messages
+
+    def _generation_params(self, **kwargs: Any) -> Dict[str, Any]:
+        """Prepares generation parameters, merging defaults with kwargs."""
+        return {
+            "temperature": 0.7,
+            "max_tokens": 512,
+            **kwargs,  # Allow overriding defaults
+        }
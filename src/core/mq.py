@@ -1,3 +1,4 @@
+import zlib
 from typing import Self
 
 import pika
@@ -10,13 +11,20 @@ logger = get_logger(__file__)
 
 
 class RabbitMQConnection:
-    """Singleton class to manage RabbitMQ connection."""
+    """
+    Class to manage a RabbitMQ connection.
+    By default a process-wide singleton; pass shared=False to get a dedicated connection, e.g. one per consumer,
+    as pika's BlockingConnection must not be shared across threads.
+    """
 
     _instance = None
 
-    def __new__(cls, *args, **kwargs) -> Self:
+    def __new__(cls, *args, shared: bool = True, **kwargs) -> Self:
+        if not shared:
+            return super().__new__(cls)
+
         if not cls._instance:
-            cls._instance = super().__new__(cls, *args, **kwargs)
+            cls._instance = super().__new__(cls)
 
         return cls._instance
 
@@ -28,8 +36,14 @@ class RabbitMQConnection:
         password: str | None = None,
         virtual_host: str = "/",
         fail_silently: bool = False,
+        shared: bool = True,
         **kwargs,
     ) -> None:
+        # The shared instance is initialised once, so later calls don't drop its open connection
+        if getattr(self, "_initialized", False):
+            return
+
+        self._initialized = True
         self.host = host or settings.RABBITMQ_HOST
         self.port = port or settings.RABBITMQ_PORT
         self.username = username or settings.RABBITMQ_DEFAULT_USERNAME
@@ -69,6 +83,12 @@ class RabbitMQConnection:
             assert self._connection is not None  # Added assertion
             return self._connection.channel()
 
+    def process_data_events(self, time_limit: float = 0) -> None:
+        """Dispatches pending deliveries to the consumer callbacks, waiting up to time_limit seconds."""
+        if self.is_connected():
+            assert self._connection is not None
+            self._connection.process_data_events(time_limit=time_limit)
+
     def close(self):
         if self.is_connected():
             assert self._connection is not None  # Added assertion
@@ -77,6 +97,14 @@ class RabbitMQConnection:
             print("Closed RabbitMQ connection")
 
 
+def get_shard_queue_name(queue_name: str, shard_key: str, num_shards: int) -> str:
+    """Returns the queue a message should be routed to. With num_shards <= 1 every message goes to queue_name."""
+    if num_shards <= 1:
+        return queue_name
+
+    return f"{queue_name}.{zlib.crc32(shard_key.encode()) % num_shards}"
+
+
 def publish_to_rabbitmq(queue_name: str, data: str):
     """Publish data to a RabbitMQ queue."""
     try:
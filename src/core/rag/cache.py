@@ -0,0 +1,116 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+import numpy as np
+
+from src.core import logger_utils
+from src.core.config import settings
+
+logger = logger_utils.get_logger(__name__)
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries also expire after ttl_seconds."""
+
+    def __init__(self, max_size: int, ttl_seconds: float) -> None:
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any | None:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._data[key]
+                self.misses += 1
+                return None
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class RetrievalCache:
+    """
+    Two-level cache for the retrieval hot path:
+        - query text -> query embedding
+        - (query vector hash, collection_id, k) -> vector DB hits
+
+    Search results are invalidated per collection_id by bumping a generation counter that is part of the key,
+    so stale entries are never served and simply age out of the LRU. The feature pipeline runs in another process and
+    triggers it through src.core.rag.cache_invalidation, with SEARCH_RESULT_CACHE_TTL_SECONDS as the upper bound.
+    """
+
+    def __init__(
+        self,
+        embedding_cache_size: int,
+        embedding_ttl_seconds: float,
+        search_cache_size: int,
+        search_ttl_seconds: float,
+    ) -> None:
+        self.query_embeddings = TTLCache(max_size=embedding_cache_size, ttl_seconds=embedding_ttl_seconds)
+        self.search_results = TTLCache(max_size=search_cache_size, ttl_seconds=search_ttl_seconds)
+
+        self._generations: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get_query_embedding(self, query: str) -> list[float] | None:
+        return self.query_embeddings.get(query)
+
+    def set_query_embedding(self, query: str, embedding: list[float]) -> None:
+        self.query_embeddings.set(query, embedding)
+
+    def get_search_results(self, query_vector: list[float], collection_id: str, k: int) -> list | None:
+        hits = self.search_results.get(self._search_key(query_vector, collection_id, k))
+
+        return list(hits) if hits is not None else None
+
+    def set_search_results(self, query_vector: list[float], collection_id: str, k: int, hits: list) -> None:
+        self.search_results.set(self._search_key(query_vector, collection_id, k), tuple(hits))
+
+    def invalidate_collection(self, collection_id: str) -> None:
+        with self._lock:
+            self._generations[collection_id] = self._generations.get(collection_id, 0) + 1
+
+        logger.debug("Invalidated cached search results.", collection_id=collection_id)
+
+    def stats(self) -> dict:
+        return {
+            "query_embeddings": {"hits": self.query_embeddings.hits, "misses": self.query_embeddings.misses},
+            "search_results": {"hits": self.search_results.hits, "misses": self.search_results.misses},
+        }
+
+    def _search_key(self, query_vector: list[float], collection_id: str, k: int) -> tuple:
+        vector_hash = hashlib.sha1(np.asarray(query_vector, dtype=np.float32).tobytes()).hexdigest()
+
+        return vector_hash, collection_id, k, self._generations.get(collection_id, 0)
+
+
+retrieval_cache = RetrievalCache(
+    embedding_cache_size=settings.QUERY_EMBEDDING_CACHE_SIZE,
+    embedding_ttl_seconds=settings.QUERY_EMBEDDING_CACHE_TTL_SECONDS,
+    search_cache_size=settings.SEARCH_RESULT_CACHE_SIZE,
+    search_ttl_seconds=settings.SEARCH_RESULT_CACHE_TTL_SECONDS,
+)
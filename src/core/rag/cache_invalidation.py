@@ -0,0 +1,123 @@
+import json
+from typing import Iterable
+
+import aio_pika
+
+from src.core import logger_utils
+from src.core.config import settings
+from src.core.mq import RabbitMQConnection
+from src.core.rag.cache import RetrievalCache, retrieval_cache
+
+logger = logger_utils.get_logger(__name__)
+
+
+class CacheInvalidationPublisher:
+    """
+    Announces the collection_ids the feature pipeline wrote points to on the RETRIEVAL_CACHE_INVALIDATION_EXCHANGE
+    fanout exchange, so the API processes can invalidate their cached search results.
+
+    It runs in a bytewax worker, over a dedicated blocking connection opened on first use. An announcement that
+    cannot be sent is logged and dropped rather than failing the epoch: the results it would have invalidated still
+    expire after SEARCH_RESULT_CACHE_TTL_SECONDS.
+    """
+
+    def __init__(
+        self,
+        connection: RabbitMQConnection | None = None,
+        exchange_name: str = settings.RETRIEVAL_CACHE_INVALIDATION_EXCHANGE,
+    ) -> None:
+        self._connection = connection or RabbitMQConnection(shared=False)
+        self.exchange_name = exchange_name
+        self._channel = None
+
+    def publish(self, collection_ids: Iterable[str]) -> None:
+        body = json.dumps(sorted(set(collection_ids)))
+        if body == "[]":
+            return
+
+        # The broker drops idle blocking connections as their heartbeats are not served, so reconnect once
+        for attempt in range(2):
+            try:
+                self._get_channel().basic_publish(exchange=self.exchange_name, routing_key="", body=body)
+                return
+            except Exception:
+                self._reset()
+                if attempt == 1:
+                    logger.exception("Could not announce the written collections to the retrieval caches.")
+
+    def close(self) -> None:
+        self._reset()
+
+    def _get_channel(self):
+        if self._channel is None or not self._channel.is_open:
+            if not self._connection.is_connected():
+                self._connection.connect()
+            channel = self._connection.get_channel()
+            channel.exchange_declare(exchange=self.exchange_name, exchange_type="fanout", durable=True)
+            self._channel = channel
+
+        return self._channel
+
+    def _reset(self) -> None:
+        self._channel = None
+        try:
+            self._connection.close()
+        except Exception:
+            logger.debug("Could not close the RabbitMQ connection cleanly.", exc_info=True)
+
+
+class CacheInvalidationSubscriber:
+    """
+    Invalidates the retrieval cache of this process for every collection_id announced by CacheInvalidationPublisher.
+
+    Each process binds its own exclusive, auto-deleted queue to the fanout exchange, so every API worker receives
+    every announcement. Announcements sent while the connection is down are lost, so the cached search results are
+    cleared whenever it is restored.
+    """
+
+    def __init__(
+        self,
+        cache: RetrievalCache = retrieval_cache,
+        url: str | None = None,
+        exchange_name: str = settings.RETRIEVAL_CACHE_INVALIDATION_EXCHANGE,
+    ) -> None:
+        self.cache = cache
+        self.url = url or (
+            f"amqp://{settings.RABBITMQ_DEFAULT_USERNAME}:{settings.RABBITMQ_DEFAULT_PASSWORD}"
+            f"@{settings.RABBITMQ_HOST}:{settings.RABBITMQ_PORT}/"
+        )
+        self.exchange_name = exchange_name
+
+        self._connection: aio_pika.abc.AbstractRobustConnection | None = None
+
+    async def start(self) -> None:
+        # connect_robust restores the channel, queue, binding and consumer on its own after broker restarts
+        self._connection = await aio_pika.connect_robust(self.url)
+        self._connection.reconnect_callbacks.add(self._on_reconnect)
+
+        channel = await self._connection.channel()
+        exchange = await channel.declare_exchange(self.exchange_name, aio_pika.ExchangeType.FANOUT, durable=True)
+        queue = await channel.declare_queue(exclusive=True, auto_delete=True)
+        await queue.bind(exchange)
+        await queue.consume(self._on_message, no_ack=True)
+
+        logger.info("Subscribed to retrieval cache invalidations.", exchange_name=self.exchange_name)
+
+    async def close(self) -> None:
+        if self._connection is not None:
+            await self._connection.close()
+            self._connection = None
+
+    async def _on_message(self, message: aio_pika.abc.AbstractIncomingMessage) -> None:
+        try:
+            collection_ids = json.loads(message.body)
+        except ValueError:
+            logger.warning("Skipping a malformed retrieval cache invalidation.", body=message.body[:200])
+            return
+
+        for collection_id in collection_ids:
+            self.cache.invalidate_collection(collection_id)
+
+    def _on_reconnect(self, connection) -> None:
+        logger.warning("Reconnected to RabbitMQ, announcements may have been missed. Clearing cached search results.")
+        self.cache.search_results.clear()
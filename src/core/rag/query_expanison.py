@@ -1,8 +1,9 @@
+from typing import AsyncIterator
+
 import opik
-from langchain_openai import ChatOpenAI
 from opik.integrations.langchain import OpikTracer
 
-from src.core.config import settings
+from src.core.clients import clients
 from src.core.rag.prompt_templates import QueryExpansionTemplate
 
 
@@ -13,18 +14,48 @@ class QueryExpansion:
     @opik.track(name="QueryExpansion.generate_response")
     def generate_response(query: str, to_expand_to_n: int) -> list[str]:
         query_expansion_template = QueryExpansionTemplate()
-        prompt = query_expansion_template.create_template(to_expand_to_n)
-        model = ChatOpenAI(
-            model=settings.OPENAI_MODEL_ID,
-            api_key=settings.OPENAI_API_KEY,
-            temperature=0,
-        )
-        chain = prompt | model
-        chain = chain.with_config({"callbacks": [QueryExpansion.opik_tracer]})
+        chain = QueryExpansion._build_chain(query_expansion_template, to_expand_to_n)
 
         response = chain.invoke({"question": query})
-        response = response.content
 
+        return QueryExpansion._parse_response(response.content, query_expansion_template)
+
+    @staticmethod
+    @opik.track(name="QueryExpansion.agenerate_response")
+    async def agenerate_response(query: str, to_expand_to_n: int) -> list[str]:
+        query_expansion_template = QueryExpansionTemplate()
+        chain = QueryExpansion._build_chain(query_expansion_template, to_expand_to_n)
+
+        response = await chain.ainvoke({"question": query})
+
+        return QueryExpansion._parse_response(response.content, query_expansion_template)
+
+    @staticmethod
+    async def astream_queries(query: str, to_expand_to_n: int) -> AsyncIterator[str]:
+        """Streams the expansion response and yields every generated query as soon as its separator arrives."""
+        query_expansion_template = QueryExpansionTemplate()
+        chain = QueryExpansion._build_chain(query_expansion_template, to_expand_to_n)
+
+        buffer = ""
+        async for chunk in chain.astream({"question": query}):
+            buffer += chunk.content
+            while query_expansion_template.separator in buffer:
+                generated_query, buffer = buffer.split(query_expansion_template.separator, 1)
+                for stripped_query in QueryExpansion._parse_response(generated_query, query_expansion_template):
+                    yield stripped_query
+
+        for stripped_query in QueryExpansion._parse_response(buffer, query_expansion_template):
+            yield stripped_query
+
+    @staticmethod
+    def _build_chain(query_expansion_template: QueryExpansionTemplate, to_expand_to_n: int):
+        prompt = query_expansion_template.create_template(to_expand_to_n)
+        chain = prompt | clients.chat_model(temperature=0)
+
+        return chain.with_config({"callbacks": [QueryExpansion.opik_tracer]})
+
+    @staticmethod
+    def _parse_response(response: str, query_expansion_template: QueryExpansionTemplate) -> list[str]:
         queries = response.strip().split(query_expansion_template.separator)
         stripped_queries = [stripped_item for item in queries if (stripped_item := item.strip(" \\n"))]
 
@@ -1,23 +1,195 @@
-from langchain_openai import ChatOpenAI
+import asyncio
+import threading
+from abc import ABC, abstractmethod
 
+from pydantic import BaseModel
+
+from src.core import logger_utils
+from src.core.clients import clients
 from src.core.config import settings
 from src.core.rag.prompt_templates import RerankingTemplate
 
+logger = logger_utils.get_logger(__name__)
+
+
+class RerankedPassage(BaseModel):
+    id: str | int
+    score: float
+    content: str
+
+
+class RerankerBackend(ABC):
+    @abstractmethod
+    async def rerank(self, query: str, ids: list, passages: list[str], keep_top_k: int) -> list[RerankedPassage]:
+        """
+        Scores the passages against the query and returns the keep_top_k best ones, sorted by descending score.
+
+        Args:
+            query: The user query.
+            ids: The vector DB point ids, aligned with passages.
+            passages: The passages to rerank.
+            keep_top_k: How many passages to keep.
+
+        Returns:
+            The reranked passages with their ids and scores.
+        """
+        pass
+
+
+class CrossEncoderReranker(RerankerBackend):
+    """
+    Scores (query, passage) pairs in batches with a local sentence-transformers cross-encoder.
+
+    The model is loaded once per process in a worker thread, at startup by load_reranker() or on first use. If it
+    cannot be loaded (missing package, failed download), the process reranks with the LLM instead until restarted.
+    """
+
+    _model = None
+    _load_failed = False
+    _lock = threading.Lock()
+
+    def __init__(self, fallback: RerankerBackend | None = None) -> None:
+        self._fallback = fallback or LLMReranker()
+
+    @classmethod
+    def load_model(cls):
+        """Loads the cross-encoder once per process. Blocking, run it off the event loop."""
+        if cls._model is None:
+            with cls._lock:
+                if cls._model is None:
+                    from sentence_transformers import CrossEncoder
+
+                    cls._model = CrossEncoder(settings.RERANKER_MODEL_ID, device=settings.RERANKER_DEVICE)
+
+                    logger.info("Loaded cross-encoder reranker.", model_id=settings.RERANKER_MODEL_ID)
+
+        return cls._model
+
+    @classmethod
+    async def aload_model(cls):
+        """Returns the cross-encoder, loading it in a worker thread, or None if it could not be loaded."""
+        if cls._model is None and not cls._load_failed:
+            try:
+                await asyncio.to_thread(cls.load_model)
+            except Exception:
+                cls._load_failed = True
+                logger.exception(
+                    "Could not load the cross-encoder reranker. Falling back to the LLM reranker.",
+                    model_id=settings.RERANKER_MODEL_ID,
+                )
+
+        return cls._model
+
+    async def rerank(self, query: str, ids: list, passages: list[str], keep_top_k: int) -> list[RerankedPassage]:
+        if not passages:
+            return []
+
+        model = await self.aload_model()
+        if model is None:
+            return await self._fallback.rerank(query=query, ids=ids, passages=passages, keep_top_k=keep_top_k)
+
+        pairs = [(query, passage) for passage in passages]
+        # Scoring is CPU bound, so keep it off the event loop.
+        scores = await asyncio.to_thread(model.predict, pairs, batch_size=settings.RERANKER_BATCH_SIZE)
+
+        reranked = [
+            RerankedPassage(id=point_id, score=float(score), content=passage)
+            for point_id, passage, score in zip(ids, passages, scores)
+        ]
+        reranked.sort(key=lambda passage: passage.score, reverse=True)
+
+        return reranked[:keep_top_k]
+
+
+class LLMReranker(RerankerBackend):
+    """
+    Fallback backend that asks the LLM to reorder the passages.
+    Returned passages are matched back to their ids and scored by their rank, as the LLM does not output scores.
+    Passages it does not return verbatim are kept after the matched ones, in the order they were retrieved.
+    """
+
+    async def rerank(self, query: str, ids: list, passages: list[str], keep_top_k: int) -> list[RerankedPassage]:
+        if not passages:
+            return []
+
+        reranked_passages = await Reranker.agenerate_response(query=query, passages=passages, keep_top_k=keep_top_k)
+
+        ids_by_passage = {passage.strip(): point_id for point_id, passage in zip(ids, passages)}
+        reranked = []
+        for passage in reranked_passages:
+            point_id = ids_by_passage.pop(passage, None)
+            if point_id is None:
+                logger.warning("LLM reranker returned a passage that was not retrieved. Skipping it.")
+                continue
+
+            reranked.append(RerankedPassage(id=point_id, score=1.0 / (len(reranked) + 1), content=passage))
+
+        if len(reranked) < keep_top_k:
+            # Passages the LLM dropped or rewrote follow in their retrieval order, so the context is never emptied
+            if ids_by_passage:
+                logger.warning(
+                    "LLM reranker did not return all passages. Filling up with the vector search order.",
+                    num_matched=len(reranked),
+                )
+            for passage, point_id in ids_by_passage.items():
+                if len(reranked) >= keep_top_k:
+                    break
+                reranked.append(RerankedPassage(id=point_id, score=1.0 / (len(reranked) + 1), content=passage))
+
+        return reranked[:keep_top_k]
+
 
 class Reranker:
     @staticmethod
     def generate_response(query: str, passages: list[str], keep_top_k: int) -> list[str]:
         reranking_template = RerankingTemplate()
+        chain = Reranker._build_chain(reranking_template, keep_top_k)
+
+        response = chain.invoke({"question": query, "passages": Reranker._join_passages(passages, reranking_template)})
+
+        return Reranker._parse_response(response.content, reranking_template)
+
+    @staticmethod
+    async def agenerate_response(query: str, passages: list[str], keep_top_k: int) -> list[str]:
+        reranking_template = RerankingTemplate()
+        chain = Reranker._build_chain(reranking_template, keep_top_k)
+
+        response = await chain.ainvoke(
+            {"question": query, "passages": Reranker._join_passages(passages, reranking_template)}
+        )
+
+        return Reranker._parse_response(response.content, reranking_template)
+
+    @staticmethod
+    def _build_chain(reranking_template: RerankingTemplate, keep_top_k: int):
         prompt = reranking_template.create_template(keep_top_k=keep_top_k)
-        model = ChatOpenAI(model=settings.OPENAI_MODEL_ID, api_key=settings.OPENAI_API_KEY)
-        chain = prompt | model
+        return prompt | clients.chat_model()
 
+    @staticmethod
+    def _join_passages(passages: list[str], reranking_template: RerankingTemplate) -> str:
         stripped_passages = [stripped_item for item in passages if (stripped_item := item.strip())]
-        passages = reranking_template.separator.join(stripped_passages)
-        response = chain.invoke({"question": query, "passages": passages})
-        response = response.content
 
+        return reranking_template.separator.join(stripped_passages)
+
+    @staticmethod
+    def _parse_response(response: str, reranking_template: RerankingTemplate) -> list[str]:
         reranked_passages = response.strip().split(reranking_template.separator)
         stripped_passages = [stripped_item for item in reranked_passages if (stripped_item := item.strip())]
 
         return stripped_passages
+
+
+def get_reranker() -> RerankerBackend:
+    """Return the reranking backend selected by RERANKER_BACKEND. Called per request, it never loads a model."""
+    if settings.RERANKER_BACKEND == "cross_encoder":
+        return CrossEncoderReranker()
+    elif settings.RERANKER_BACKEND == "llm":
+        return LLMReranker()
+
+    raise ValueError(f"Unsupported reranker backend: {settings.RERANKER_BACKEND}")
+
+
+async def load_reranker() -> None:
+    """Loads the model of the selected backend at startup, so the first request does not wait for it."""
+    if settings.RERANKER_BACKEND == "cross_encoder":
+        await CrossEncoderReranker.aload_model()
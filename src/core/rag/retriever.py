@@ -1,93 +1,118 @@
-import concurrent.futures
+import asyncio
+from typing import Awaitable, Callable
 
+import numpy as np
 from qdrant_client import models
 
 import src.core.logger_utils as logger_utils
 from src.core import lib
-from src.core.db.qdrant import QdrantDatabaseConnector
+from src.core.config import settings
+from src.core.clients import clients
+from src.core.db.content_store import CONTENT_REF_FIELD, ContentStore, content_store
+from src.core.db.qdrant import AsyncQdrantDatabaseConnector
+from src.core.db.qdrant_profiles import get_collection_profile
+from src.core.rag.cache import retrieval_cache
 from src.core.rag.query_expanison import QueryExpansion
-from src.core.rag.reranking import Reranker
+from src.core.rag.reranking import RerankedPassage, RerankerBackend, get_reranker
 from src.core.rag.self_query import SelfQuery
-from src.feature_pipeline.utils.embeddings import embedd_text
+from src.feature_pipeline.utils.embeddings import aembedd_texts
 
 logger = logger_utils.get_logger(__name__)
 
+# Only the text is read from the hits: inline for regular points, a reference to it for slim ones
+SEARCH_PAYLOAD_FIELDS = ["content", CONTENT_REF_FIELD]
+
 
 class VectorRetriever:
     """
     Class for retrieving vectors from a Vector store in a RAG system using query expansion and Multitenancy search.
     """
 
-    def __init__(self, query: str) -> None:
-        self._client = QdrantDatabaseConnector()
+    def __init__(
+        self,
+        query: str,
+        client: AsyncQdrantDatabaseConnector | None = None,
+        embedder: Callable[[list[str]], Awaitable[list[np.ndarray]]] | None = None,
+        query_expander: QueryExpansion | None = None,
+        reranker: RerankerBackend | None = None,
+        contents: ContentStore | None = None,
+    ) -> None:
+        """The backends default to the shared production clients; they are injected to run the retriever against stand-ins."""
+        self._client = client or clients.async_qdrant
         self.query = query
-        self._embedder = embedd_text
-        self._query_expander = QueryExpansion()
+        self._embedder = embedder or aembedd_texts
+        self._query_expander = query_expander or QueryExpansion()
         self._metadata_extractor = SelfQuery()
-        self._reranker = Reranker()
+        self._reranker = reranker or get_reranker()
+        self._contents = contents or content_store
 
-    def _search_single_query(self, generated_query: str, author_id: str, k: int, collection_id: str):
+    async def _search_queries(self, generated_queries: list[str], k: int, collection_id: str) -> list:
+        """
+        Embed every generated query in a single embeddings request and search them with a single search_batch call.
+        Returns one list of hits per query.
+        """
         assert k > 3, "k should be greater than 3"
-        logger.info(f"generated query     {generated_query}")
-        query_vector = self._embedder(generated_query).tolist()
-
-        vectors = [
-            # self._client.search(
-            #     collection_name="vector_posts",
-            #     query_filter=models.Filter(
-            #         must=[
-            #             models.FieldCondition(
-            #                 key="author_id",
-            #                 match=models.MatchValue(
-            #                     value=author_id,
-            #                 ),
-            #             )
-            #         ]
-            #         if author_id
-            #         else None
-            #     ),
-            #     query_vector=query_vector,
-            #     limit=k // 3,
-            # ),
-            self._client.search(
+        query_vectors = await self._embed_queries(generated_queries)
+
+        hits_per_query: list[list | None] = [None] * len(query_vectors)
+        if settings.RETRIEVAL_CACHE_ENABLED:
+            for index, query_vector in enumerate(query_vectors):
+                hits_per_query[index] = retrieval_cache.get_search_results(query_vector, collection_id, k)
+
+        missing = [index for index, hits in enumerate(hits_per_query) if hits is None]
+        if missing:
+            query_filter = models.Filter(
+                must=[
+                    models.FieldCondition(
+                        key="collection_id",
+                        match=models.MatchValue(
+                            value=collection_id,
+                        ),
+                    )
+                ]
+            )
+            # ef and quantization rescoring/oversampling of the collection profile
+            search_params = get_collection_profile().search_params()
+            # Other collections (vector_posts, vector_repositories) can be searched by adding their own search_batch call.
+            results = await self._client.search_batch(
                 collection_name="vector_articles",
-                query_filter=models.Filter(
-                    must=[
-                        models.FieldCondition(
-                            key="collection_id",
-                            match=models.MatchValue(
-                                value=collection_id,
-                            ),
-                        )
-                    ]
-                ),
-                query_vector=query_vector,
-                limit=k // 3,
-            ),
-            # self._client.search(
-            #     collection_name="vector_repositories",
-            #     query_filter=models.Filter(
-            #         must=[
-            #             models.FieldCondition(
-            #                 key="owner_id",
-            #                 match=models.MatchValue(
-            #                     value=author_id,
-            #                 ),
-            #             )
-            #         ]
-            #         if author_id
-            #         else None
-            #     ),
-            #     query_vector=query_vector,
-            #     limit=k // 3,
-            # ),
-        ]
+                requests=[
+                    models.SearchRequest(
+                        vector=query_vectors[index],
+                        filter=query_filter,
+                        limit=k // 3,
+                        with_payload=models.PayloadSelectorInclude(include=SEARCH_PAYLOAD_FIELDS),
+                        params=search_params,
+                    )
+                    for index in missing
+                ],
+            )
+            for index, hits in zip(missing, results):
+                hits_per_query[index] = hits
+                if settings.RETRIEVAL_CACHE_ENABLED:
+                    retrieval_cache.set_search_results(query_vectors[index], collection_id, k, hits)
 
-        return lib.flatten(vectors)
+        return hits_per_query
+
+    async def _embed_queries(self, queries: list[str]) -> list[list[float]]:
+        if not settings.RETRIEVAL_CACHE_ENABLED:
+            return [embedding.tolist() for embedding in await self._embedder(queries)]
+
+        query_vectors = [retrieval_cache.get_query_embedding(query) for query in queries]
+        missing = [index for index, query_vector in enumerate(query_vectors) if query_vector is None]
+        if missing:
+            embeddings = await self._embedder([queries[index] for index in missing])
+            for index, embedding in zip(missing, embeddings):
+                query_vectors[index] = embedding.tolist()
+                retrieval_cache.set_query_embedding(queries[index], query_vectors[index])
+
+        return query_vectors
 
     # @opik.track(name="retriever.retrieve_top_k")
     async def retrieve_top_k(self, k: int, to_expand_to_n_queries: int, collection_id: str) -> list:
-        generated_queries = self._query_expander.generate_response(self.query, to_expand_to_n=to_expand_to_n_queries)
+        generated_queries = await self._query_expander.agenerate_response(
+            self.query, to_expand_to_n=to_expand_to_n_queries
+        )
         logger.info(
             "Successfully generated queries for search.",
             num_queries=len(generated_queries),
@@ -105,23 +130,134 @@ class VectorRetriever:
 
         #     logger.warning("Did not found any author data in the user's prompt.")
 
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            search_tasks = [
-                executor.submit(self._search_single_query, query, author_id or "", k, collection_id=collection_id)
-                for query in generated_queries
-            ]
-
-            hits = [task.result() for task in concurrent.futures.as_completed(search_tasks)]
-            hits = lib.flatten(hits)
+        hits = await self._search_queries(generated_queries, k, collection_id=collection_id)
+        hits = lib.merge_hits_by_max_score(lib.flatten(hits))
 
         logger.info("All documents retrieved successfully.", num_documents=len(hits))
 
         return hits
 
+    async def retrieve_top_k_pipelined(
+        self, k: int, to_expand_to_n_queries: int, collection_id: str, min_candidates: int
+    ) -> list:
+        """
+        Overlaps query expansion and retrieval: the original query is searched right away and the expanded queries are
+        searched as they are parsed from the streamed expansion, and the hits are returned once min_candidates unique
+        hits arrived, all searches finished or the retrieval budget elapsed.
+
+        Expanded queries are searched in batches, one embeddings request and one search_batch call each: every query
+        parsed while the previous batch was searched goes in the next one.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.RAG_RETRIEVAL_BUDGET_SECONDS
+        results: asyncio.Queue[list | None] = asyncio.Queue()
+        expanded_queries: asyncio.Queue[str | None] = asyncio.Queue()
+        num_queries = 1
+
+        async def search(queries: list[str]) -> None:
+            try:
+                hits_per_query = await self._search_queries(queries, k, collection_id=collection_id)
+            except Exception:
+                logger.exception("Search failed for generated queries.", num_queries=len(queries))
+                hits_per_query = [[] for _ in queries]
+
+            for hits in hits_per_query:
+                await results.put(hits)
+
+        async def expand() -> None:
+            num_expanded = 0
+            try:
+                async with asyncio.timeout(settings.RAG_EXPANSION_BUDGET_SECONDS):
+                    async for generated_query in self._query_expander.astream_queries(
+                        self.query, to_expand_to_n=to_expand_to_n_queries
+                    ):
+                        num_expanded += 1
+                        expanded_queries.put_nowait(generated_query)
+            except TimeoutError:
+                logger.warning("Query expansion exceeded its budget.", num_queries=num_expanded)
+            except Exception:
+                logger.exception("Query expansion failed. Continuing with the generated queries so far.")
+            finally:
+                expanded_queries.put_nowait(None)
+
+        async def search_expanded() -> None:
+            nonlocal num_queries
+            expansion_done = False
+            while not expansion_done:
+                batch = [await expanded_queries.get()]
+                while not expanded_queries.empty():
+                    batch.append(expanded_queries.get_nowait())
+
+                expansion_done = None in batch
+                batch = [query for query in batch if query is not None]
+                if batch:
+                    num_queries += len(batch)
+                    await search(batch)
+
+            await results.put(None)
+
+        tasks = [
+            asyncio.create_task(search([self.query])),
+            asyncio.create_task(expand()),
+            asyncio.create_task(search_expanded()),
+        ]
+
+        hits: list = []
+        num_results = 0
+        expansion_done = False
+        try:
+            while not (expansion_done and num_results == num_queries):
+                if len({hit.id for hit in hits}) >= min_candidates:
+                    break
+
+                try:
+                    result = await asyncio.wait_for(results.get(), timeout=max(deadline - loop.time(), 0))
+                except TimeoutError:
+                    logger.warning("Retrieval exceeded its budget. Reranking the hits retrieved so far.")
+                    break
+
+                if result is None:
+                    expansion_done = True
+                else:
+                    num_results += 1
+                    hits.extend(result)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        hits = lib.merge_hits_by_max_score(hits)
+
+        logger.info(
+            "Documents retrieved with pipelined search.",
+            num_documents=len(hits),
+            num_queries=num_results,
+        )
+
+        return hits
+
     # @opik.track(name="retriever.rerank")
-    def rerank(self, hits: list, keep_top_k: int) -> list[str]:
-        content_list = [hit.payload["content"] for hit in hits]
-        rerank_hits = self._reranker.generate_response(query=self.query, passages=content_list, keep_top_k=keep_top_k)
+    async def rerank(self, hits: list, keep_top_k: int, timeout: float | None = None) -> list[RerankedPassage]:
+        """
+        Reranks the hits. If timeout elapses first, falls back to the top keep_top_k hits by vector score.
+
+        The texts of slim hits are fetched first, in one batch, as the reranker scores the candidates on their text.
+        """
+        hits = await self._contents.hydrate(hits)
+        try:
+            async with asyncio.timeout(timeout):
+                rerank_hits = await self._reranker.rerank(
+                    query=self.query,
+                    ids=[hit.id for hit in hits],
+                    passages=[hit.payload["content"] for hit in hits],
+                    keep_top_k=keep_top_k,
+                )
+        except TimeoutError:
+            logger.warning("Reranking exceeded its budget. Falling back to the vector search order.")
+
+            return [
+                RerankedPassage(id=hit.id, score=hit.score, content=hit.payload["content"])
+                for hit in lib.merge_hits_by_max_score(hits)[:keep_top_k]
+            ]
 
         logger.info("Documents reranked successfully.", num_documents=len(rerank_hits))
 
@@ -1,10 +1,9 @@
 import opik
-from langchain_openai import ChatOpenAI
 from opik.integrations.langchain import OpikTracer
 
 import src.core.logger_utils as logger_utils
 from src.core import lib
-from src.core.config import settings
+from src.core.clients import clients
 from src.core.db.documents import UserDocument
 from src.core.rag.prompt_templates import SelfQueryTemplate
 
@@ -18,12 +17,7 @@ class SelfQuery:
     @opik.track(name="SelQuery.generate_response")
     async def generate_response(query: str) -> str | None:
         prompt = SelfQueryTemplate().create_template()
-        model = ChatOpenAI(
-            model=settings.OPENAI_MODEL_ID,
-            api_key=settings.OPENAI_API_KEY,
-            temperature=0,
-        )
-        chain = prompt | model
+        chain = prompt | clients.chat_model(temperature=0)
         chain = chain.with_config({"callbacks": [SelfQuery.opik_tracer]})
 
         response = chain.invoke({"question": query})
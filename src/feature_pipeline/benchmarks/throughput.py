@@ -0,0 +1,274 @@
+"""
+Throughput benchmark of the streaming ingestion dataflow.
+
+Runs the real dataflow from data_flow.pipeline against local stand-ins: an in-memory bytewax TestingSource of synthetic
+CDC messages instead of RabbitMQ, an in-memory Qdrant instead of the Qdrant server and a deterministic fake OpenAI
+embeddings client. Reports messages per second, per-step latencies and peak RSS.
+
+Usage (from src/feature_pipeline):
+    python -m benchmarks.throughput --articles 500 --posts 200 --repositories 50 --words 1000
+"""
+
+import argparse
+import json
+import random
+import resource
+import sys
+import threading
+import time
+import uuid
+import zlib
+from collections import defaultdict
+from functools import wraps
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+from bytewax.testing import TestingSource, run_main
+from data_flow.pipeline import build_flow
+from qdrant_client import QdrantClient
+from qdrant_client.http.models import Batch
+
+from src.core.config import settings as core_settings
+from src.core.db.qdrant import QdrantDatabaseConnector
+from src.feature_pipeline.config import settings
+from src.feature_pipeline.utils.embedding_cache import get_embedding_cache
+
+VOCABULARY = (
+    "data pipeline stream vector embedding model retrieval query chunk token latency throughput worker batch "
+    "queue broker consumer producer schema index payload collection search rerank context prompt answer the a of "
+    "to and in is for on with as by at from that this it be are was were will can"
+).split()
+
+
+class StepTimings:
+    """Collects the wall time of every call of each instrumented step."""
+
+    def __init__(self) -> None:
+        self.durations: dict[str, list[float]] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def instrument(self, step_name: str, func):
+        @wraps(func)
+        def timed(*args, **kwargs):
+            started_at = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.record(step_name, time.perf_counter() - started_at)
+
+        return timed
+
+    def record(self, step_name: str, seconds: float) -> None:
+        with self._lock:
+            self.durations[step_name].append(seconds)
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        summary = {}
+        for step_name, durations in self.durations.items():
+            ms = np.array(durations) * 1000
+            summary[step_name] = {
+                "calls": len(durations),
+                "total_s": round(float(ms.sum()) / 1000, 3),
+                "p50_ms": round(float(np.percentile(ms, 50)), 3),
+                "p95_ms": round(float(np.percentile(ms, 95)), 3),
+                "p99_ms": round(float(np.percentile(ms, 99)), 3),
+            }
+
+        return summary
+
+
+class InMemoryQdrantConnector(QdrantDatabaseConnector):
+    """
+    Qdrant connector backed by a local in-memory Qdrant, timing every write as the "sink" step. The local Qdrant is
+    not thread-safe, so the parallel upserts of the vector sink are serialized.
+    """
+
+    def __init__(self, timings: StepTimings) -> None:
+        self._instance = QdrantClient(":memory:")
+        self._timings = timings
+        self._lock = threading.Lock()
+
+    def write_data(self, collection_name: str, points: Batch, wait: bool = True):
+        started_at = time.perf_counter()
+        try:
+            with self._lock:
+                return super().write_data(collection_name=collection_name, points=points, wait=wait)
+        finally:
+            self._timings.record("sink", time.perf_counter() - started_at)
+
+    def count_points(self) -> dict[str, int]:
+        assert self._instance is not None
+        return {
+            collection.name: self._instance.count(collection_name=collection.name).count
+            for collection in self._instance.get_collections().collections
+        }
+
+
+class FakeEmbeddingsClient:
+    """
+    Stands in for the OpenAI client: returns deterministic unit vectors seeded by the text, optionally after a fixed
+    per-request latency to mimic the network round-trip.
+    """
+
+    def __init__(self, dimensions: int, latency_seconds: float = 0.0) -> None:
+        self.dimensions = dimensions
+        self.latency_seconds = latency_seconds
+        self.num_requests = 0
+        self.num_texts = 0
+        self.embeddings = SimpleNamespace(create=self.create)
+
+    def create(self, input: list[str], model: str):
+        self.num_requests += 1
+        self.num_texts += len(input)
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+
+        return SimpleNamespace(data=[SimpleNamespace(index=i, embedding=self.embed(text)) for i, text in enumerate(input)])
+
+    def embed(self, text: str) -> list[float]:
+        vector = np.random.default_rng(zlib.crc32(text.encode("utf-8"))).standard_normal(self.dimensions)
+
+        return (vector / np.linalg.norm(vector)).tolist()
+
+
+def generate_text(rng: random.Random, num_words: int) -> str:
+    sentences = []
+    while num_words > 0:
+        length = min(num_words, rng.randint(8, 20))
+        sentences.append(" ".join(rng.choices(VOCABULARY, k=length)).capitalize() + ".")
+        num_words -= length
+
+    paragraphs = [" ".join(sentences[i : i + 5]) for i in range(0, len(sentences), 5)]
+
+    return "\n\n".join(paragraphs)
+
+
+def generate_messages(num_articles: int, num_posts: int, num_repositories: int, num_words: int, seed: int = 42) -> list[dict]:
+    """Generates synthetic CDC messages in the format of notify_data_change(), interleaved across tables."""
+    rng = random.Random(seed)
+    author_id = str(uuid.UUID(int=rng.getrandbits(128)))
+
+    def new_id() -> str:
+        return str(uuid.UUID(int=rng.getrandbits(128)))
+
+    messages = []
+    for i in range(num_articles):
+        data = {
+            "id": new_id(),
+            "platform": "medium",
+            "url": f"https://medium.com/@benchmark/article-{i}",
+            "content": generate_text(rng, num_words),
+            "author_id": author_id,
+            "collection_id": "benchmark",
+        }
+        messages.append({"table": "articles", "operation": "INSERT", "data": data})
+    for _ in range(num_posts):
+        data = {"id": new_id(), "platform": "linkedin", "content": {"text": generate_text(rng, num_words)}, "author_id": author_id}
+        messages.append({"table": "posts", "operation": "INSERT", "data": data})
+    for i in range(num_repositories):
+        data = {
+            "id": new_id(),
+            "name": f"repository-{i}",
+            "link": f"https://github.com/benchmark/repository-{i}",
+            "content": {"README.md": generate_text(rng, num_words)},
+            "owner_id": author_id,
+        }
+        messages.append({"table": "repositories", "operation": "INSERT", "data": data})
+
+    rng.shuffle(messages)
+
+    return messages
+
+
+def peak_rss_mb() -> float:
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    return max_rss / (1024 * 1024) if sys.platform == "darwin" else max_rss / 1024  # bytes on macOS, KiB on Linux
+
+
+def run_benchmark(
+    num_articles: int,
+    num_posts: int,
+    num_repositories: int,
+    num_words: int,
+    embed_latency_ms: float = 0.0,
+    use_embedding_cache: bool = False,
+) -> dict:
+    messages = generate_messages(num_articles, num_posts, num_repositories, num_words)
+    timings = StepTimings()
+    connection = InMemoryQdrantConnector(timings)
+    embeddings_client = FakeEmbeddingsClient(core_settings.EMBEDDING_SIZE, latency_seconds=embed_latency_ms / 1000)
+
+    flow = build_flow(
+        source=TestingSource(messages, batch_size=settings.RABBITMQ_BATCH_SIZE),
+        connection=connection,
+        instrument=timings.instrument,
+    )
+
+    with (
+        patch("src.feature_pipeline.utils.embeddings.get_openai_client", return_value=embeddings_client),
+        patch.object(settings, "EMBEDDING_CACHE_ENABLED", use_embedding_cache),
+    ):
+        get_embedding_cache.cache_clear()
+        started_at = time.perf_counter()
+        run_main(flow)
+        elapsed = time.perf_counter() - started_at
+    get_embedding_cache.cache_clear()
+
+    return {
+        "messages": len(messages),
+        "words_per_message": num_words,
+        "elapsed_s": round(elapsed, 3),
+        "messages_per_s": round(len(messages) / elapsed, 2),
+        "embedding_requests": embeddings_client.num_requests,
+        "embedded_chunks": embeddings_client.num_texts,
+        "points": connection.count_points(),
+        "steps": timings.summary(),
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+    }
+
+
+def print_report(result: dict) -> None:
+    print(f"Messages:          {result['messages']} ({result['words_per_message']} words each)")
+    print(f"Elapsed:           {result['elapsed_s']} s")
+    print(f"Throughput:        {result['messages_per_s']} messages/s")
+    print(f"Embedded chunks:   {result['embedded_chunks']} in {result['embedding_requests']} request(s)")
+    print(f"Peak RSS:          {result['peak_rss_mb']} MB")
+    print(f"Points:            {result['points']}")
+    print()
+    print(f"{'step':<26}{'calls':>8}{'total s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for step_name, stats in result["steps"].items():
+        print(
+            f"{step_name:<26}{stats['calls']:>8}{stats['total_s']:>10}{stats['p50_ms']:>10}{stats['p95_ms']:>10}{stats['p99_ms']:>10}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the streaming ingestion dataflow with local stand-ins.")
+    parser.add_argument("--articles", type=int, default=500)
+    parser.add_argument("--posts", type=int, default=0)
+    parser.add_argument("--repositories", type=int, default=0)
+    parser.add_argument("--words", type=int, default=800, help="Words per synthetic document.")
+    parser.add_argument("--embed-latency-ms", type=float, default=0.0, help="Simulated latency per embeddings request.")
+    parser.add_argument("--embedding-cache", action="store_true", help="Keep the on-disk embedding cache enabled.")
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON.")
+    args = parser.parse_args()
+
+    result = run_benchmark(
+        num_articles=args.articles,
+        num_posts=args.posts,
+        num_repositories=args.repositories,
+        num_words=args.words,
+        embed_latency_ms=args.embed_latency_ms,
+        use_embedding_cache=args.embedding_cache,
+    )
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print_report(result)
+
+
+if __name__ == "__main__":
+    main()
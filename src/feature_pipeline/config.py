@@ -19,6 +19,31 @@ class Settings(BaseSettings):
     EMBEDDING_SIZE: int = 1536
     # EMBEDDING_MODEL_DEVICE: str = "cpu"
 
+    # Raw message micro-batching: s3:// contents of up to RAW_BATCH_SIZE messages are fetched from MinIO at once
+    RAW_BATCH_SIZE: int = 64
+    RAW_BATCH_TIMEOUT_SECONDS: float = 0.2
+
+    # Embedding micro-batching: chunks are collected up to EMBEDDING_BATCH_SIZE items or
+    # EMBEDDING_BATCH_TIMEOUT_SECONDS, then split so no request exceeds EMBEDDING_BATCH_MAX_TOKENS.
+    EMBEDDING_BATCH_SIZE: int = 256
+    EMBEDDING_BATCH_MAX_TOKENS: int = 250_000
+    EMBEDDING_BATCH_TIMEOUT_SECONDS: float = 1.0
+
+    # Vector sink: embedded chunks are coalesced per collection up to QDRANT_SINK_BATCH_SIZE points or
+    # QDRANT_SINK_BATCH_TIMEOUT_SECONDS, then upserted in chunks of QDRANT_UPSERT_CHUNK_SIZE points,
+    # QDRANT_UPSERT_PARALLELISM at a time without waiting for indexing.
+    QDRANT_SINK_BATCH_SIZE: int = 1024
+    QDRANT_SINK_BATCH_TIMEOUT_SECONDS: float = 1.0
+    QDRANT_UPSERT_CHUNK_SIZE: int = 256
+    QDRANT_UPSERT_PARALLELISM: int = 4
+
+    # Embedding cache keyed by (chunk_id, EMBEDDING_MODEL_ID)
+    EMBEDDING_CACHE_ENABLED: bool = True
+    EMBEDDING_CACHE_PATH: str = f"{ROOT_DIR}/.cache/embeddings.sqlite"
+    EMBEDDING_CACHE_MAX_ENTRIES: int = 1_000_000
+    EMBEDDING_CACHE_LRU_SIZE: int = 10_000
+    EMBEDDING_CACHE_EVICT_INTERVAL: int = 10_000  # Rows written between two size checks of the on-disk store
+
     CHUNK_SIZE_TOKENS: int = 5000
     CHUNK_OVERLAP_TOKENS: int = 200
 
@@ -32,6 +57,14 @@ class Settings(BaseSettings):
     RABBITMQ_HOST: str = "mq"  # or localhost if running outside Docker
     RABBITMQ_PORT: int = 5672
     RABBITMQ_QUEUE_NAME: str = "data_changes_queue"
+    # Consumers: RABBITMQ_NUM_PARTITIONS consumers share RABBITMQ_QUEUE_NAME, unless RABBITMQ_NUM_SHARDS > 1,
+    # in which case there is one consumer per "<queue>.<shard>" queue (must match the CDC publisher).
+    RABBITMQ_NUM_PARTITIONS: int = 4
+    RABBITMQ_NUM_SHARDS: int = 1
+    # Messages are acked one epoch late, so the prefetch window must hold about two epochs of messages
+    RABBITMQ_PREFETCH_COUNT: int = 500
+    RABBITMQ_BATCH_SIZE: int = 100
+    RABBITMQ_POLL_TIMEOUT_SECONDS: float = 0.1
 
     # QdrantDB config
     QDRANT_DATABASE_HOST: str = "qdrant"  # or localhost if running outside Docker
@@ -0,0 +1,87 @@
+from datetime import timedelta
+from typing import Callable, TypeVar
+
+import bytewax.operators as op
+from bytewax.dataflow import Dataflow
+from bytewax.inputs import Source
+from data_flow.stream_output import QdrantOutput, get_vector_collection
+from data_logic.dispatchers import (
+    ChunkingDispatcher,
+    CleaningDispatcher,
+    EmbeddingDispatcher,
+    RawDispatcher,
+)
+
+from src.core.db.qdrant import QdrantDatabaseConnector
+from src.feature_pipeline.config import settings
+
+F = TypeVar("F", bound=Callable)
+
+
+def _no_instrumentation(step_name: str, func: F) -> F:
+    return func
+
+
+def build_flow(
+    source: Source,
+    connection: QdrantDatabaseConnector,
+    instrument: Callable[[str, F], F] = _no_instrumentation,
+) -> Dataflow:
+    """
+    Builds the streaming ingestion dataflow from a source of CDC messages to Qdrant.
+
+    instrument wraps the function of every processing step, keyed by step name, e.g. to time it in benchmarks.
+    """
+    # bytewax creates a continuous data pipeline stream between rabbit mq and app functionality
+    # input creates a source node to read data from queue
+    # raw messages are micro-batched so their s3:// contents are fetched from MinIO concurrently
+    # map creates a one to one map for each message in the queue
+    # flatmap transforms one messes to many
+    # key_on + batch group chunks per data type into micro-batches so each embeddings request carries many chunks
+    # embedded chunks are coalesced again per target collection so the sink upserts large batches
+    # sends data to final destination
+    flow = Dataflow("Streaming ingestion pipeline")
+    stream = op.input("input", flow, source)
+    stream = op.key_on("key messages by table", stream, lambda message: str(message.get("table")))
+    stream = op.batch(
+        "batch messages",
+        stream,
+        timeout=timedelta(seconds=settings.RAW_BATCH_TIMEOUT_SECONDS),
+        batch_size=settings.RAW_BATCH_SIZE,
+    )
+    # convert raw messages to data models
+    stream = op.flat_map("raw dispatch", stream, instrument("raw dispatch", RawDispatcher.handle_mq_messages))
+    stream = op.map("clean dispatch", stream, instrument("clean dispatch", CleaningDispatcher.dispatch_cleaner))  # clean data
+    op.output(
+        "cleaned data insert to qdrant",
+        stream,
+        QdrantOutput(connection=connection, sink_type="clean"),  # insert clean data to qdrant
+    )
+    # create chunks from clean data
+    stream = op.flat_map("chunk dispatch", stream, instrument("chunk dispatch", ChunkingDispatcher.dispatch_chunker))
+    stream = op.key_on("key chunks by type", stream, lambda chunk: chunk.type)
+    stream = op.batch(
+        "batch chunks",
+        stream,
+        timeout=timedelta(seconds=settings.EMBEDDING_BATCH_TIMEOUT_SECONDS),
+        batch_size=settings.EMBEDDING_BATCH_SIZE,
+    )
+    stream = op.flat_map(
+        "embedded chunk dispatch",
+        stream,
+        instrument("embedded chunk dispatch", EmbeddingDispatcher.dispatch_batch_embedder),
+    )
+    stream = op.key_on("key embedded chunks by collection", stream, lambda chunk: get_vector_collection(chunk.type))
+    stream = op.batch(
+        "coalesce embedded chunks",
+        stream,
+        timeout=timedelta(seconds=settings.QDRANT_SINK_BATCH_TIMEOUT_SECONDS),
+        batch_size=settings.QDRANT_SINK_BATCH_SIZE,
+    )
+    op.output(
+        "embedded data insert to qdrant",
+        stream,
+        QdrantOutput(connection=connection, sink_type="vector"),
+    )  # store embeddings in vector db
+
+    return flow
@@ -1,5 +1,7 @@
+import hashlib
 import json
 import time
+from collections import deque
 from datetime import datetime
 from typing import Generic, Iterable, List, Optional, TypeVar
 
@@ -15,47 +17,106 @@ DataT = TypeVar("DataT")
 MessageT = TypeVar("MessageT")
 
 
+def get_idempotency_key(message: dict) -> str:
+    """
+    Key identifying a CDC event independently of its delivery tag, so redeliveries can be recognised
+    across channel reconnects and restarts.
+    """
+    data = message.get("data") or {}
+    row_id = data.get("id")
+    if row_id is None:
+        return hashlib.sha1(json.dumps(message, sort_keys=True).encode()).hexdigest()
+
+    return f"{message.get('table')}:{message.get('operation')}:{row_id}:{data.get('updated_at', '')}"
+
+
 class RabbitMQPartition(StatefulSourcePartition, Generic[DataT, MessageT]):
     """
     Class responsible for creating a connection between bytewax and rabbitmq that facilitates the transfer
     of data from mq to bytewax streaming piepline.
-    Inherits StatefulSourcePartition for snapshot functionality that enables saving the state of the queue
+    Each partition owns its connection and consumes with basic_consume, so the broker pushes up to
+    prefetch_count unacked messages ahead of next_batch.
+
+    Messages are acked one epoch late: deliveries emitted during epoch N are acked when epoch N + 1 is snapshotted,
+    once epoch N has been processed by the whole dataflow. A crash before that makes the broker redeliver them.
+    The snapshot holds the idempotency keys of the emitted but unacked messages, so their redeliveries
+    (after a reconnect or a restart) are not emitted twice.
     """
 
-    def __init__(self, queue_name: str, resume_state: MessageT | None = None) -> None:
-        self._in_flight_msg_ids = resume_state or set()
+    def __init__(
+        self,
+        queue_name: str,
+        prefetch_count: int,
+        batch_size: int,
+        resume_state: MessageT | None = None,
+    ) -> None:
         self.queue_name = queue_name
-        self.connection = RabbitMQConnection()
+        self.prefetch_count = prefetch_count
+        self.batch_size = batch_size
+        self._buffer: deque[tuple[int, bytes]] = deque()
+
+        # Emitted but not yet acked messages, tracked for the current and the previous epoch
+        self._unacked_keys: set[str] = set(resume_state or ())
+        self._epoch_keys: set[str] = set(self._unacked_keys)
+        self._epoch_delivery_tag: int | None = None
+        self._ack_ready_keys: set[str] = set()
+        self._ack_ready_delivery_tag: int | None = None
+
+        self.connection = RabbitMQConnection(shared=False)
+        self._start_consuming()
+
+    def _start_consuming(self) -> None:
         self.connection.connect()
         self.channel = self.connection.get_channel()
+        # Delivery tags of a previous channel can't be acked anymore; the broker redelivers those messages
+        # and they are deduplicated by their idempotency key.
+        self._buffer.clear()
+        self._epoch_delivery_tag = None
+        self._ack_ready_delivery_tag = None
+
+        self.channel.queue_declare(queue=self.queue_name, durable=True)
+        self.channel.basic_qos(prefetch_count=self.prefetch_count)
+        self.channel.basic_consume(queue=self.queue_name, on_message_callback=self._on_message, auto_ack=False)
+
+    def _on_message(self, channel, method, properties, body: bytes) -> None:
+        self._buffer.append((method.delivery_tag, body))
 
     def next_batch(self, sched: Optional[datetime]) -> Iterable[DataT]:
         try:
             # Check if connection is closed and reopen if needed
             if not self.connection.is_connected():
-                logger.info("RabbitMQ connection closed, attempting to reconnect...")
-                self.connection.connect()
-                self.channel = self.connection.get_channel()
-                logger.info("Successfully reconnected to RabbitMQ")
-
-            # Get message from queue
-            method_frame, header_frame, body = self.channel.basic_get(queue=self.queue_name, auto_ack=True)
-
-            if method_frame:
-                # Process valid message
-                message_id = method_frame.delivery_tag
-                self._in_flight_msg_ids.add(message_id)
-
-                # Parse and return the message body
-                return [json.loads(body)]
-            else:
-                # No message available - normal condition, not an error
-                return []
-
-        except json.JSONDecodeError as je:
-            logger.error(f"Error decoding message as JSON: {str(je)}", queue_name=self.queue_name)
-            # Consider adding dead-letter handling for invalid messages
-            return []
+                logger.info("RabbitMQ connection closed, attempting to reconnect...", queue_name=self.queue_name)
+                self._start_consuming()
+                logger.info("Successfully reconnected to RabbitMQ", queue_name=self.queue_name)
+
+            # Only wait for deliveries when nothing is buffered yet
+            self.connection.process_data_events(
+                time_limit=0 if self._buffer else settings.RABBITMQ_POLL_TIMEOUT_SECONDS
+            )
+
+            batch = []
+            while self._buffer and len(batch) < self.batch_size:
+                delivery_tag, body = self._buffer.popleft()
+                # Every delivery is acked with its epoch, including duplicates and invalid messages
+                self._epoch_delivery_tag = delivery_tag
+                try:
+                    message = json.loads(body)
+                except json.JSONDecodeError as je:
+                    logger.error(f"Error decoding message as JSON: {str(je)}", queue_name=self.queue_name)
+                    # Consider adding dead-letter handling for invalid messages
+                    continue
+
+                idempotency_key = get_idempotency_key(message)
+                if idempotency_key in self._unacked_keys:
+                    logger.debug("Skipping redelivered message.", idempotency_key=idempotency_key)
+                    continue
+
+                self._unacked_keys.add(idempotency_key)
+                self._epoch_keys.add(idempotency_key)
+                batch.append(message)
+
+            return batch
+
         except Exception as e:
             logger.error(f"Error while fetching message from queue: {str(e)}", queue_name=self.queue_name)
 
@@ -65,11 +126,7 @@ class RabbitMQPartition(StatefulSourcePartition, Generic[DataT, MessageT]):
             try:
                 # Attempt to re-establish connection
                 logger.info("Attempting to reconnect to RabbitMQ...")
-                self.connection.connect()
-                self.channel = self.connection.get_channel()
-
-                # Verify queue exists
-                self.channel.queue_declare(queue=self.queue_name, passive=True)
+                self._start_consuming()
                 logger.info(f"Successfully reconnected to queue {self.queue_name}")
             except Exception as conn_err:
                 logger.error(f"Failed to reconnect to RabbitMQ: {str(conn_err)}")
@@ -77,21 +134,42 @@ class RabbitMQPartition(StatefulSourcePartition, Generic[DataT, MessageT]):
         return []
 
     def snapshot(self) -> MessageT:
-        return self._in_flight_msg_ids
+        """Called by bytewax at the end of every epoch: acks the previous epoch and rotates the current one."""
+        if self._ack_ready_delivery_tag is not None:
+            try:
+                # Deliveries on a channel are acked in order, so one ack covers the whole epoch
+                self.channel.basic_ack(delivery_tag=self._ack_ready_delivery_tag, multiple=True)
+            except Exception as e:
+                logger.error(f"Failed to ack messages, they will be redelivered: {str(e)}", queue_name=self.queue_name)
+
+        self._unacked_keys -= self._ack_ready_keys
+        self._ack_ready_keys, self._ack_ready_delivery_tag = self._epoch_keys, self._epoch_delivery_tag
+        self._epoch_keys, self._epoch_delivery_tag = set(), None
 
-    def garbage_collect(self, state):
-        closed_in_flight_msg_ids = state
-        for msg_id in closed_in_flight_msg_ids:
-            self.channel.basic_ack(delivery_tag=msg_id)
-            self._in_flight_msg_ids.remove(msg_id)
+        return set(self._unacked_keys)
 
     def close(self):
-        self.channel.close()
+        self.connection.close()
 
 
 class RabbitMQSource(FixedPartitionedSource):
+    """
+    Reads from RABBITMQ_NUM_PARTITIONS consumers on the shared queue, or from one consumer per shard queue
+    when RABBITMQ_NUM_SHARDS > 1. bytewax spreads the partitions over the workers.
+    """
+
     def list_parts(self) -> List[str]:
-        return ["single partition"]
+        if settings.RABBITMQ_NUM_SHARDS > 1:
+            return [f"{settings.RABBITMQ_QUEUE_NAME}.{shard}" for shard in range(settings.RABBITMQ_NUM_SHARDS)]
+
+        return [f"{settings.RABBITMQ_QUEUE_NAME}#{partition}" for partition in range(settings.RABBITMQ_NUM_PARTITIONS)]
 
     def build_part(self, now: datetime, for_part: str, resume_state: MessageT | None = None) -> StatefulSourcePartition[DataT, MessageT]:
-        return RabbitMQPartition(queue_name=settings.RABBITMQ_QUEUE_NAME)
+        queue_name = for_part if settings.RABBITMQ_NUM_SHARDS > 1 else settings.RABBITMQ_QUEUE_NAME
+
+        return RabbitMQPartition(
+            queue_name=queue_name,
+            prefetch_count=settings.RABBITMQ_PREFETCH_COUNT,
+            batch_size=settings.RABBITMQ_BATCH_SIZE,
+            resume_state=resume_state,
+        )
@@ -1,9 +1,16 @@
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
 from bytewax.outputs import DynamicSink, StatelessSinkPartition
 from models.base import VectorDBDataModel
-from qdrant_client.models import Batch
+from qdrant_client.models import Batch, UpdateStatus
 
 from src.core import get_logger
+from src.core.config import settings as core_settings
+from src.core.db.content_store import ContentStore, content_store
 from src.core.db.qdrant import QdrantDatabaseConnector
+from src.core.rag.cache_invalidation import CacheInvalidationPublisher
+from src.feature_pipeline.config import settings
 
 logger = get_logger(__name__)
 
@@ -40,6 +47,9 @@ class QdrantOutput(DynamicSink):
                     self._connection.create_vector_collection(collection_name=collection_name)
                 else:
                     self._connection.create_non_vector_collection(collection_name=collection_name)
+            else:
+                # Collections created before payload indexing get their missing indexes
+                self._connection.ensure_payload_indexes(collection_name=collection_name)
 
     def build(self, worker_index: int, worker_count: int) -> StatelessSinkPartition:
         if self._sink_type == "clean":
@@ -51,43 +61,104 @@ class QdrantOutput(DynamicSink):
 
 
 class QdrantCleanedDataSink(StatelessSinkPartition):
-    def __init__(self, connection: QdrantDatabaseConnector):
+    """Writes the cleaned documents. With QDRANT_SLIM_PAYLOADS, their cleaned_content is stored in the content store."""
+
+    def __init__(self, connection: QdrantDatabaseConnector, contents: ContentStore | None = None):
         self._client = connection
+        self._contents = contents or content_store
 
     def write_batch(self, items: list[VectorDBDataModel]) -> None:
-        payloads = [item.to_payload() for item in items]
-        ids, data = zip(*payloads)
-        collection_name = get_clean_collection(data_type=data[0]["type"])
-        self._client.write_data(
-            collection_name=collection_name,
-            points=Batch(ids=ids, vectors={}, payloads=data),
-        )
-
-        logger.info(
-            "Successfully inserted requested cleaned point(s)",
-            collection_name=collection_name,
-            num=len(ids),
-        )
+        # A batch can mix data types, each is written to its own collection
+        by_collection: dict[str, list[VectorDBDataModel]] = defaultdict(list)
+        for item in items:
+            by_collection[get_clean_collection(data_type=item.type)].append(item)
+
+        for collection_name, collection_items in by_collection.items():
+            ids, data = zip(*(item.to_payload() for item in collection_items))
+            if core_settings.QDRANT_SLIM_PAYLOADS:
+                data = self._contents.offload(list(data), field="cleaned_content")
+            self._client.write_data(
+                collection_name=collection_name,
+                points=Batch(ids=ids, vectors={}, payloads=data),
+            )
+
+            logger.info(
+                "Successfully inserted requested cleaned point(s)",
+                collection_name=collection_name,
+                num=len(ids),
+            )
 
 
 class QdrantVectorDataSink(StatelessSinkPartition):
-    def __init__(self, connection: QdrantDatabaseConnector):
-        self._client = connection
+    """
+    Writes the embedded chunks, received as (collection name, chunks) batches coalesced upstream.
 
-    def write_batch(self, items: list[VectorDBDataModel]) -> None:
-        payloads = [item.to_payload() for item in items]
-        ids, vectors, meta_data = zip(*payloads)
-        collection_name = get_vector_collection(data_type=meta_data[0]["type"])
-        self._client.write_data(
-            collection_name=collection_name,
-            points=Batch(ids=ids, vectors=vectors, payloads=meta_data),
-        )
-
-        logger.info(
-            "Successfully inserted requested vector point(s)",
-            collection_name=collection_name,
-            num=len(ids),
-        )
+    The points of each collection are upserted in chunks, in parallel and without waiting for Qdrant to apply and
+    index them. write_batch returns once Qdrant acknowledged every operation, i.e. persisted it to its write-ahead
+    log, so the messages of the epoch are only acked to RabbitMQ after their points are durable.
+
+    With QDRANT_SLIM_PAYLOADS, the chunk texts are uploaded to the content store before their points reference them.
+    The written collection_ids are then announced to the retrieval caches of the API processes.
+    """
+
+    def __init__(
+        self,
+        connection: QdrantDatabaseConnector,
+        contents: ContentStore | None = None,
+        invalidations: CacheInvalidationPublisher | None = None,
+    ):
+        self._client = connection
+        self._contents = contents or content_store
+        self._invalidations = invalidations or CacheInvalidationPublisher()
+        self._executor = ThreadPoolExecutor(max_workers=settings.QDRANT_UPSERT_PARALLELISM, thread_name_prefix="qdrant-sink")
+
+    def write_batch(self, items: list[tuple[str, list[VectorDBDataModel]]]) -> None:
+        by_collection: dict[str, list[VectorDBDataModel]] = defaultdict(list)
+        for collection_name, chunks in items:
+            by_collection[collection_name].extend(chunks)
+
+        uploads = []
+        collection_ids = set()
+        for collection_name, chunks in by_collection.items():
+            payloads = [chunk.to_payload() for chunk in chunks]
+            collection_ids.update(meta_data["collection_id"] for _, _, meta_data in payloads if "collection_id" in meta_data)
+            if core_settings.QDRANT_SLIM_PAYLOADS:
+                ids, vectors, meta_data = zip(*payloads)
+                payloads = list(zip(ids, vectors, self._contents.offload(list(meta_data), field="content")))
+
+            for start in range(0, len(payloads), settings.QDRANT_UPSERT_CHUNK_SIZE):
+                ids, vectors, meta_data = zip(*payloads[start : start + settings.QDRANT_UPSERT_CHUNK_SIZE])
+                upload = self._executor.submit(
+                    self._client.write_data,
+                    collection_name=collection_name,
+                    points=Batch(ids=ids, vectors=vectors, payloads=meta_data),
+                    wait=False,
+                )
+                uploads.append((collection_name, len(ids), upload))
+
+        # Confirm every operation before the epoch closes, re-raising the first failure
+        operation_ids = []
+        for collection_name, num, upload in uploads:
+            result = upload.result()
+            if result.status not in (UpdateStatus.ACKNOWLEDGED, UpdateStatus.COMPLETED):
+                raise RuntimeError(f"Qdrant did not acknowledge the upsert of {num} point(s) to {collection_name}: {result}")
+            operation_ids.append(result.operation_id)
+
+        # Qdrant applies acknowledged operations within milliseconds, a search racing it is cached for at most the TTL
+        if core_settings.RETRIEVAL_CACHE_ENABLED:
+            self._invalidations.publish(collection_ids)
+
+        for collection_name, chunks in by_collection.items():
+            logger.info(
+                "Successfully inserted requested vector point(s)",
+                collection_name=collection_name,
+                num=len(chunks),
+            )
+        logger.debug("Confirmed Qdrant operations.", operation_ids=operation_ids)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+        self._invalidations.close()
 
 
 def get_clean_collection(data_type: str) -> str:
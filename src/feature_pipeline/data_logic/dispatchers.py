@@ -20,7 +20,8 @@ from data_logic.embedding_data_handlers import (
     # RepositoryEmbeddingHandler,
 )
 from src.core import get_logger
-from src.core.db.minio_client import MinioClient
+from src.core.clients import clients
+from src.feature_pipeline.utils.embedding_cache import get_embedding_cache
 
 logger = get_logger(__name__)
 
@@ -39,7 +40,7 @@ class RawDispatcher:
         if content and isinstance(content, str) and content.startswith("s3://"):
             try:
                 object_id = content.replace("s3://", "")
-                minio_client = MinioClient()
+                minio_client = clients.minio
                 bucket_name = "documents"  # or get from config/settings
                 retrieved_content = minio_client.retrieve_document(object_id, bucket_name)
 
@@ -54,6 +55,52 @@ class RawDispatcher:
                 logger.error(f"Error retrieving content from S3: {e}")
                 # Decide how to handle the error - you might want to re-raise or continue
 
+        return RawDispatcher._to_model(message)
+
+    @staticmethod
+    def handle_mq_messages(keyed_batch: tuple[str, list[dict]]) -> list[DataModel]:
+        """
+        Convert a micro-batch of CDC messages to data models, prefetching all their s3:// contents at once.
+        Invalid messages are logged and dropped so they don't fail the rest of the batch.
+        """
+        _, messages = keyed_batch
+
+        pointers: dict[str, list[dict]] = {}
+        for message in messages:
+            data = message.get("data")
+            content = data.get("content") if isinstance(data, dict) else None
+            if content and isinstance(content, str) and content.startswith("s3://"):
+                pointers.setdefault(content.replace("s3://", ""), []).append(data)
+
+        if pointers:
+            try:
+                contents = clients.minio.retrieve_documents(list(pointers), bucket_name="documents")
+            except Exception as e:
+                logger.error(f"Error retrieving content from S3: {e}")
+                contents = {}
+
+            for object_id, rows in pointers.items():
+                if contents.get(object_id) is None:
+                    logger.error(f"Failed to retrieve content from S3 for object_id: {object_id}")
+                    continue
+                for data in rows:
+                    data["content"] = contents[object_id]
+            logger.debug("Prefetched contents from S3.", num_objects=len(pointers))
+
+        data_models = []
+        for message in messages:
+            try:
+                data_models.append(RawDispatcher._to_model(message))
+            except Exception as e:
+                logger.error(f"Failed to convert CDC message: {e}", table=message.get("table"))
+
+        return data_models
+
+    @staticmethod
+    def _to_model(message: dict) -> DataModel:
+        table = message.get("table")
+        operation = message.get("operation")
+        data = message.get("data")
         if not table or not operation or data is None:
             logger.error("Invalid CDC message format received.", message=message)
             raise ValueError("Invalid CDC message format: missing 'table', 'operation', or 'data'")
@@ -164,3 +211,48 @@ class EmbeddingDispatcher:
         )
 
         return embedded_chunk_model
+
+    @classmethod
+    def dispatch_batch_embedder(cls, keyed_batch: tuple[str, list[DataModel]]) -> list[DataModel]:
+        """
+        Embed a micro-batch of chunks collected by the dataflow. Batches are keyed by data type.
+        Chunks already present in the embedding cache are not sent to the embeddings API.
+        """
+        data_type, data_models = keyed_batch
+        try:
+            handler = cls.embedding_factory.create_handler(data_type)
+        except ValueError:
+            # Not every data type is embedded yet, don't let its chunks stop the dataflow
+            logger.warning("No embedding handler for data type, skipping chunks.", data_type=data_type, num=len(data_models))
+            return []
+        cache = get_embedding_cache()
+
+        embeddings = cache.get_many([data_model.chunk_id for data_model in data_models]) if cache else {}  # type: ignore[attr-defined]
+        # Identical chunks in the same batch share a chunk_id, embed each one only once
+        to_embedd = list({m.chunk_id: m for m in data_models if m.chunk_id not in embeddings}.values())  # type: ignore[attr-defined]
+
+        if to_embedd:
+            try:
+                embedded_chunk_models = handler.embedd_batch(to_embedd)
+            except Exception:
+                logger.exception(
+                    "Failed embedding chunk batch.",
+                    data_type=data_type,
+                    chunk_ids=[data_model.chunk_id for data_model in to_embedd],  # type: ignore[attr-defined]
+                )
+                raise
+
+            new_embeddings = {m.chunk_id: m.embedded_content for m in embedded_chunk_models}  # type: ignore[attr-defined]
+            embeddings.update(new_embeddings)
+            if cache:
+                cache.put_many(new_embeddings)
+
+        logger.info(
+            "Chunk batch embedded successfully.",
+            data_type=data_type,
+            num=len(data_models),
+            num_embedded=len(to_embedd),
+            cache=cache.stats() if cache else None,
+        )
+
+        return [handler.from_embedding(data_model, embeddings[data_model.chunk_id]) for data_model in data_models]  # type: ignore[attr-defined]
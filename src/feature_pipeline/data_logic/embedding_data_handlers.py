@@ -1,5 +1,4 @@
 from abc import ABC, abstractmethod
-from typing import List
 
 import numpy as np
 from models.base import DataModel
@@ -7,11 +6,9 @@ from models.chunk import ArticleChunkModel
 from models.embedded_chunk import (
     ArticleEmbeddedChunkModel,
 )
-from openai import OpenAI
 
 from src.core import get_logger
-from src.feature_pipeline.config import settings
-from src.feature_pipeline.utils.embeddings import embedd_text
+from src.feature_pipeline.utils.embeddings import embedd_texts
 
 logger = get_logger(__name__)
 
@@ -22,8 +19,17 @@ class EmbeddingDataHandler(ABC):
     All data transformations logic for the embedding step is done here
     """
 
-    @abstractmethod
     def embedd(self, data_model: DataModel) -> DataModel:
+        return self.embedd_batch([data_model])[0]
+
+    def embedd_batch(self, data_models: list[DataModel]) -> list[DataModel]:
+        """Embed a micro-batch of chunks with as few API round-trips as possible."""
+        embeddings = embedd_texts([data_model.chunk_content for data_model in data_models])  # type: ignore[attr-defined]
+
+        return [self.from_embedding(data_model, embedding) for data_model, embedding in zip(data_models, embeddings)]
+
+    @abstractmethod
+    def from_embedding(self, data_model: DataModel, embedding: np.ndarray) -> DataModel:
         pass
 
 
@@ -41,29 +47,14 @@ class EmbeddingDataHandler(ABC):
 
 
 class ArticleEmbeddingHandler(EmbeddingDataHandler):
-    def embedd(self, data_model: ArticleChunkModel) -> ArticleEmbeddedChunkModel:
-        try:
-            client = OpenAI(api_key=settings.OPENAI_API_KEY)
-            response = client.embeddings.create(
-                input=data_model.chunk_content,
-                model=settings.EMBEDDING_MODEL_ID,
-            )
-            # Extract the list of floats
-            embedding_list: List[float] = response.data[0].embedding
-            # Convert to NumPy array
-            embedding_array: np.ndarray = embedd_text(data_model.chunk_content)
-
-        except Exception as e:
-            logger.error(f"Failed embedding article chunk {data_model.chunk_id}: {e}", exc_info=True)
-            raise
-        logger.info(f"Article embedding handle embedding array {embedding_array}")
+    def from_embedding(self, data_model: ArticleChunkModel, embedding: np.ndarray) -> ArticleEmbeddedChunkModel:
         return ArticleEmbeddedChunkModel(
             entry_id=data_model.entry_id,
             platform=data_model.platform,
             link=data_model.link,
             chunk_content=data_model.chunk_content,
             chunk_id=data_model.chunk_id,
-            embedded_content=embedding_array,
+            embedded_content=embedding,
             author_id=data_model.author_id,
             type=data_model.type,
             collection_id=data_model.collection_id,
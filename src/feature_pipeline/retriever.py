@@ -1,3 +1,4 @@
+import asyncio
 import sys
 from pathlib import Path
 
@@ -28,9 +29,13 @@ Could you draft an article paragraph discussing RAG?
 I'm particularly interested in how to design a RAG system.
 """
 
-    retriever = VectorRetriever(query=query)
-    hits = retriever.retrieve_top_k(k=6, to_expand_to_n_queries=5)
-    reranked_hits = retriever.rerank(hits=hits, keep_top_k=5)
+    async def retrieve(query: str, collection_id: str) -> list:
+        retriever = VectorRetriever(query=query)
+        hits = await retriever.retrieve_top_k(k=6, to_expand_to_n_queries=5, collection_id=collection_id)
+
+        return await retriever.rerank(hits=hits, keep_top_k=5)
+
+    reranked_hits = asyncio.run(retrieve(query, collection_id="default"))
 
     logger.info("====== RETRIEVED DOCUMENTS ======")
     for rank, hit in enumerate(reranked_hits):
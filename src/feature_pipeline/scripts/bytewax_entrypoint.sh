@@ -9,7 +9,18 @@ else
         echo 'BYTEWAX_PYTHON_FILE_PATH is not set. Exiting...'
         exit 1
     fi
-    python -m bytewax.run $BYTEWAX_PYTHON_FILE_PATH
+    RUN_ARGS="-w ${BYTEWAX_WORKERS:-1}"
+    # With a recovery directory, epochs are snapshotted and RabbitMQ messages are only acked once processed
+    if [ "$BYTEWAX_RECOVERY_DIRECTORY" != "" ]
+    then
+        if [ -z "$(ls -A "$BYTEWAX_RECOVERY_DIRECTORY" 2>/dev/null)" ]
+        then
+            mkdir -p "$BYTEWAX_RECOVERY_DIRECTORY"
+            python -m bytewax.recovery "$BYTEWAX_RECOVERY_DIRECTORY" "${BYTEWAX_RECOVERY_PARTITIONS:-1}"
+        fi
+        RUN_ARGS="$RUN_ARGS -r $BYTEWAX_RECOVERY_DIRECTORY -s ${BYTEWAX_SNAPSHOT_INTERVAL:-10} -b ${BYTEWAX_BACKUP_INTERVAL:-0}"
+    fi
+    python -m bytewax.run $BYTEWAX_PYTHON_FILE_PATH $RUN_ARGS
 fi
 
 
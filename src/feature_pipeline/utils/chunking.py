@@ -22,8 +22,7 @@
 
 #     return chunks
 
-import tiktoken
-from langchain_text_splitters import RecursiveCharacterTextSplitter
+from functools import lru_cache
 
 from src.core.logger_utils import get_logger
 
@@ -31,18 +30,25 @@ logger = get_logger(__name__)
 
 from src.feature_pipeline.config import settings  # Keep settings for model nameg
 
-# Get the tokenizer for the OpenAI model
 
-try:
-    enc = tiktoken.encoding_for_model(settings.EMBEDDING_MODEL_ID)
-except KeyError:
-    logger.warning(f"Tiktoken encoding not found for model {settings.EMBEDDING_MODEL_ID}, using cl100k_base.")
-    enc = tiktoken.get_encoding("cl100k_base")  # Fallback for ada-002, gpt-3.5/4
+@lru_cache(maxsize=1)
+def get_encoding():
+    """
+    Return the tiktoken encoding of the embedding model. Built on first use, as loading it is slow and the token
+    counting is imported by the retrieval path too.
+    """
+    import tiktoken
+
+    try:
+        return tiktoken.encoding_for_model(settings.EMBEDDING_MODEL_ID)
+    except KeyError:
+        logger.warning(f"Tiktoken encoding not found for model {settings.EMBEDDING_MODEL_ID}, using cl100k_base.")
+        return tiktoken.get_encoding("cl100k_base")  # Fallback for ada-002, gpt-3.5/4
 
 
 def length_function_tiktoken(text: str) -> int:
     """Calculate length based on tiktoken tokens."""
-    return len(enc.encode(text))
+    return len(get_encoding().encode(text))
 
 
 def chunk_text(text: str) -> list[str]:
@@ -51,6 +57,8 @@ def chunk_text(text: str) -> list[str]:
     # Define chunk size in TOKENS, aiming below the API limit (e.g., 8191)
 
     # Use RecursiveCharacterTextSplitter with the tiktoken length function
+    from langchain_text_splitters import RecursiveCharacterTextSplitter
+
     text_splitter = RecursiveCharacterTextSplitter(
         chunk_size=settings.CHUNK_SIZE_TOKENS,
         chunk_overlap=settings.CHUNK_OVERLAP_TOKENS,
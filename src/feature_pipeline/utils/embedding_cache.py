@@ -0,0 +1,160 @@
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+from src.core import get_logger
+from src.feature_pipeline.config import settings
+
+logger = get_logger(__name__)
+
+
+class EmbeddingCache:
+    """
+    Content-addressed embedding cache keyed by (chunk_id, model_id).
+    chunk_id is the md5 of the chunk text, so identical chunks re-ingested from any source hit the cache.
+    An in-process LRU sits in front of an on-disk SQLite store whose size is bounded by max_entries.
+
+    Counting the stored rows scans the whole table, so the bound is only enforced after every evict_interval rows
+    written by this process: the store can exceed max_entries by that many rows per process sharing it.
+    """
+
+    def __init__(self, path: str, model_id: str, max_entries: int, lru_size: int, evict_interval: int = 1) -> None:
+        self.model_id = model_id
+        self.max_entries = max_entries
+        self.lru_size = lru_size
+        self.evict_interval = evict_interval
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        self._lru: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._rows_since_evict = 0
+        self._lock = threading.Lock()
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        # Several bytewax workers may share the same file, WAL lets readers proceed while one writes
+        self._db = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embeddings (
+                chunk_id TEXT NOT NULL,
+                model_id TEXT NOT NULL,
+                embedding BLOB NOT NULL,
+                last_access REAL NOT NULL,
+                PRIMARY KEY (chunk_id, model_id)
+            ) WITHOUT ROWID
+            """
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS embeddings_last_access ON embeddings (last_access)")
+        self._db.commit()
+
+    def get_many(self, chunk_ids: list[str]) -> dict[str, np.ndarray]:
+        """Return the cached embeddings for the given chunk ids. Missing ids are simply absent from the result."""
+        found: dict[str, np.ndarray] = {}
+        with self._lock:
+            to_load = []
+            for chunk_id in dict.fromkeys(chunk_ids):
+                if chunk_id in self._lru:
+                    self._lru.move_to_end(chunk_id)
+                    found[chunk_id] = self._lru[chunk_id]
+                    self.memory_hits += 1
+                else:
+                    to_load.append(chunk_id)
+
+            if to_load:
+                placeholders = ", ".join("?" for _ in to_load)
+                rows = self._db.execute(
+                    f"SELECT chunk_id, embedding FROM embeddings WHERE model_id = ? AND chunk_id IN ({placeholders})",
+                    [self.model_id, *to_load],
+                ).fetchall()
+                for chunk_id, blob in rows:
+                    embedding = np.frombuffer(blob, dtype=np.float32)
+                    found[chunk_id] = embedding
+                    self._remember(chunk_id, embedding)
+
+                self.disk_hits += len(rows)
+                self.misses += len(to_load) - len(rows)
+
+                if rows:
+                    self._db.executemany(
+                        "UPDATE embeddings SET last_access = ? WHERE chunk_id = ? AND model_id = ?",
+                        [(time.time(), chunk_id, self.model_id) for chunk_id, _ in rows],
+                    )
+                    self._db.commit()
+
+        return found
+
+    def put_many(self, embeddings: dict[str, np.ndarray]) -> None:
+        if not embeddings:
+            return
+
+        now = time.time()
+        with self._lock:
+            rows = []
+            for chunk_id, embedding in embeddings.items():
+                embedding = np.asarray(embedding, dtype=np.float32)
+                self._remember(chunk_id, embedding)
+                rows.append((chunk_id, self.model_id, embedding.tobytes(), now))
+
+            self._db.executemany(
+                "INSERT OR REPLACE INTO embeddings (chunk_id, model_id, embedding, last_access) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._rows_since_evict += len(rows)
+            if self._rows_since_evict >= self.evict_interval:
+                self._evict()
+                self._rows_since_evict = 0
+            self._db.commit()
+
+    def stats(self) -> dict:
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def _remember(self, chunk_id: str, embedding: np.ndarray) -> None:
+        self._lru[chunk_id] = embedding
+        self._lru.move_to_end(chunk_id)
+        while len(self._lru) > self.lru_size:
+            self._lru.popitem(last=False)
+
+    def _evict(self) -> None:
+        (num_entries,) = self._db.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+        overflow = num_entries - self.max_entries
+        if overflow <= 0:
+            return
+
+        self._db.execute(
+            "DELETE FROM embeddings WHERE (chunk_id, model_id) IN "
+            "(SELECT chunk_id, model_id FROM embeddings ORDER BY last_access LIMIT ?)",
+            (overflow,),
+        )
+        logger.info("Evicted least recently used embeddings from the cache.", num=overflow)
+
+
+@lru_cache(maxsize=1)
+def get_embedding_cache() -> EmbeddingCache | None:
+    if not settings.EMBEDDING_CACHE_ENABLED:
+        return None
+
+    return EmbeddingCache(
+        path=settings.EMBEDDING_CACHE_PATH,
+        model_id=settings.EMBEDDING_MODEL_ID,
+        max_entries=settings.EMBEDDING_CACHE_MAX_ENTRIES,
+        lru_size=settings.EMBEDDING_CACHE_LRU_SIZE,
+        evict_interval=settings.EMBEDDING_CACHE_EVICT_INTERVAL,
+    )
@@ -1,17 +1,76 @@
+from functools import lru_cache
 from typing import List
 
 import numpy as np
 from InstructorEmbedding import INSTRUCTOR
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 from src.feature_pipeline.config import settings
+from src.feature_pipeline.utils.chunking import length_function_tiktoken
 
-client = OpenAI()
+
+@lru_cache(maxsize=1)
+def get_openai_client() -> OpenAI:
+    """Return the process-wide OpenAI client so every call reuses the same HTTP connection pool."""
+    return OpenAI(api_key=settings.OPENAI_API_KEY)
+
+
+@lru_cache(maxsize=1)
+def get_async_openai_client() -> AsyncOpenAI:
+    """Return the process-wide async OpenAI client used by the asyncio retrieval path."""
+    return AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+
+
+def batch_by_tokens(texts: list[str], max_batch_size: int, max_batch_tokens: int) -> list[list[int]]:
+    """
+    Group text indices into micro-batches bounded by item count and total token count.
+    A single text that exceeds the token budget is sent in a batch of its own.
+    """
+    batches: list[list[int]] = []
+    current: list[int] = []
+    current_tokens = 0
+
+    for index, text in enumerate(texts):
+        num_tokens = length_function_tiktoken(text)
+        if current and (len(current) >= max_batch_size or current_tokens + num_tokens > max_batch_tokens):
+            batches.append(current)
+            current, current_tokens = [], 0
+
+        current.append(index)
+        current_tokens += num_tokens
+
+    if current:
+        batches.append(current)
+
+    return batches
+
+
+def embedd_texts(texts: list[str]) -> list[np.ndarray]:
+    """Embed many texts with one embeddings request per token-bounded micro-batch, preserving input order."""
+    if not texts:
+        return []
+
+    client = get_openai_client()
+    embeddings: list[np.ndarray | None] = [None] * len(texts)
+
+    for batch in batch_by_tokens(
+        texts,
+        max_batch_size=settings.EMBEDDING_BATCH_SIZE,
+        max_batch_tokens=settings.EMBEDDING_BATCH_MAX_TOKENS,
+    ):
+        response = client.embeddings.create(
+            input=[texts[index] for index in batch],
+            model=settings.EMBEDDING_MODEL_ID,
+        )
+        # The API returns one item per input, tagged with its position in the request
+        for item in response.data:
+            embeddings[batch[item.index]] = np.array(item.embedding)
+
+    return embeddings  # type: ignore[return-value]
 
 
 def embedd_text(text: str):
-    client = OpenAI(api_key=settings.OPENAI_API_KEY)
-    response = client.embeddings.create(
+    response = get_openai_client().embeddings.create(
         input=text,
         model=settings.EMBEDDING_MODEL_ID,
     )
@@ -22,6 +81,29 @@ def embedd_text(text: str):
     return embedding_array
 
 
+async def aembedd_texts(texts: list[str]) -> list[np.ndarray]:
+    """Async counterpart of embedd_texts, used to embed all expanded queries of a request in one call."""
+    if not texts:
+        return []
+
+    client = get_async_openai_client()
+    embeddings: list[np.ndarray | None] = [None] * len(texts)
+
+    for batch in batch_by_tokens(
+        texts,
+        max_batch_size=settings.EMBEDDING_BATCH_SIZE,
+        max_batch_tokens=settings.EMBEDDING_BATCH_MAX_TOKENS,
+    ):
+        response = await client.embeddings.create(
+            input=[texts[index] for index in batch],
+            model=settings.EMBEDDING_MODEL_ID,
+        )
+        for item in response.data:
+            embeddings[batch[item.index]] = np.array(item.embedding)
+
+    return embeddings  # type: ignore[return-value]
+
+
 def embedd_repositories(text: str):
     model = INSTRUCTOR("hkunlp/instructor-xl")
     sentence = text
@@ -0,0 +1,469 @@
+"""
+End-to-end latency benchmark of the RAG inference path.
+
+Runs LLMTwin.generate, directly or through the FastAPI /inference/generate route, against local stand-ins: a
+deterministic fake LLM client, fake query expansion, embedder and reranker with configurable latencies, and a Qdrant
+preloaded with synthetic chunks spread over --collections collection_ids. Every concurrency level sends the same
+number of requests, each to a random collection_id, and reports throughput, end-to-end latency and the p50/p95/p99
+latency of each stage (expansion, embed, search, hydrate, rerank, generate). With --slim-payloads, the points only keep a
+content_ref and the retriever fetches the chunk texts from an in-memory content store with --content-latency-ms.
+
+Qdrant is in-memory by default. It searches on the event loop, so its search latency grows with the number of chunks
+and, under concurrency, delays the other requests; compare runs with the same --chunks. The in-memory Qdrant ignores
+payload indexes: compare --payload-index none/keyword/tenant against a scratch Qdrant server with --qdrant-url. The
+benchmark creates and then deletes its vector_articles collection there, and refuses to run if it already exists.
+
+Usage (from the repository root):
+    python -m src.inference_pipeline.benchmarks.latency --chunks 5000 --requests 200 --concurrency 1,8,32
+    python -m src.inference_pipeline.benchmarks.latency --qdrant-url http://localhost:6333 --chunks 100000 \
+        --collections 1000 --payload-index none
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+import uuid
+import zlib
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import AsyncIterator, Iterator
+from unittest.mock import patch
+
+import httpx
+import numpy as np
+from fastapi import FastAPI
+from qdrant_client import AsyncQdrantClient, models
+
+from src.api.routers import inference
+from src.core.config import settings
+from src.core.db.content_store import CONTENT_REF_FIELD, ContentStore
+from src.core.db.qdrant import PAYLOAD_INDEX_FIELDS, AsyncQdrantDatabaseConnector, payload_index_schema
+from src.core.llm_clients import LLMClientInterface
+from src.core.rag.cache import retrieval_cache
+from src.core.rag.reranking import RerankedPassage, RerankerBackend
+from src.core.rag.retriever import VectorRetriever
+from src.inference_pipeline.llm_twin import LLMTwin
+
+COLLECTION_NAME = "vector_articles"
+
+VOCABULARY = (
+    "data pipeline stream vector embedding model retrieval query chunk token latency throughput worker batch "
+    "queue broker consumer producer schema index payload collection search rerank context prompt answer the a of "
+    "to and in is for on with as by at from that this it be are was were will can"
+).split()
+
+
+class StageTimings:
+    """Collects the wall time of every call of each stage."""
+
+    def __init__(self) -> None:
+        self.durations: dict[str, list[float]] = defaultdict(list)
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.durations[stage].append(time.perf_counter() - started_at)
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        return {stage: latency_summary(durations) for stage, durations in self.durations.items()}
+
+
+def latency_summary(durations: list[float]) -> dict[str, float]:
+    ms = np.array(durations) * 1000
+
+    return {
+        "calls": len(durations),
+        "p50_ms": round(float(np.percentile(ms, 50)), 3),
+        "p95_ms": round(float(np.percentile(ms, 95)), 3),
+        "p99_ms": round(float(np.percentile(ms, 99)), 3),
+    }
+
+
+def fake_embedding(text: str, dimensions: int) -> np.ndarray:
+    """Deterministic unit vector seeded by the text."""
+    vector = np.random.default_rng(zlib.crc32(text.encode("utf-8"))).standard_normal(dimensions)
+
+    return vector / np.linalg.norm(vector)
+
+
+class FakeEmbedder:
+    """Stands in for aembedd_texts: one simulated embeddings request per call."""
+
+    def __init__(self, timings: StageTimings, dimensions: int, latency_seconds: float = 0.0) -> None:
+        self.timings = timings
+        self.dimensions = dimensions
+        self.latency_seconds = latency_seconds
+
+    async def __call__(self, texts: list[str]) -> list[np.ndarray]:
+        with self.timings.measure("embed"):
+            await asyncio.sleep(self.latency_seconds)
+
+            return [fake_embedding(text, self.dimensions) for text in texts]
+
+
+class FakeQueryExpansion:
+    """Stands in for QueryExpansion: derives the expanded queries from the query, spreading the latency over them."""
+
+    def __init__(self, timings: StageTimings, latency_seconds: float = 0.0) -> None:
+        self.timings = timings
+        self.latency_seconds = latency_seconds
+
+    async def agenerate_response(self, query: str, to_expand_to_n: int) -> list[str]:
+        with self.timings.measure("expansion"):
+            await asyncio.sleep(self.latency_seconds)
+
+            return self._expand(query, to_expand_to_n)
+
+    async def astream_queries(self, query: str, to_expand_to_n: int) -> AsyncIterator[str]:
+        with self.timings.measure("expansion"):
+            for generated_query in self._expand(query, to_expand_to_n):
+                await asyncio.sleep(self.latency_seconds / to_expand_to_n)
+                yield generated_query
+
+    @staticmethod
+    def _expand(query: str, to_expand_to_n: int) -> list[str]:
+        words = query.split()
+
+        return [" ".join(words[i:] + words[:i]) for i in range(1, to_expand_to_n + 1)]
+
+
+class FakeReranker(RerankerBackend):
+    """Scores the passages by their word overlap with the query."""
+
+    def __init__(self, timings: StageTimings, latency_seconds: float = 0.0) -> None:
+        self.timings = timings
+        self.latency_seconds = latency_seconds
+
+    async def rerank(self, query: str, ids: list, passages: list[str], keep_top_k: int) -> list[RerankedPassage]:
+        with self.timings.measure("rerank"):
+            await asyncio.sleep(self.latency_seconds)
+
+            query_words = set(query.split())
+            reranked = [
+                RerankedPassage(id=point_id, score=len(query_words & set(passage.split())) / len(query_words), content=passage)
+                for point_id, passage in zip(ids, passages)
+            ]
+            reranked.sort(key=lambda passage: passage.score, reverse=True)
+
+            return reranked[:keep_top_k]
+
+
+class InMemoryContentObjects:
+    """Stands in for the async MinIO client of the content store, timing every batch fetch as the "hydrate" stage."""
+
+    def __init__(self, timings: StageTimings, latency_seconds: float = 0.0) -> None:
+        self.timings = timings
+        self.latency_seconds = latency_seconds
+        self.objects: dict[str, str] = {}
+
+    def put(self, content: str) -> str:
+        object_id = str(uuid.uuid4())
+        self.objects[object_id] = content
+
+        return object_id
+
+    async def retrieve_documents(self, object_ids: list[str], bucket_name: str) -> dict[str, str | None]:
+        with self.timings.measure("hydrate"):
+            await asyncio.sleep(self.latency_seconds)
+
+            return {object_id: self.objects.get(object_id) for object_id in object_ids}
+
+
+class FakeLLMClient(LLMClientInterface):
+    """Deterministic LLM client: answers with a digest of the prompt after a fixed latency."""
+
+    def __init__(self, timings: StageTimings, latency_seconds: float = 0.0) -> None:
+        self.timings = timings
+        self.latency_seconds = latency_seconds
+
+    async def generate(self, messages, **kwargs) -> str:
+        with self.timings.measure("generate"):
+            await asyncio.sleep(self.latency_seconds)
+            prompt = "\n".join(message["content"] for message in messages)
+
+            return f"Answer {zlib.crc32(prompt.encode('utf-8')):08x} to a prompt of {len(prompt)} characters."
+
+
+class BenchmarkQdrantConnector(AsyncQdrantDatabaseConnector):
+    """Async Qdrant connector to an in-memory Qdrant or a scratch server, timing every search as the "search" stage."""
+
+    def __init__(self, timings: StageTimings, url: str | None = None) -> None:
+        self._instance = AsyncQdrantClient(url=url) if url else AsyncQdrantClient(":memory:")
+        self.timings = timings
+
+    async def search_batch(self, collection_name: str, requests: list[models.SearchRequest]) -> list[list]:
+        with self.timings.measure("search"):
+            return await super().search_batch(collection_name=collection_name, requests=requests)
+
+    async def preload(
+        self,
+        num_chunks: int,
+        collection_ids: list[str],
+        dimensions: int,
+        words_per_chunk: int,
+        payload_index: str = "keyword",
+        contents: InMemoryContentObjects | None = None,
+        seed: int = 42,
+    ) -> None:
+        """
+        Creates the articles collection, indexed as by QdrantDatabaseConnector unless payload_index is "none", and
+        fills it with synthetic chunks spread evenly over the collection_ids. Given contents, the points are slim: the
+        chunk texts are stored there and the payloads only reference them.
+        """
+        assert self._instance is not None
+        if await self._instance.collection_exists(COLLECTION_NAME):
+            raise RuntimeError(f"Collection {COLLECTION_NAME} already exists, run the benchmark against a scratch Qdrant.")
+
+        await self._instance.create_collection(
+            collection_name=COLLECTION_NAME,
+            vectors_config=models.VectorParams(size=dimensions, distance=models.Distance.COSINE),
+        )
+        if payload_index != "none":
+            for field_name in PAYLOAD_INDEX_FIELDS:
+                await self._instance.create_payload_index(
+                    collection_name=COLLECTION_NAME,
+                    field_name=field_name,
+                    field_schema=payload_index_schema(field_name, is_tenant=payload_index == "tenant"),
+                )
+
+        rng = random.Random(seed)
+        author_ids = {collection_id: str(uuid.UUID(int=rng.getrandbits(128))) for collection_id in collection_ids}
+        for start in range(0, num_chunks, 1000):
+            chunks = [
+                (collection_ids[i % len(collection_ids)], generate_text(rng, words_per_chunk))
+                for i in range(start, min(start + 1000, num_chunks))
+            ]
+            await self._instance.upsert(
+                collection_name=COLLECTION_NAME,
+                points=[
+                    models.PointStruct(
+                        id=str(uuid.UUID(int=rng.getrandbits(128))),
+                        vector=fake_embedding(chunk, dimensions).tolist(),
+                        payload={
+                            **({CONTENT_REF_FIELD: contents.put(chunk)} if contents else {"content": chunk}),
+                            "collection_id": collection_id,
+                            "author_id": author_ids[collection_id],
+                            "type": "articles",
+                        },
+                    )
+                    for collection_id, chunk in chunks
+                ],
+            )
+
+    async def close(self):
+        assert self._instance is not None
+        if await self._instance.collection_exists(COLLECTION_NAME):
+            await self._instance.delete_collection(COLLECTION_NAME)
+        await self._instance.close()
+
+
+def generate_text(rng: random.Random, num_words: int) -> str:
+    return " ".join(rng.choices(VOCABULARY, k=num_words))
+
+
+def build_app(llm_client: LLMClientInterface) -> FastAPI:
+    """The inference router with the app state the API lifespan would set up, without the API key dependency."""
+    app = FastAPI()
+    app.state.llm_client = llm_client
+    app.include_router(inference.router, prefix="/inference")
+
+    return app
+
+
+async def run_level(send_request, queries: list[tuple[str, str]], concurrency: int, timings: StageTimings) -> dict:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    errors = 0
+
+    async def one(query: str, collection_id: str) -> None:
+        nonlocal errors
+        async with semaphore:
+            started_at = time.perf_counter()
+            try:
+                await send_request(query, collection_id)
+                latencies.append(time.perf_counter() - started_at)
+            except Exception:
+                errors += 1
+
+    timings.durations.clear()
+    started_at = time.perf_counter()
+    await asyncio.gather(*(one(query, collection_id) for query, collection_id in queries))
+    elapsed = time.perf_counter() - started_at
+
+    return {
+        "concurrency": concurrency,
+        "requests": len(queries),
+        "errors": errors,
+        "elapsed_s": round(elapsed, 3),
+        "requests_per_s": round(len(latencies) / elapsed, 2),
+        "latency": latency_summary(latencies) if latencies else None,
+        "stages": timings.summary(),
+    }
+
+
+async def run_benchmark(
+    num_chunks: int,
+    num_requests: int,
+    concurrency_levels: list[int],
+    target: str = "twin",
+    num_collections: int = 1,
+    payload_index: str = "keyword",
+    qdrant_url: str | None = None,
+    slim_payloads: bool = False,
+    words_per_chunk: int = 120,
+    dimensions: int = settings.EMBEDDING_SIZE,
+    expansion_latency_ms: float = 300.0,
+    embed_latency_ms: float = 50.0,
+    rerank_latency_ms: float = 30.0,
+    content_latency_ms: float = 5.0,
+    llm_latency_ms: float = 500.0,
+    pipelined: bool = settings.RAG_PIPELINED_RETRIEVAL,
+    use_retrieval_cache: bool = False,
+    seed: int = 42,
+) -> dict:
+    timings = StageTimings()
+    connector = BenchmarkQdrantConnector(timings, url=qdrant_url)
+    collection_ids = [f"benchmark-{i}" for i in range(num_collections)]
+    content_objects = InMemoryContentObjects(timings, latency_seconds=content_latency_ms / 1000) if slim_payloads else None
+    await connector.preload(
+        num_chunks, collection_ids, dimensions, words_per_chunk, payload_index=payload_index, contents=content_objects, seed=seed
+    )
+
+    embedder = FakeEmbedder(timings, dimensions, latency_seconds=embed_latency_ms / 1000)
+    query_expander = FakeQueryExpansion(timings, latency_seconds=expansion_latency_ms / 1000)
+    reranker = FakeReranker(timings, latency_seconds=rerank_latency_ms / 1000)
+    llm_client = FakeLLMClient(timings, latency_seconds=llm_latency_ms / 1000)
+    contents = ContentStore(async_minio=content_objects) if content_objects else None
+
+    def retriever_factory(query: str) -> VectorRetriever:
+        return VectorRetriever(
+            query=query,
+            client=connector,
+            embedder=embedder,
+            query_expander=query_expander,
+            reranker=reranker,
+            contents=contents,
+        )
+
+    llm_twin = LLMTwin(retriever_factory=retriever_factory)
+    rng = random.Random(seed)
+
+    async def generate(query: str, collection_id: str) -> None:
+        await llm_twin.generate(query=query, llm_client=llm_client, collection_id=collection_id, enable_rag=True)
+
+    levels = []
+    try:
+        with (
+            patch.object(settings, "RAG_PIPELINED_RETRIEVAL", pipelined),
+            patch.object(settings, "RETRIEVAL_CACHE_ENABLED", use_retrieval_cache),
+            patch.object(inference, "llm_twin_instance", llm_twin),
+        ):
+            async with httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=build_app(llm_client)), base_url="http://benchmark", timeout=None
+            ) as http_client:
+
+                async def post(query: str, collection_id: str) -> None:
+                    response = await http_client.post(
+                        "/inference/generate", json={"query": query, "collection_id": collection_id, "use_rag": True}
+                    )
+                    response.raise_for_status()
+
+                send_request = post if target == "api" else generate
+                for concurrency in concurrency_levels:
+                    retrieval_cache.query_embeddings.clear()
+                    retrieval_cache.search_results.clear()
+                    queries = [
+                        (generate_text(rng, rng.randint(5, 12)), rng.choice(collection_ids)) for _ in range(num_requests)
+                    ]
+                    levels.append(await run_level(send_request, queries, concurrency, timings))
+    finally:
+        await connector.close()
+
+    return {
+        "target": target,
+        "qdrant": qdrant_url or "in-memory",
+        "chunks": num_chunks,
+        "collections": num_collections,
+        "payload_index": payload_index,
+        "slim_payloads": slim_payloads,
+        "pipelined_retrieval": pipelined,
+        "retrieval_cache": use_retrieval_cache,
+        "levels": levels,
+    }
+
+
+def print_report(result: dict) -> None:
+    print(
+        f"Target: {result['target']}, Qdrant: {result['qdrant']}, chunks: {result['chunks']} in "
+        f"{result['collections']} collection(s), payload index: {result['payload_index']}, "
+        f"slim payloads: {result['slim_payloads']}, "
+        f"pipelined retrieval: {result['pipelined_retrieval']}, retrieval cache: {result['retrieval_cache']}"
+    )
+    for level in result["levels"]:
+        latency = level["latency"] or {"p50_ms": "-", "p95_ms": "-", "p99_ms": "-"}
+        print()
+        print(
+            f"Concurrency {level['concurrency']}: {level['requests']} requests ({level['errors']} errors) in "
+            f"{level['elapsed_s']} s, {level['requests_per_s']} requests/s"
+        )
+        print(f"{'stage':<14}{'calls':>8}{'p50 ms':>12}{'p95 ms':>12}{'p99 ms':>12}")
+        print(f"{'end-to-end':<14}{level['requests']:>8}{latency['p50_ms']:>12}{latency['p95_ms']:>12}{latency['p99_ms']:>12}")
+        for stage, stats in level["stages"].items():
+            print(f"{stage:<14}{stats['calls']:>8}{stats['p50_ms']:>12}{stats['p95_ms']:>12}{stats['p99_ms']:>12}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the RAG inference path with local stand-ins.")
+    parser.add_argument("--target", choices=["twin", "api"], default="twin", help="Call LLMTwin.generate or the API route.")
+    parser.add_argument("--chunks", type=int, default=5000, help="Synthetic chunks preloaded in Qdrant.")
+    parser.add_argument("--collections", type=int, default=1, help="collection_ids the chunks are spread over.")
+    parser.add_argument("--payload-index", choices=["none", "keyword", "tenant"], default="keyword")
+    parser.add_argument("--qdrant-url", help="Scratch Qdrant server to use instead of the in-memory Qdrant.")
+    parser.add_argument("--slim-payloads", action="store_true", help="Store the chunk texts out of the points.")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per concurrency level.")
+    parser.add_argument("--concurrency", default="1,8,32", help="Comma separated concurrency levels.")
+    parser.add_argument("--dimensions", type=int, default=settings.EMBEDDING_SIZE)
+    parser.add_argument("--expansion-latency-ms", type=float, default=300.0)
+    parser.add_argument("--embed-latency-ms", type=float, default=50.0)
+    parser.add_argument("--rerank-latency-ms", type=float, default=30.0)
+    parser.add_argument("--content-latency-ms", type=float, default=5.0, help="Latency of a content store fetch.")
+    parser.add_argument("--llm-latency-ms", type=float, default=500.0)
+    parser.add_argument("--sequential", action="store_true", help="Disable pipelined retrieval.")
+    parser.add_argument("--retrieval-cache", action="store_true", help="Keep the retrieval cache enabled.")
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON.")
+    args = parser.parse_args()
+
+    result = asyncio.run(
+        run_benchmark(
+            num_chunks=args.chunks,
+            num_requests=args.requests,
+            concurrency_levels=[int(level) for level in args.concurrency.split(",")],
+            target=args.target,
+            num_collections=args.collections,
+            payload_index=args.payload_index,
+            qdrant_url=args.qdrant_url,
+            slim_payloads=args.slim_payloads,
+            dimensions=args.dimensions,
+            expansion_latency_ms=args.expansion_latency_ms,
+            embed_latency_ms=args.embed_latency_ms,
+            rerank_latency_ms=args.rerank_latency_ms,
+            content_latency_ms=args.content_latency_ms,
+            llm_latency_ms=args.llm_latency_ms,
+            pipelined=not args.sequential,
+            use_retrieval_cache=args.retrieval_cache,
+        )
+    )
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print_report(result)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 import pprint
+from typing import AsyncIterator, Callable
 
 from langchain.prompts import PromptTemplate
 
@@ -14,9 +15,11 @@ logger = logger_utils.get_logger(__name__)
 
 
 class LLMTwin:
-    def __init__(self) -> None:
+    def __init__(self, retriever_factory: Callable[[str], VectorRetriever] = VectorRetriever) -> None:
         # Keep prompt template builder initialization if it's stateless
         self.prompt_template_builder = InferenceTemplate()
+        # Builds the retriever of each query, replaced to run RAG against local stand-ins (benchmarks)
+        self.retriever_factory = retriever_factory
 
     # @opik.track(name="inference_pipeline.generate")
     async def generate(  # Make method async
@@ -28,25 +31,7 @@ class LLMTwin:
         enable_rag: bool = False,
         sample_for_evaluation: bool = False,
     ) -> dict:
-        system_prompt, prompt_template = self.prompt_template_builder.create_template(enable_rag=enable_rag)
-        prompt_template_variables = {"question": query}
-
-        if enable_rag is True:
-            # VectorRetriever initializes its own Qdrant client internally
-            retriever = VectorRetriever(query=query)  # Removed db_client argument
-            hits = await retriever.retrieve_top_k(
-                k=settings.TOP_K, to_expand_to_n_queries=settings.EXPAND_N_QUERY, collection_id=collection_id
-            )
-
-            # Rerank returns list[str], join them for the prompt context
-            context_list = retriever.rerank(hits=hits, keep_top_k=settings.KEEP_TOP_K)
-            context = "\n\n".join(context_list)  # Join the context strings
-            prompt_template_variables["context"] = context  # Assign the joined string
-        else:
-            context_list = []
-            context = None
-
-        messages = self.format_prompt(system_prompt, prompt_template, prompt_template_variables)  # Only get messages now
+        messages, context_list = await self.build_messages(query=query, collection_id=collection_id, enable_rag=enable_rag)
 
         logger.debug(f"Prompt: {pprint.pformat(messages)}")
         # Pass the llm_client to call_llm_service
@@ -76,6 +61,60 @@ class LLMTwin:
 
         return answer
 
+    async def generate_stream(
+        self,
+        query: str,
+        llm_client: LLMClientInterface,
+        collection_id: str,
+        enable_rag: bool = False,
+    ) -> AsyncIterator[dict]:
+        """
+        Streams the answer as events: one "context" event with the retrieved context (sent before generation starts),
+        then one "token" event per generated chunk.
+        """
+        messages, context_list = await self.build_messages(query=query, collection_id=collection_id, enable_rag=enable_rag)
+        yield {"event": "context", "data": context_list}
+
+        logger.debug(f"Prompt: {pprint.pformat(messages)}")
+        async for token in llm_client.generate_stream(messages=messages):
+            yield {"event": "token", "data": token}
+
+    async def build_messages(
+        self, query: str, collection_id: str, enable_rag: bool = False
+    ) -> tuple[list[dict[str, str]], list[str]]:
+        """Retrieves the context (if RAG is enabled) and formats the prompt messages."""
+        system_prompt, prompt_template = self.prompt_template_builder.create_template(enable_rag=enable_rag)
+        prompt_template_variables = {"question": query}
+
+        if enable_rag is True:
+            # VectorRetriever initializes its own Qdrant client internally
+            retriever = self.retriever_factory(query)
+            if settings.RAG_PIPELINED_RETRIEVAL:
+                hits = await retriever.retrieve_top_k_pipelined(
+                    k=settings.TOP_K,
+                    to_expand_to_n_queries=settings.EXPAND_N_QUERY,
+                    collection_id=collection_id,
+                    min_candidates=settings.RAG_MIN_CANDIDATES,
+                )
+            else:
+                hits = await retriever.retrieve_top_k(
+                    k=settings.TOP_K, to_expand_to_n_queries=settings.EXPAND_N_QUERY, collection_id=collection_id
+                )
+
+            # Rerank returns scored passages, join their content for the prompt context
+            reranked_passages = await retriever.rerank(
+                hits=hits, keep_top_k=settings.KEEP_TOP_K, timeout=settings.RAG_RERANK_BUDGET_SECONDS
+            )
+            context_list = [passage.content for passage in reranked_passages]
+            context = "\n\n".join(context_list)  # Join the context strings
+            prompt_template_variables["context"] = context  # Assign the joined string
+        else:
+            context_list = []
+
+        messages = self.format_prompt(system_prompt, prompt_template, prompt_template_variables)  # Only get messages now
+
+        return messages, context_list
+
     # @opik.track(name="inference_pipeline.format_prompt")
     def format_prompt(
         self,
@@ -1,3 +1,4 @@
+import json
 import logging
 import sys
 from pathlib import Path
@@ -25,42 +26,59 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Define the API endpoint URL (adjust if not using Docker Compose)
-API_ENDPOINT = "http://api:80/generate"
-# API_ENDPOINT = "http://localhost:8000/generate" # Use this if running locally without Docker
+API_ENDPOINT = "http://api:80/inference/generate/stream"
+# API_ENDPOINT = "http://localhost:8000/inference/generate/stream" # Use this if running locally without Docker
 
 
-def predict(message: str, history: list[list[str]], author: str) -> str:
+def predict(message: str, history: list[list[str]], author: str, collection_id: str):
     """
-    Generates a response using the LLM Twin, simulating a conversation with your digital twin.
+    Streams a response from the LLM Twin, simulating a conversation with your digital twin.
 
     Args:
         message (str): The user's input message or question.
         history (List[List[str]]): Previous conversation history between user and twin.
-        about_me (str): Personal context about the user to help personalize responses.
+        author (str): Who the user is, used to personalize responses.
+        collection_id (str): The collection to retrieve context from.
 
-    Returns:
-        str: The LLM Twin's generated response.
+    Yields:
+        str: The LLM Twin's response generated so far.
     """
 
     query = f"I am {author}. Write about: {message}"
-    payload = {"query": query, "use_rag": True}  # Assuming use_rag=True is desired for UI
+    payload = {"query": query, "use_rag": True, "collection_id": collection_id}  # Assuming use_rag=True is desired for UI
 
     logger.info(f"Sending request to {API_ENDPOINT} with payload: {payload}")
 
+    answer = ""
     try:
-        response = requests.post(API_ENDPOINT, json=payload, timeout=120)  # Added timeout
-        response.raise_for_status()  # Raise an exception for bad status codes (4xx or 5xx)
-
-        response_data = response.json()
-        logger.info(f"Received response: {response_data}")
-        return response_data.get("answer", "Error: Could not parse answer from response.")
+        # Connect timeout, then the max wait between two streamed chunks
+        with requests.post(API_ENDPOINT, json=payload, stream=True, timeout=(10, 120)) as response:
+            response.raise_for_status()  # Raise an exception for bad status codes (4xx or 5xx)
+
+            event = None
+            for line in response.iter_lines(decode_unicode=True):
+                if line.startswith("event: "):
+                    event = line.removeprefix("event: ")
+                elif line.startswith("data: "):
+                    data = json.loads(line.removeprefix("data: "))
+                    if event == "token":
+                        answer += data
+                        yield answer
+                    elif event == "context":
+                        logger.info(f"Received context: {data}")
+                    elif event == "error":
+                        yield f"{answer}\n\nError: {data}"
+                        return
+
+        if not answer:
+            yield "Error: No answer generated."
 
     except requests.exceptions.RequestException as e:
         logger.error(f"Error calling API endpoint {API_ENDPOINT}: {e}")
-        return f"Error: Could not connect to the inference API. Details: {e}"
+        yield f"Error: Could not connect to the inference API. Details: {e}"
     except Exception as e:
         logger.error(f"An unexpected error occurred: {e}")
-        return f"An unexpected error occurred: {e}"
+        yield f"An unexpected error occurred: {e}"
 
 
 demo = gr.ChatInterface(
@@ -75,7 +93,11 @@ demo = gr.ChatInterface(
         gr.Textbox(
             "Paul Iusztin",
             label="Who are you?",
-        )
+        ),
+        gr.Textbox(
+            "default",
+            label="Collection ID",
+        ),
     ],
     title="Your LLM Twin",
     description="""
@@ -86,14 +108,17 @@ demo = gr.ChatInterface(
         [
             "Draft a post about RAG systems.",
             "Paul Iusztin",
+            "default",
         ],
         [
             "Draft an article paragraph about vector databases.",
             "Paul Iusztin",
+            "default",
         ],
         [
             "Draft a post about LLM chatbots.",
             "Paul Iusztin",
+            "default",
         ],
     ],
     cache_examples=False,
@@ -167,3 +167,49 @@ async def test_generate_missing_answer_in_result(client, mock_llm_twin_generate,
     assert response_data["context"] == ["Some context"]
 
     mock_llm_twin_generate.assert_awaited_once_with(query=query, llm_client=mock_llm_client, enable_rag=True)
+
+
+# --- Test /generate/stream Endpoint ---
+
+
+async def test_generate_stream_success(client, mock_llm_client):
+    """Test that the stream endpoint emits the context first, then the tokens and a final done event."""
+
+    async def fake_generate_stream(**kwargs):
+        yield {"event": "context", "data": ["Context 1"]}
+        yield {"event": "token", "data": "RAG "}
+        yield {"event": "token", "data": "rocks."}
+
+    with patch(
+        "src.api.routers.inference.llm_twin_instance.generate_stream", side_effect=fake_generate_stream
+    ) as mock_generate_stream:
+        payload = {"query": "What is RAG?", "collection_id": "collection-1", "use_rag": True}
+        response = client.post("/generate/stream", json=payload)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.text == (
+        'event: context\ndata: ["Context 1"]\n\n'
+        'event: token\ndata: "RAG "\n\n'
+        'event: token\ndata: "rocks."\n\n'
+        "event: done\ndata: null\n\n"
+    )
+    mock_generate_stream.assert_called_once_with(
+        query="What is RAG?", llm_client=mock_llm_client, collection_id="collection-1", enable_rag=True
+    )
+
+
+async def test_generate_stream_error_event(client):
+    """Test that errors raised while streaming are reported as an error event."""
+
+    async def failing_generate_stream(**kwargs):
+        yield {"event": "context", "data": []}
+        raise Exception("LLM Twin internal error")
+
+    with patch("src.api.routers.inference.llm_twin_instance.generate_stream", side_effect=failing_generate_stream):
+        payload = {"query": "This will fail.", "collection_id": "collection-1", "use_rag": False}
+        response = client.post("/generate/stream", json=payload)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert "event: error" in response.text
+    assert "LLM Twin internal error" in response.text
@@ -0,0 +1,71 @@
+# tests/cdc_listener/test_outbox.py
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import asyncpg
+import pytest
+
+from src.cdc_listener.outbox import OutboxDrainer
+from src.cdc_listener.publisher import CDCPublisher
+
+pytestmark = pytest.mark.asyncio
+
+MESSAGE = {"table": "articles", "operation": "INSERT", "data": {"id": "a1"}}
+
+
+@pytest.fixture
+def mock_connection():
+    """Fixture for a mocked asyncpg Connection whose transaction() propagates exceptions."""
+    connection = AsyncMock(spec=asyncpg.Connection)
+    transaction = AsyncMock()
+    transaction.__aexit__.return_value = False
+    connection.transaction = MagicMock(return_value=transaction)
+    connection.fetch = AsyncMock(return_value=[])
+    connection.execute = AsyncMock()
+    return connection
+
+
+@pytest.fixture
+def mock_publisher():
+    publisher = AsyncMock(spec=CDCPublisher)
+    publisher.flush.return_value = True
+    return publisher
+
+
+async def test_drain_batch_publishes_and_deletes(mock_connection, mock_publisher):
+    """Test that claimed rows are published and deleted once the broker confirmed them."""
+    mock_connection.fetch.return_value = [
+        {"id": 1, "payload": json.dumps(MESSAGE)},
+        {"id": 2, "payload": json.dumps(MESSAGE)},
+    ]
+    drainer = OutboxDrainer(mock_connection, mock_publisher, batch_size=10)
+
+    assert await drainer.drain_batch() == 2
+
+    assert "FOR UPDATE SKIP LOCKED" in mock_connection.fetch.call_args.args[0]
+    assert mock_connection.fetch.call_args.args[1] == 10
+    assert mock_publisher.publish.await_count == 2
+    mock_publisher.publish.assert_any_await("data_changes_queue", json.dumps(MESSAGE))
+    mock_connection.execute.assert_awaited_once_with("DELETE FROM outbox WHERE id = ANY($1::bigint[])", [1, 2])
+
+
+async def test_drain_batch_empty(mock_connection, mock_publisher):
+    """Test that an empty outbox publishes nothing."""
+    drainer = OutboxDrainer(mock_connection, mock_publisher, batch_size=10)
+
+    assert await drainer.drain_batch() == 0
+
+    mock_publisher.publish.assert_not_awaited()
+    mock_connection.execute.assert_not_awaited()
+
+
+async def test_drain_batch_keeps_rows_on_failed_flush(mock_connection, mock_publisher):
+    """Test that rows are not deleted when the broker did not confirm them."""
+    mock_connection.fetch.return_value = [{"id": 1, "payload": json.dumps(MESSAGE)}]
+    mock_publisher.flush.return_value = False
+    drainer = OutboxDrainer(mock_connection, mock_publisher, batch_size=10)
+
+    with pytest.raises(RuntimeError):
+        await drainer.drain_batch()
+
+    mock_connection.execute.assert_not_awaited()
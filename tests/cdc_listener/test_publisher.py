@@ -0,0 +1,96 @@
+# tests/cdc_listener/test_publisher.py
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.cdc_listener.publisher import CDCPublisher
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def mock_channel():
+    """Fixture for a mocked aio-pika channel with publisher confirms."""
+    channel = MagicMock()
+    channel.declare_queue = AsyncMock()
+    channel.default_exchange.publish = AsyncMock()
+    return channel
+
+
+@pytest.fixture
+def mock_connect(mock_channel):
+    connection = MagicMock()
+    connection.channel = AsyncMock(return_value=mock_channel)
+    connection.close = AsyncMock()
+    with patch("aio_pika.connect_robust", new_callable=AsyncMock, return_value=connection) as mock_connect:
+        yield mock_connect
+
+
+async def test_publishes_queued_payloads_over_one_connection(mock_connect, mock_channel):
+    """Test that payloads are published over a single connection and queues are declared once."""
+    publisher = CDCPublisher(url="amqp://mock", batch_size=10)
+    await publisher.start()
+
+    for index in range(5):
+        await publisher.publish("queue", f"payload-{index}")
+    await publisher.close()
+
+    mock_connect.assert_awaited_once_with("amqp://mock")
+    mock_channel.declare_queue.assert_awaited_once_with("queue", durable=True)
+    assert mock_channel.default_exchange.publish.await_count == 5
+    bodies = [call.args[0].body for call in mock_channel.default_exchange.publish.await_args_list]
+    assert bodies == [f"payload-{index}".encode() for index in range(5)]
+
+
+async def test_publish_waits_when_queue_is_full(mock_connect, mock_channel):
+    """Test that publish applies backpressure once the in-memory queue is full."""
+    release = asyncio.Event()
+
+    async def slow_publish(*args, **kwargs):
+        await release.wait()
+
+    mock_channel.default_exchange.publish.side_effect = slow_publish
+    publisher = CDCPublisher(url="amqp://mock", max_queue_size=1, batch_size=1)
+    await publisher.start()
+
+    await publisher.publish("queue", "first")  # taken by the worker, which blocks on the broker
+    await asyncio.sleep(0)
+    await publisher.publish("queue", "second")  # fills the queue
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(publisher.publish("queue", "third"), timeout=0.05)
+
+    release.set()
+    await publisher.close()
+
+
+async def test_retries_unconfirmed_payloads(mock_connect, mock_channel):
+    """Test that only the payloads that were not confirmed are published again."""
+    mock_channel.default_exchange.publish.side_effect = [None, Exception("nack"), None]
+    publisher = CDCPublisher(url="amqp://mock", batch_size=10, max_retries=2)
+    await publisher.start()
+
+    with patch("asyncio.sleep", new_callable=AsyncMock):
+        await publisher.publish("queue", "first")
+        await publisher.publish("queue", "second")
+        await publisher.close()
+
+    bodies = [call.args[0].body for call in mock_channel.default_exchange.publish.await_args_list]
+    assert bodies == [b"first", b"second", b"second"]
+
+
+async def test_retries_when_declaring_the_queue_fails(mock_connect, mock_channel):
+    """Test that a failed queue declaration is retried after the backoff instead of dropping the batch."""
+    mock_channel.declare_queue.side_effect = [ConnectionError("reconnecting"), None]
+    publisher = CDCPublisher(url="amqp://mock", batch_size=10, max_retries=2)
+    await publisher.start()
+
+    with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        await publisher.publish("queue", "first")
+        assert await publisher.flush()
+        await publisher.close()
+
+    mock_sleep.assert_awaited_once()
+    bodies = [call.args[0].body for call in mock_channel.default_exchange.publish.await_args_list]
+    assert bodies == [b"first"]
@@ -0,0 +1,94 @@
+# tests/cdc_listener/test_replication.py
+import json
+from unittest.mock import AsyncMock
+
+import asyncpg
+import pytest
+
+from src.cdc_listener.publisher import CDCPublisher
+from src.cdc_listener.replication import ReplicationReader, change_to_message
+
+pytestmark = pytest.mark.asyncio
+
+
+def _row(lsn: str, data: dict) -> dict:
+    return {"lsn": lsn, "data": json.dumps(data)}
+
+
+INSERT_CHANGE = {
+    "action": "I",
+    "schema": "public",
+    "table": "articles",
+    "columns": [
+        {"name": "id", "type": "uuid", "value": "a1"},
+        {"name": "metadata", "type": "jsonb", "value": '{"lang": "en"}'},
+    ],
+}
+
+
+@pytest.fixture
+def mock_connection():
+    """Fixture for a mocked asyncpg Connection."""
+    connection = AsyncMock(spec=asyncpg.Connection)
+    connection.fetch = AsyncMock(return_value=[])
+    connection.execute = AsyncMock()
+    return connection
+
+
+@pytest.fixture
+def mock_publisher():
+    publisher = AsyncMock(spec=CDCPublisher)
+    publisher.flush.return_value = True
+    return publisher
+
+
+async def test_change_to_message():
+    """Test that wal2json changes are converted to the notify_data_change() message format."""
+    assert change_to_message(INSERT_CHANGE) == {
+        "table": "articles",
+        "operation": "INSERT",
+        "data": {"id": "a1", "metadata": {"lang": "en"}},
+    }
+    assert change_to_message({"action": "D", "table": "articles", "identity": []}) is None
+    assert change_to_message({**INSERT_CHANGE, "action": "U"}) is None
+
+
+async def test_poll_once_publishes_and_checkpoints(mock_connection, mock_publisher):
+    """Test that a transaction is published and the slot advanced to its commit LSN once confirmed."""
+    mock_connection.fetch.return_value = [
+        _row("0/1", {"action": "B"}),
+        _row("0/2", INSERT_CHANGE),
+        _row("0/3", {"action": "C"}),
+    ]
+    reader = ReplicationReader(mock_connection, mock_publisher, slot_name="slot", tables="public.articles")
+
+    assert await reader.poll_once() == 1
+
+    queue_name, payload = mock_publisher.publish.await_args.args
+    assert json.loads(payload)["data"]["id"] == "a1"
+    mock_publisher.flush.assert_awaited_once()
+    mock_connection.execute.assert_awaited_once_with(
+        "SELECT pg_replication_slot_advance($1, $2::pg_lsn)", "slot", "0/3"
+    )
+
+
+async def test_poll_once_does_not_checkpoint_unconfirmed_changes(mock_connection, mock_publisher):
+    """Test that the slot is not advanced when the broker did not confirm every change."""
+    mock_connection.fetch.return_value = [_row("0/2", INSERT_CHANGE), _row("0/3", {"action": "C"})]
+    mock_publisher.flush.return_value = False
+    reader = ReplicationReader(mock_connection, mock_publisher, slot_name="slot", tables="public.articles")
+
+    with pytest.raises(RuntimeError):
+        await reader.poll_once()
+
+    mock_connection.execute.assert_not_awaited()
+
+
+async def test_ensure_slot_creates_missing_slot(mock_connection, mock_publisher):
+    """Test that the wal2json slot is created when it does not exist yet."""
+    mock_connection.fetchval = AsyncMock(return_value=None)
+    reader = ReplicationReader(mock_connection, mock_publisher, slot_name="slot", tables="public.articles")
+
+    await reader.ensure_slot()
+
+    mock_connection.execute.assert_awaited_once_with("SELECT pg_create_logical_replication_slot($1, 'wal2json')", "slot")
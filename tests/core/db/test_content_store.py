@@ -0,0 +1,50 @@
+# tests/core/db/test_content_store.py
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from qdrant_client.models import ScoredPoint
+
+from src.core.db.content_store import CONTENT_REF_FIELD, ContentStore
+
+
+def _hit(point_id: int, payload: dict) -> ScoredPoint:
+    return ScoredPoint(id=point_id, version=0, score=0.5, payload=payload)
+
+
+def test_offload_replaces_the_field_with_a_reference():
+    """Test that the texts are uploaded in one batch and the payloads keep a reference instead."""
+    minio = MagicMock()
+    minio.store_documents.return_value = [("ref-1", "s3://chunks/ref-1"), ("ref-2", "s3://chunks/ref-2")]
+    store = ContentStore(minio=minio, bucket_name="chunks")
+
+    payloads = store.offload([{"content": "a", "type": "articles"}, {"content": "b", "type": "posts"}], field="content")
+
+    minio.store_documents.assert_called_once_with(["a", "b"], bucket_name="chunks")
+    assert payloads == [{"type": "articles", CONTENT_REF_FIELD: "ref-1"}, {"type": "posts", CONTENT_REF_FIELD: "ref-2"}]
+
+
+@pytest.mark.asyncio
+async def test_hydrate_fetches_slim_hits_in_one_batch():
+    """Test that only slim hits are fetched, the original hits are left untouched and unfetchable hits are dropped."""
+    async_minio = MagicMock()
+    async_minio.retrieve_documents = AsyncMock(return_value={"ref-1": "text 1", "ref-2": None})
+    store = ContentStore(async_minio=async_minio, bucket_name="chunks")
+    slim_hit = _hit(1, {CONTENT_REF_FIELD: "ref-1"})
+    hits = [slim_hit, _hit(2, {"content": "inline"}), _hit(3, {CONTENT_REF_FIELD: "ref-2"})]
+
+    hydrated = await store.hydrate(hits)
+
+    async_minio.retrieve_documents.assert_awaited_once_with(["ref-1", "ref-2"], bucket_name="chunks")
+    assert [(hit.id, hit.payload["content"]) for hit in hydrated] == [(1, "text 1"), (2, "inline")]
+    assert "content" not in slim_hit.payload
+
+
+@pytest.mark.asyncio
+async def test_hydrate_skips_the_store_without_slim_hits():
+    """Test that hits written with their content do not reach the content store."""
+    async_minio = MagicMock()
+    async_minio.retrieve_documents = AsyncMock()
+    hits = [_hit(1, {"content": "inline"})]
+
+    assert await ContentStore(async_minio=async_minio).hydrate(hits) == hits
+    async_minio.retrieve_documents.assert_not_awaited()
@@ -0,0 +1,104 @@
+# tests/core/db/test_documents.py
+import contextlib
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import asyncpg
+import pytest
+
+from src.core.db import documents
+from src.core.db.documents import ArticleDocument, PostDocument, RepositoryDocument
+from src.core.db.supabase_client import SupabaseClient
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def mock_connection():
+    """Fixture for a mocked asyncpg Connection whose transaction() propagates exceptions."""
+    connection = AsyncMock(spec=asyncpg.Connection)
+    transaction = AsyncMock()
+    transaction.__aexit__.return_value = False
+    connection.transaction = MagicMock(return_value=transaction)
+    return connection
+
+
+@pytest.fixture
+def mock_db_client(mock_connection):
+    """Fixture for a SupabaseClient handing out the mocked connection."""
+    db_client = MagicMock(spec=SupabaseClient)
+
+    @contextlib.asynccontextmanager
+    async def get_connection():
+        yield mock_connection
+
+    db_client.get_connection = get_connection
+    return db_client
+
+
+async def test_copy_insert_batches_through_staging_table(mock_db_client, mock_connection):
+    """Test that records are copied into a staging table and moved over once per batch."""
+    records = [("a",), ("b",), ("c",)]
+
+    await documents._copy_insert(mock_db_client, "posts", ["platform"], records, "url", batch_size=2)
+
+    copy_calls = mock_connection.copy_records_to_table.await_args_list
+    assert [call.kwargs["records"] for call in copy_calls] == [[("a",), ("b",)], [("c",)]]
+    assert all(call.args == ("posts_staging",) and call.kwargs["columns"] == ["platform"] for call in copy_calls)
+    statements = [call.args[0] for call in mock_connection.execute.await_args_list]
+    assert sum("CREATE TEMPORARY TABLE posts_staging" in sql for sql in statements) == 2
+    assert sum("ON CONFLICT (url) DO NOTHING" in sql for sql in statements) == 2
+
+
+async def test_post_bulk_insert_serializes_dicts(mock_db_client, mock_connection):
+    """Test that dict fields are copied as JSON text with mapped column names."""
+    post = PostDocument(platform="linkedin", content={"text": "hello"}, author_id="author-1")
+
+    await PostDocument.bulk_insert([post], db_client=mock_db_client)
+
+    call = mock_connection.copy_records_to_table.await_args
+    assert call.kwargs["columns"] == ["platform", "content", "author_id"]
+    assert call.kwargs["records"] == [("linkedin", '{"text": "hello"}', "author-1")]
+
+
+async def test_article_bulk_insert_stores_content_in_minio(mock_db_client, mock_connection):
+    """Test that article contents are uploaded to MinIO and replaced by their S3 URIs."""
+    articles = [
+        ArticleDocument(platform="medium", link=f"https://medium.com/{i}", content=f"content {i}", author_id=uuid.uuid4(), collection_id="c")
+        for i in range(3)
+    ]
+    mock_minio = MagicMock()
+    mock_minio.store_documents = AsyncMock(side_effect=lambda contents: [(c.replace(" ", "-"), "") for c in contents])
+
+    with patch.object(documents, "clients", MagicMock(async_minio=mock_minio)):
+        await ArticleDocument.bulk_insert(articles, db_client=mock_db_client)
+
+    mock_minio.store_documents.assert_awaited_once_with(["content 0", "content 1", "content 2"])
+    records = mock_connection.copy_records_to_table.await_args.kwargs["records"]
+    assert [record[2] for record in records] == ["s3://content-0", "s3://content-1", "s3://content-2"]
+
+
+async def test_article_save_upserts_into_the_articles_columns(mock_db_client):
+    """Test that saving an article writes the url and author_id columns of the articles table."""
+    mock_db_client.fetch_one = AsyncMock(return_value=None)
+    article = ArticleDocument(platform="medium", link="https://medium.com/a", content="", author_id=uuid.uuid4(), collection_id="c")
+
+    await ArticleDocument.save(article, db_client=mock_db_client)
+
+    sql = mock_db_client.fetch_one.await_args.args[0]
+    assert "INSERT INTO articles (platform, url, content, author_id, collection_id, id)" in sql
+    assert "ON CONFLICT (url) DO UPDATE SET" in sql
+    assert "author_platform_user_id" not in sql
+
+
+async def test_repository_save_upserts_into_the_repositories_columns(mock_db_client):
+    """Test that saving a repository writes the url and owner_id columns of the repositories table."""
+    mock_db_client.fetch_one = AsyncMock(return_value=None)
+    repository = RepositoryDocument(name="repo", link="https://github.com/r", content={}, owner_id=str(uuid.uuid4()))
+
+    await RepositoryDocument.save(repository, db_client=mock_db_client)
+
+    sql = mock_db_client.fetch_one.await_args.args[0]
+    assert "INSERT INTO repositories (name, url, content, owner_id, id)" in sql
+    assert "ON CONFLICT (url) DO UPDATE SET" in sql
+    assert "owner_platform_user_id" not in sql
@@ -0,0 +1,129 @@
+# tests/core/db/test_minio_client.py
+import hashlib
+from unittest.mock import MagicMock, patch
+
+import pytest
+import zstandard
+from minio.error import S3Error
+
+from src.core.db import minio_client
+from src.core.db.minio_client import AsyncMinioClient, MinioClient
+
+
+@pytest.fixture
+def mock_minio(monkeypatch):
+    """Fixture for a mocked Minio SDK client with an empty bucket cache."""
+    monkeypatch.setattr(MinioClient, "_known_buckets", set())
+    minio = MagicMock()
+    minio.bucket_exists.return_value = True
+    minio.stat_object.side_effect = _not_found()
+    with patch("src.core.db.minio_client.Minio", return_value=minio):
+        yield minio
+
+
+def _not_found() -> S3Error:
+    return S3Error(response=MagicMock(), code="NoSuchKey", message="missing", resource="missing", request_id="", host_id="")
+
+
+def _response(body: bytes, headers: dict | None = None) -> MagicMock:
+    response = MagicMock()
+    response.headers = headers or {}
+    response.read.return_value = body
+    response.stream.side_effect = lambda chunk_size: (body[i : i + chunk_size] for i in range(0, len(body), chunk_size))
+    return response
+
+
+def test_bucket_existence_is_cached(mock_minio):
+    """Test that bucket_exists is only called on the first upload to a bucket."""
+    client = MinioClient()
+
+    client.store_document("first")
+    client.store_document("second")
+
+    mock_minio.bucket_exists.assert_called_once_with("documents")
+    assert mock_minio.put_object.call_count == 2
+    assert mock_minio.put_object.call_args.kwargs["part_size"] > 0
+
+
+def test_store_document_is_content_addressed_and_compressed(mock_minio):
+    """Test that documents are keyed by their sha256, zstd-compressed and tagged with codec and hash metadata."""
+    object_id, _ = MinioClient().store_document("hello " * 100)
+
+    assert object_id == hashlib.sha256(("hello " * 100).encode()).hexdigest()
+    kwargs = mock_minio.put_object.call_args.kwargs
+    assert kwargs["object_name"] == object_id
+    assert kwargs["metadata"] == {"content-codec": "zstd", "content-sha256": object_id}
+    assert zstandard.ZstdDecompressor().decompress(kwargs["data"].read()) == ("hello " * 100).encode()
+
+
+def test_store_document_skips_existing_content(mock_minio):
+    """Test that content already stored under its hash is not uploaded again."""
+    mock_minio.stat_object.side_effect = None
+
+    object_id, _ = MinioClient().store_document("unchanged")
+
+    assert object_id == hashlib.sha256(b"unchanged").hexdigest()
+    mock_minio.put_object.assert_not_called()
+
+
+def test_store_document_uuid_mode(mock_minio, monkeypatch):
+    """Test that the legacy mode stores raw text under a random object id."""
+    monkeypatch.setattr(minio_client.settings, "MINIO_CONTENT_ADDRESSED", False)
+
+    object_id, _ = MinioClient().store_document("raw")
+
+    kwargs = mock_minio.put_object.call_args.kwargs
+    assert kwargs["metadata"] is None
+    assert kwargs["data"].read() == b"raw"
+    assert len(object_id) == 36
+
+
+def test_retrieve_document_decompresses(mock_minio):
+    """Test that compressed objects are decompressed transparently, and raw ones returned as is."""
+    compressed = zstandard.ZstdCompressor().compress("compressed text".encode())
+    mock_minio.get_object.side_effect = [
+        _response(compressed, {"x-amz-meta-content-codec": "zstd"}),
+        _response(b"raw text"),
+    ]
+    client = MinioClient()
+
+    assert client.retrieve_document("hash") == "compressed text"
+    assert client.retrieve_document("uuid") == "raw text"
+
+
+def test_retrieve_documents_deduplicates(mock_minio):
+    """Test that batched retrieval fetches each object once and maps failures to None."""
+    def get_object(bucket_name, object_id):
+        if object_id == "missing":
+            raise _not_found()
+        return _response(object_id.encode())
+
+    mock_minio.get_object.side_effect = get_object
+
+    contents = MinioClient().retrieve_documents(["a", "b", "a", "missing"])
+
+    assert contents == {"a": "a", "b": "b", "missing": None}
+    assert mock_minio.get_object.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_async_stream_document(mock_minio):
+    """Test that documents are streamed in chunks and the response is released."""
+    response = _response(b"abcdefg")
+    mock_minio.get_object.return_value = response
+
+    chunks = [chunk async for chunk in AsyncMinioClient().stream_document("object", chunk_size=3)]
+
+    assert chunks == [b"abc", b"def", b"g"]
+    response.release_conn.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_async_stream_document_decompresses(mock_minio):
+    """Test that compressed objects are decompressed while streaming."""
+    body = b"stream me " * 1000
+    mock_minio.get_object.return_value = _response(zstandard.ZstdCompressor().compress(body), {"x-amz-meta-content-codec": "zstd"})
+
+    chunks = [chunk async for chunk in AsyncMinioClient().stream_document("object", chunk_size=64)]
+
+    assert b"".join(chunks) == body
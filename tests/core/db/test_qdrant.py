@@ -0,0 +1,52 @@
+# tests/core/db/test_qdrant.py
+from unittest.mock import MagicMock
+
+import pytest
+from qdrant_client import models
+
+from src.core.db import qdrant
+from src.core.db.qdrant import QdrantDatabaseConnector
+
+
+@pytest.fixture
+def connector():
+    """Fixture for a connector over a mocked QdrantClient."""
+    connector = QdrantDatabaseConnector.__new__(QdrantDatabaseConnector)
+    connector._instance = MagicMock()
+    connector._instance.get_collection.return_value.payload_schema = {}
+    return connector
+
+
+def _indexed_fields(connector) -> dict:
+    return {
+        call.kwargs["field_name"]: call.kwargs["field_schema"]
+        for call in connector._instance.create_payload_index.call_args_list
+    }
+
+
+def test_vector_collection_is_created_with_payload_indexes(connector):
+    """Test that new collections get keyword indexes on the filtered payload fields."""
+    connector.create_vector_collection("vector_articles")
+
+    indexed = _indexed_fields(connector)
+    assert list(indexed) == ["collection_id", "author_id", "type"]
+    assert all(schema.type == models.KeywordIndexType.KEYWORD and not schema.is_tenant for schema in indexed.values())
+
+
+def test_ensure_payload_indexes_only_creates_missing_ones(connector):
+    """Test that existing indexes are left untouched."""
+    connector._instance.get_collection.return_value.payload_schema = {"collection_id": MagicMock()}
+
+    assert connector.ensure_payload_indexes("vector_articles") == ["author_id", "type"]
+    assert list(_indexed_fields(connector)) == ["author_id", "type"]
+
+
+def test_tenant_index(connector, monkeypatch):
+    """Test that QDRANT_TENANT_INDEX indexes collection_id, and only it, as the tenant key."""
+    monkeypatch.setattr(qdrant.settings, "QDRANT_TENANT_INDEX", True)
+
+    connector.ensure_payload_indexes("vector_articles")
+
+    indexed = _indexed_fields(connector)
+    assert indexed["collection_id"].is_tenant is True
+    assert not indexed["author_id"].is_tenant
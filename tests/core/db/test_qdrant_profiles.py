@@ -0,0 +1,108 @@
+# tests/core/db/test_qdrant_profiles.py
+from unittest.mock import MagicMock
+
+import pytest
+from qdrant_client import QdrantClient, models
+
+from src.core.db import qdrant_profiles
+from src.core.db.migrate_qdrant_collections import migrate
+from src.core.db.qdrant import QdrantDatabaseConnector
+from src.core.db.qdrant_profiles import get_collection_profile
+
+
+@pytest.fixture
+def connector(monkeypatch):
+    """Fixture for a connector backed by an in-memory Qdrant."""
+    monkeypatch.setattr(qdrant_profiles.settings, "EMBEDDING_SIZE", 8)
+    connector = QdrantDatabaseConnector.__new__(QdrantDatabaseConnector)
+    connector._instance = QdrantClient(":memory:")
+    yield connector
+    connector.close()
+
+
+def test_default_profile_keeps_float_vectors_in_ram():
+    """Test that the default profile sets no quantization nor search parameters."""
+    profile = get_collection_profile("default")
+
+    assert profile.quantization_config() is None
+    assert profile.vectors_config(size=8).on_disk is False
+    assert profile.search_params() is None
+
+
+@pytest.mark.parametrize(
+    "name, config_type", [("scalar", models.ScalarQuantization), ("binary", models.BinaryQuantization)]
+)
+def test_quantized_profiles_rescore_from_disk(name, config_type):
+    """Test that quantized profiles keep the originals on disk and rescore with oversampling."""
+    profile = get_collection_profile(name)
+
+    assert isinstance(profile.quantization_config(), config_type)
+    assert profile.vectors_config(size=8).on_disk is True
+    assert profile.search_params().quantization.rescore is True
+    assert profile.search_params().quantization.oversampling > 1
+
+
+def test_settings_override_the_profile(monkeypatch):
+    """Test that the tuning settings override the selected profile."""
+    monkeypatch.setattr(qdrant_profiles.settings, "QDRANT_COLLECTION_PROFILE", "scalar")
+    monkeypatch.setattr(qdrant_profiles.settings, "QDRANT_HNSW_M", 32)
+    monkeypatch.setattr(qdrant_profiles.settings, "QDRANT_SEARCH_HNSW_EF", 128)
+    monkeypatch.setattr(qdrant_profiles.settings, "QDRANT_VECTORS_ON_DISK", False)
+
+    profile = get_collection_profile()
+
+    assert profile.name == "scalar"
+    assert profile.hnsw_config().m == 32
+    assert profile.vectors_on_disk is False
+    assert profile.search_params().hnsw_ef == 128
+
+
+def test_unknown_profile():
+    """Test that an unknown profile name is rejected."""
+    with pytest.raises(ValueError):
+        get_collection_profile("unknown")
+
+
+def test_create_vector_collection_with_profile(connector):
+    """Test that a collection created with a quantized profile can be written to and searched."""
+    profile = get_collection_profile("scalar")
+    connector.create_vector_collection("vector_articles", profile=profile)
+    connector.write_data(
+        "vector_articles", models.Batch(ids=[1, 2], vectors=[[1.0] * 8, [0.5, -1.0] * 4], payloads=[{}, {}])
+    )
+
+    hits = connector.search_batch(
+        "vector_articles",
+        [models.SearchRequest(vector=[1.0] * 8, limit=1, params=profile.search_params())],
+    )
+
+    assert [hit.id for hit in hits[0]] == [1]
+
+
+def test_migrate_applies_profile_to_existing_collections():
+    """Test that the migration updates the existing collections only, and nothing in dry-run mode."""
+    connector = MagicMock()
+    connector.get_collections.return_value.collections = [MagicMock(), MagicMock()]
+    connector.get_collections.return_value.collections[0].name = "vector_articles"
+    connector.get_collections.return_value.collections[1].name = "cleaned_articles"
+
+    assert migrate(connector, "binary", ["vector_articles", "vector_posts"], dry_run=True) == ["vector_articles"]
+    connector.apply_collection_profile.assert_not_called()
+
+    migrate(connector, "binary", ["vector_articles", "vector_posts"])
+
+    connector.apply_collection_profile.assert_called_once()
+    collection_name, profile = connector.apply_collection_profile.call_args.args
+    assert (collection_name, profile.name) == ("vector_articles", "binary")
+
+
+def test_apply_default_profile_disables_quantization():
+    """Test that migrating back to the default profile disables quantization."""
+    connector = QdrantDatabaseConnector.__new__(QdrantDatabaseConnector)
+    connector._instance = MagicMock()
+
+    connector.apply_collection_profile("vector_articles", get_collection_profile("default"))
+
+    kwargs = connector._instance.update_collection.call_args.kwargs
+    assert kwargs["quantization_config"] == models.Disabled.DISABLED
+    assert kwargs["vectors_config"] == {"": models.VectorParamsDiff(on_disk=False)}
@@ -1,4 +1,5 @@
 # tests/core/db/test_supabase_client.py
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import asyncpg
@@ -62,6 +63,10 @@ async def test_connect_success(supabase_client, mock_settings, mock_pool):
             dsn=mock_settings.SUPABASE_DB_URL,
             min_size=1,
             max_size=10,
+            max_inactive_connection_lifetime=300.0,
+            command_timeout=30.0,
+            statement_cache_size=100,
+            server_settings={"statement_timeout": "30000"},
         )
         assert supabase_client._pool is mock_pool
 
@@ -130,6 +135,64 @@ async def test_get_connection_acquire_fails(supabase_client, mock_pool):
     mock_pool.release.assert_not_awaited()  # Release should not be called if acquire failed
 
 
+async def test_get_connection_acquire_timeout(supabase_client, mock_pool):
+    """Test that acquire timeouts are counted and re-raised."""
+    supabase_client._pool = mock_pool
+    mock_pool.acquire.side_effect = asyncio.TimeoutError()
+
+    with pytest.raises(asyncio.TimeoutError):
+        async with supabase_client.get_connection():
+            pass  # pragma: no cover
+
+    assert supabase_client.metrics.acquire_timeouts == 1
+    assert supabase_client.metrics.in_use == 0
+
+
+async def test_get_connection_tracks_in_use_and_wait(supabase_client, mock_pool, mock_connection):
+    """Test that connections in use and acquire waits are recorded."""
+    supabase_client._pool = mock_pool
+    mock_pool.acquire.return_value = mock_connection
+
+    async with supabase_client.get_connection():
+        assert supabase_client.metrics.in_use == 1
+
+    stats = supabase_client.metrics.snapshot()
+    assert stats["in_use"] == 0
+    assert stats["acquired"] == 1
+    assert sum(stats["wait_seconds_histogram"].values()) == 1
+
+
+async def test_pool_is_per_instance(mock_pool):
+    """Test that pools are not shared between instances."""
+    client = SupabaseClient()
+    client._pool = mock_pool
+
+    assert SupabaseClient()._pool is None
+
+
+async def test_for_process_reuses_client_per_pid(monkeypatch):
+    """Test that for_process returns one client per process."""
+    monkeypatch.setattr(SupabaseClient, "_clients_by_pid", {})
+
+    parent_client = SupabaseClient.for_process()
+    assert SupabaseClient.for_process() is parent_client
+
+    # Simulate a forked worker
+    monkeypatch.setattr("src.core.db.supabase_client.os.getpid", lambda: -1)
+    assert SupabaseClient.for_process() is not parent_client
+
+
+async def test_health_check(supabase_client, mock_pool, mock_connection):
+    """Test the health check for a reachable and an uninitialized database."""
+    assert await supabase_client.health_check() is False
+
+    supabase_client._pool = mock_pool
+    mock_pool.acquire.return_value = mock_connection
+    mock_connection.fetchval = AsyncMock(return_value=1)
+
+    assert await supabase_client.health_check() is True
+
+
 # --- Test execute ---
 
 
@@ -0,0 +1,70 @@
+# tests/core/db/test_table_mapper.py
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.core.db.documents import RepositoryDocument, UserDocument
+from src.core.db.supabase_client import SupabaseClient
+from src.core.db.table_mapper import TableMapper
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def mapper():
+    return TableMapper("repositories", conflict_target="url", column_map={"link": "url"})
+
+
+@pytest.fixture
+def mock_db_client():
+    db_client = MagicMock(spec=SupabaseClient)
+    db_client.fetch_one = AsyncMock()
+    return db_client
+
+
+async def test_upsert_sql_maps_columns_and_skips_immutable(mapper):
+    """Test that the upsert maps fields to columns and never updates the conflict target or id."""
+    sql = mapper.upsert_sql(("id", "name", "link"))
+
+    assert "INSERT INTO repositories (id, name, url) VALUES ($1, $2, $3)" in sql
+    assert "ON CONFLICT (url) DO UPDATE SET name = EXCLUDED.name RETURNING *" in sql
+
+
+async def test_sql_is_generated_once_per_column_set(mapper):
+    """Test that the SQL text is reused for the same column set, so asyncpg can reuse its prepared statement."""
+    assert mapper.upsert_sql(("id", "name")) is mapper.upsert_sql(("id", "name"))
+    assert mapper.select_one_sql(("link",)) is mapper.select_one_sql(("link",))
+    assert mapper.select_one_sql(("link",)) == "SELECT * FROM repositories WHERE url = $1 LIMIT 1;"
+
+
+async def test_to_model_data_maps_columns_back(mapper):
+    """Test that records are mapped back to model fields, dropping unknown columns."""
+    record = {"id": "r1", "name": "repo", "url": "https://github.com/r", "owner_id": "o1", "crawled_at": None}
+
+    model_data = mapper.to_model_data(record, RepositoryDocument.model_fields)
+
+    assert model_data == {"id": "r1", "name": "repo", "link": "https://github.com/r", "owner_id": "o1"}
+
+
+async def test_find_one_uses_mapper(mock_db_client):
+    """Test that find_one skips unknown filters and builds the model from the mapped record."""
+    user_id = uuid.uuid4()
+    mock_db_client.fetch_one.return_value = {"id": user_id, "username": "jane", "created_at": None}
+
+    user = await UserDocument.find_one(mock_db_client, username="jane", unknown="x")
+
+    assert user == UserDocument(id=user_id, username="jane")
+    mock_db_client.fetch_one.assert_awaited_once_with("SELECT * FROM users WHERE username = $1 LIMIT 1;", ["jane"])
+
+
+async def test_get_or_create_saves_when_missing(mock_db_client):
+    """Test that get_or_create upserts a new user when none is found."""
+    user_id = uuid.uuid4()
+    mock_db_client.fetch_one.side_effect = [None, {"id": user_id, "username": "jane"}]
+
+    user = await UserDocument.get_or_create(mock_db_client, username="jane")
+
+    assert user.id == user_id
+    sql = mock_db_client.fetch_one.await_args.args[0]
+    assert sql.startswith("INSERT INTO users (username, id) VALUES ($1, $2)")
@@ -0,0 +1,69 @@
+# tests/core/rag/test_cache.py
+import time
+
+import pytest
+
+from src.core.rag.cache import RetrievalCache, TTLCache
+
+
+@pytest.fixture
+def cache():
+    """Fixture for a small RetrievalCache."""
+    return RetrievalCache(
+        embedding_cache_size=2,
+        embedding_ttl_seconds=60,
+        search_cache_size=10,
+        search_ttl_seconds=60,
+    )
+
+
+def test_ttl_cache_lru_eviction():
+    """Test that the least recently used entry is evicted once max_size is exceeded."""
+    cache = TTLCache(max_size=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_expiry():
+    """Test that expired entries are reported as misses."""
+    cache = TTLCache(max_size=2, ttl_seconds=0.01)
+    cache.set("a", 1)
+    time.sleep(0.02)
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_query_embedding_roundtrip(cache):
+    """Test that query embeddings are cached by query text."""
+    cache.set_query_embedding("what is rag?", [0.1, 0.2])
+
+    assert cache.get_query_embedding("what is rag?") == [0.1, 0.2]
+    assert cache.get_query_embedding("something else") is None
+
+
+def test_search_results_keyed_by_collection_and_k(cache):
+    """Test that search results are keyed by query vector, collection_id and k."""
+    cache.set_search_results([0.1, 0.2], "collection-1", 6, ["hit-1", "hit-2"])
+
+    assert cache.get_search_results([0.1, 0.2], "collection-1", 6) == ["hit-1", "hit-2"]
+    assert cache.get_search_results([0.1, 0.2], "collection-1", 9) is None
+    assert cache.get_search_results([0.1, 0.2], "collection-2", 6) is None
+    assert cache.get_search_results([0.3, 0.2], "collection-1", 6) is None
+
+
+def test_invalidate_collection(cache):
+    """Test that invalidating a collection only drops its own search results."""
+    cache.set_search_results([0.1], "collection-1", 6, ["hit-1"])
+    cache.set_search_results([0.1], "collection-2", 6, ["hit-2"])
+
+    cache.invalidate_collection("collection-1")
+
+    assert cache.get_search_results([0.1], "collection-1", 6) is None
+    assert cache.get_search_results([0.1], "collection-2", 6) == ["hit-2"]
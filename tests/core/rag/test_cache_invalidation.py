@@ -0,0 +1,98 @@
+# tests/core/rag/test_cache_invalidation.py
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.core.rag.cache import RetrievalCache
+from src.core.rag.cache_invalidation import CacheInvalidationPublisher, CacheInvalidationSubscriber
+
+
+@pytest.fixture
+def connection():
+    """Fixture for a mocked RabbitMQConnection handing out an open channel."""
+    connection = MagicMock()
+    connection.is_connected.return_value = True
+    connection.get_channel.return_value.is_open = True
+    return connection
+
+
+@pytest.fixture
+def cache():
+    return RetrievalCache(embedding_cache_size=10, embedding_ttl_seconds=60, search_cache_size=10, search_ttl_seconds=60)
+
+
+def test_publisher_announces_collection_ids(connection):
+    """Test that the unique collection_ids are published to the fanout exchange declared on first use."""
+    publisher = CacheInvalidationPublisher(connection=connection, exchange_name="invalidations")
+
+    publisher.publish(["collection-2", "collection-1", "collection-2"])
+
+    channel = connection.get_channel.return_value
+    channel.exchange_declare.assert_called_once_with(exchange="invalidations", exchange_type="fanout", durable=True)
+    channel.basic_publish.assert_called_once_with(
+        exchange="invalidations", routing_key="", body=json.dumps(["collection-1", "collection-2"])
+    )
+
+
+def test_publisher_skips_empty_announcements(connection):
+    """Test that nothing is sent, and no connection opened, without collection_ids."""
+    CacheInvalidationPublisher(connection=connection).publish([])
+
+    connection.get_channel.assert_not_called()
+
+
+def test_publisher_reconnects_once(connection):
+    """Test that a publish failing on a dropped connection is retried over a new one."""
+    channel = connection.get_channel.return_value
+    channel.basic_publish.side_effect = [ConnectionError("dropped"), None]
+
+    CacheInvalidationPublisher(connection=connection).publish(["collection-1"])
+
+    assert channel.basic_publish.call_count == 2
+    connection.close.assert_called_once()
+
+
+def test_publisher_does_not_raise_when_the_broker_is_down(connection):
+    """Test that an announcement that cannot be sent is dropped instead of failing the sink."""
+    connection.is_connected.return_value = False
+    connection.connect.side_effect = ConnectionError("refused")
+
+    CacheInvalidationPublisher(connection=connection).publish(["collection-1"])
+
+    assert connection.connect.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_subscriber_invalidates_announced_collections(cache):
+    """Test that cached search results of announced collections are no longer served."""
+    cache.set_search_results([0.1, 0.2], "collection-1", 5, ["hit-1"])
+    cache.set_search_results([0.1, 0.2], "collection-2", 5, ["hit-2"])
+    subscriber = CacheInvalidationSubscriber(cache=cache)
+
+    await subscriber._on_message(SimpleNamespace(body=json.dumps(["collection-1"]).encode()))
+
+    assert cache.get_search_results([0.1, 0.2], "collection-1", 5) is None
+    assert cache.get_search_results([0.1, 0.2], "collection-2", 5) == ["hit-2"]
+
+
+@pytest.mark.asyncio
+async def test_subscriber_skips_malformed_messages(cache):
+    """Test that a malformed announcement is skipped without invalidating anything."""
+    cache.set_search_results([0.1, 0.2], "collection-1", 5, ["hit-1"])
+
+    await CacheInvalidationSubscriber(cache=cache)._on_message(SimpleNamespace(body=b"not json"))
+
+    assert cache.get_search_results([0.1, 0.2], "collection-1", 5) == ["hit-1"]
+
+
+def test_subscriber_clears_search_results_on_reconnect(cache):
+    """Test that cached search results are dropped after a reconnect, as announcements may have been missed."""
+    cache.set_search_results([0.1, 0.2], "collection-1", 5, ["hit-1"])
+    cache.set_query_embedding("query", [0.1, 0.2])
+
+    CacheInvalidationSubscriber(cache=cache)._on_reconnect(MagicMock())
+
+    assert cache.get_search_results([0.1, 0.2], "collection-1", 5) is None
+    assert cache.get_query_embedding("query") == [0.1, 0.2]
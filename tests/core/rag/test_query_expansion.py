@@ -0,0 +1,27 @@
+# tests/core/rag/test_query_expansion.py
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from src.core.rag.query_expanison import QueryExpansion
+
+
+class FakeStreamingChain:
+    def __init__(self, chunks: list[str]):
+        self.chunks = chunks
+
+    async def astream(self, inputs: dict):
+        for chunk in self.chunks:
+            yield SimpleNamespace(content=chunk)
+
+
+@pytest.mark.asyncio
+async def test_astream_queries_yields_queries_as_they_complete():
+    """Test that queries split across streamed chunks are yielded once their separator arrives."""
+    chunks = ["What is ", "RAG?#next-", "question#How does retrieval", " work?#next-question#", "Why rerank?"]
+
+    with patch.object(QueryExpansion, "_build_chain", return_value=FakeStreamingChain(chunks)):
+        queries = [query async for query in QueryExpansion.astream_queries("query", to_expand_to_n=3)]
+
+    assert queries == ["What is RAG?", "How does retrieval work?", "Why rerank?"]
@@ -0,0 +1,110 @@
+# tests/core/rag/test_reranking.py
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.core.rag.reranking import CrossEncoderReranker, LLMReranker, RerankedPassage, Reranker
+
+
+@pytest.mark.asyncio
+async def test_llm_reranker_maps_passages_back_to_ids():
+    """Test that passages reordered by the LLM are returned with their point ids and rank-based scores."""
+    reranker = LLMReranker()
+
+    with patch.object(
+        Reranker, "agenerate_response", AsyncMock(return_value=["second passage", "unknown", "first passage"])
+    ):
+        reranked = await reranker.rerank(
+            query="query", ids=["id-1", "id-2"], passages=[" first passage ", "second passage"], keep_top_k=2
+        )
+
+    assert [(passage.id, passage.content) for passage in reranked] == [
+        ("id-2", "second passage"),
+        ("id-1", "first passage"),
+    ]
+    assert reranked[0].score > reranked[1].score
+
+
+@pytest.mark.asyncio
+async def test_llm_reranker_falls_back_to_the_retrieval_order_when_nothing_matches():
+    """Test that passages are kept in their retrieval order when the LLM returns none of them verbatim."""
+    with patch.object(Reranker, "agenerate_response", AsyncMock(return_value=["rewritten passage", "unknown"])):
+        reranked = await LLMReranker().rerank(
+            query="query",
+            ids=["id-1", "id-2", "id-3"],
+            passages=["first passage", "second passage", "third passage"],
+            keep_top_k=2,
+        )
+
+    assert [(passage.id, passage.content) for passage in reranked] == [
+        ("id-1", "first passage"),
+        ("id-2", "second passage"),
+    ]
+    assert reranked[0].score > reranked[1].score
+
+
+@pytest.mark.asyncio
+async def test_llm_reranker_fills_up_with_unmatched_passages():
+    """Test that passages the LLM dropped follow the matched ones up to keep_top_k."""
+    with patch.object(Reranker, "agenerate_response", AsyncMock(return_value=["third passage"])):
+        reranked = await LLMReranker().rerank(
+            query="query",
+            ids=["id-1", "id-2", "id-3"],
+            passages=["first passage", "second passage", "third passage"],
+            keep_top_k=2,
+        )
+
+    assert [passage.id for passage in reranked] == ["id-3", "id-1"]
+
+
+@pytest.mark.asyncio
+async def test_llm_reranker_no_passages():
+    """Test that reranking no passages does not call the LLM."""
+    with patch.object(Reranker, "agenerate_response", AsyncMock()) as mock_generate:
+        assert await LLMReranker().rerank(query="query", ids=[], passages=[], keep_top_k=3) == []
+
+    mock_generate.assert_not_called()
+
+
+class StubCrossEncoder:
+    """Scores a passage by its length."""
+
+    def predict(self, pairs, batch_size):
+        return [len(passage) for _, passage in pairs]
+
+
+@pytest.fixture
+def cross_encoder(monkeypatch):
+    monkeypatch.setattr(CrossEncoderReranker, "_model", StubCrossEncoder())
+    return CrossEncoderReranker(fallback=AsyncMock())
+
+
+@pytest.mark.asyncio
+async def test_cross_encoder_reranker_sorts_and_keeps_top_k(cross_encoder):
+    """Test that passages are sorted by descending cross-encoder score and cut to keep_top_k."""
+    reranked = await cross_encoder.rerank(query="query", ids=[1, 2, 3], passages=["bb", "a", "ccc"], keep_top_k=2)
+
+    assert [(passage.id, passage.score, passage.content) for passage in reranked] == [(3, 3.0, "ccc"), (1, 2.0, "bb")]
+
+
+@pytest.mark.asyncio
+async def test_cross_encoder_reranker_no_passages(cross_encoder):
+    """Test that reranking no passages returns nothing."""
+    assert await cross_encoder.rerank(query="query", ids=[], passages=[], keep_top_k=3) == []
+
+
+@pytest.mark.asyncio
+async def test_cross_encoder_reranker_falls_back_when_the_model_cannot_load(monkeypatch):
+    """Test that a model that fails to load is not retried and the LLM reranker is used instead."""
+    load_model = MagicMock(side_effect=OSError("download failed"))
+    monkeypatch.setattr(CrossEncoderReranker, "_model", None)
+    monkeypatch.setattr(CrossEncoderReranker, "_load_failed", False)
+    monkeypatch.setattr(CrossEncoderReranker, "load_model", load_model)
+    fallback = AsyncMock()
+    fallback.rerank.return_value = [RerankedPassage(id=1, score=1.0, content="a")]
+    reranker = CrossEncoderReranker(fallback=fallback)
+
+    for _ in range(2):
+        assert await reranker.rerank(query="query", ids=[1], passages=["a"], keep_top_k=1) == fallback.rerank.return_value
+
+    load_model.assert_called_once()
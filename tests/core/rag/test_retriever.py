@@ -0,0 +1,110 @@
+# tests/core/rag/test_retriever.py
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from qdrant_client.models import ScoredPoint
+
+from src.core.rag.retriever import VectorRetriever
+
+
+def _hit(point_id: int, score: float) -> ScoredPoint:
+    return ScoredPoint(id=point_id, version=0, score=score, payload={"content": f"chunk-{point_id}"})
+
+
+@pytest.fixture
+def retriever():
+    """Fixture for a VectorRetriever without real Qdrant, embedding or reranking backends."""
+    with patch("src.core.rag.retriever.clients"), patch("src.core.rag.retriever.get_reranker"):
+        yield VectorRetriever(query="original")
+
+
+def _fake_search(hits_by_query: dict, delays: dict | None = None):
+    async def search_queries(queries, k, collection_id):
+        await asyncio.sleep((delays or {}).get(queries[0], 0))
+        return [hits_by_query[query] for query in queries]
+
+    return search_queries
+
+
+def _fake_expansion(queries: list[str], delay: float = 0):
+    async def astream_queries(query, to_expand_to_n):
+        for generated_query in queries:
+            await asyncio.sleep(delay)
+            yield generated_query
+
+    return astream_queries
+
+
+@pytest.mark.asyncio
+async def test_pipelined_retrieval_searches_original_and_expanded_queries(retriever):
+    """Test that the original query and every streamed expanded query are searched and merged."""
+    hits_by_query = {"original": [_hit(1, 0.5)], "q1": [_hit(1, 0.9), _hit(2, 0.4)], "q2": [_hit(3, 0.7)]}
+    retriever._search_queries = _fake_search(hits_by_query)
+    retriever._query_expander.astream_queries = _fake_expansion(["q1", "q2"])
+
+    hits = await retriever.retrieve_top_k_pipelined(k=6, to_expand_to_n_queries=2, collection_id="c", min_candidates=10)
+
+    assert [(hit.id, hit.score) for hit in hits] == [(1, 0.9), (3, 0.7), (2, 0.4)]
+
+
+@pytest.mark.asyncio
+async def test_pipelined_retrieval_stops_at_min_candidates(retriever):
+    """Test that retrieval returns early once enough unique candidates arrived."""
+    hits_by_query = {"original": [_hit(1, 0.5), _hit(2, 0.4)], "slow": [_hit(3, 0.9)]}
+    retriever._search_queries = _fake_search(hits_by_query, delays={"slow": 10})
+    retriever._query_expander.astream_queries = _fake_expansion(["slow"])
+
+    hits = await asyncio.wait_for(
+        retriever.retrieve_top_k_pipelined(k=6, to_expand_to_n_queries=1, collection_id="c", min_candidates=2),
+        timeout=1,
+    )
+
+    assert [hit.id for hit in hits] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_pipelined_retrieval_batches_queries_parsed_during_a_search(retriever):
+    """Test that expanded queries parsed while a search runs are embedded and searched together."""
+    hits_by_query = {query: [_hit(index, 0.5)] for index, query in enumerate(["original", "q1", "q2", "q3"])}
+    searched = []
+
+    async def search_queries(queries, k, collection_id):
+        searched.append(queries)
+        await asyncio.sleep(0.05)
+        return [hits_by_query[query] for query in queries]
+
+    retriever._search_queries = search_queries
+    retriever._query_expander.astream_queries = _fake_expansion(["q1", "q2", "q3"], delay=0.01)
+
+    hits = await retriever.retrieve_top_k_pipelined(k=6, to_expand_to_n_queries=3, collection_id="c", min_candidates=10)
+
+    assert searched == [["original"], ["q1"], ["q2", "q3"]]
+    assert len(hits) == 4
+
+
+@pytest.mark.asyncio
+async def test_rerank_falls_back_to_vector_order_on_timeout(retriever):
+    """Test that reranking falls back to the vector search order when it exceeds its budget."""
+
+    async def slow_rerank(**kwargs):
+        await asyncio.sleep(10)
+
+    retriever._reranker.rerank = slow_rerank
+
+    reranked = await retriever.rerank(hits=[_hit(1, 0.2), _hit(2, 0.8)], keep_top_k=1, timeout=0.01)
+
+    assert [(passage.id, passage.content) for passage in reranked] == [(2, "chunk-2")]
+
+
+@pytest.mark.asyncio
+async def test_rerank_fetches_the_content_of_slim_hits(retriever):
+    """Test that slim hits are reranked on their text fetched from the content store."""
+    retriever._contents = MagicMock(hydrate=AsyncMock(return_value=[_hit(1, 0.2)]))
+    retriever._reranker.rerank = AsyncMock(return_value=[])
+    slim_hit = ScoredPoint(id=1, version=0, score=0.2, payload={"content_ref": "ref-1"})
+
+    await retriever.rerank(hits=[slim_hit], keep_top_k=1)
+
+    retriever._contents.hydrate.assert_awaited_once_with([slim_hit])
+    assert retriever._reranker.rerank.await_args.kwargs["passages"] == ["chunk-1"]
@@ -0,0 +1,71 @@
+# tests/core/test_clients.py
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.core.clients import ClientRegistry
+
+
+@pytest.fixture
+def connectors():
+    """Patches the connectors created by the registry."""
+    with (
+        patch("src.core.clients.QdrantDatabaseConnector") as qdrant,
+        patch("src.core.clients.AsyncQdrantDatabaseConnector") as async_qdrant,
+        patch("src.core.clients.MinioClient") as minio,
+    ):
+        async_qdrant.return_value.close = AsyncMock()
+        async_qdrant.return_value.get_collections = AsyncMock()
+        yield qdrant, async_qdrant, minio
+
+
+def test_clients_are_created_once(connectors):
+    """Test that every client is created on first use and then shared."""
+    qdrant, async_qdrant, minio = connectors
+    registry = ClientRegistry()
+
+    assert registry.qdrant is registry.qdrant
+    assert registry.async_qdrant is registry.async_qdrant
+    assert registry.async_minio is registry.async_minio
+    assert registry.async_minio.client is registry.minio
+    assert (qdrant.call_count, async_qdrant.call_count, minio.call_count) == (1, 1, 1)
+
+
+def test_chat_models_are_shared_per_temperature():
+    """Test that one ChatOpenAI model is created per temperature."""
+    registry = ClientRegistry()
+
+    assert registry.chat_model() is registry.chat_model()
+    assert registry.chat_model(temperature=0) is registry.chat_model(temperature=0)
+    assert registry.chat_model(temperature=0) is not registry.chat_model()
+    assert registry.chat_model(temperature=0).temperature == 0
+
+
+def test_warm_up_survives_unreachable_services(connectors):
+    """Test that a failing warm-up call is logged instead of failing the startup."""
+    qdrant, _, minio = connectors
+    qdrant.return_value.get_collections.side_effect = ConnectionError
+    minio.return_value.ensure_bucket_exists.side_effect = ConnectionError
+
+    ClientRegistry().warm_up()
+
+
+@pytest.mark.asyncio
+async def test_aclose_closes_and_resets_clients(connectors):
+    """Test that closing releases every client and that they are created again when used afterwards."""
+    qdrant, async_qdrant, _ = connectors
+    registry = ClientRegistry()
+    await registry.astart()
+    model = registry.chat_model()
+    model.root_async_client.close = AsyncMock()
+    model.root_client.close = MagicMock()
+
+    await registry.aclose()
+
+    qdrant.return_value.close.assert_called_once()
+    async_qdrant.return_value.close.assert_awaited_once()
+    model.root_async_client.close.assert_awaited_once()
+    model.root_client.close.assert_called_once()
+    assert registry.chat_model() is not model
+    assert registry.qdrant is not None
+    assert qdrant.call_count == 2
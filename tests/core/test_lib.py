@@ -0,0 +1,22 @@
+# tests/core/test_lib.py
+from qdrant_client.models import ScoredPoint
+
+from src.core.lib import merge_hits_by_max_score
+
+
+def _hit(point_id: int, score: float) -> ScoredPoint:
+    return ScoredPoint(id=point_id, version=0, score=score, payload={"content": f"chunk-{point_id}"})
+
+
+def test_merge_hits_by_max_score_dedupes_and_sorts():
+    """Test that duplicate points keep their best score and hits are ordered by descending score."""
+    hits = [_hit(1, 0.5), _hit(2, 0.7), _hit(1, 0.9), _hit(3, 0.1), _hit(2, 0.2)]
+
+    merged = merge_hits_by_max_score(hits)
+
+    assert [(hit.id, hit.score) for hit in merged] == [(1, 0.9), (2, 0.7), (3, 0.1)]
+
+
+def test_merge_hits_by_max_score_empty():
+    """Test that merging no hits returns an empty list."""
+    assert merge_hits_by_max_score([]) == []
@@ -0,0 +1,47 @@
+# tests/core/test_mq.py
+import pytest
+
+from src.core.mq import RabbitMQConnection, get_shard_queue_name
+
+
+@pytest.fixture(autouse=True)
+def reset_singleton():
+    RabbitMQConnection._instance = None
+    yield
+    RabbitMQConnection._instance = None
+
+
+def test_shared_connection_is_a_singleton():
+    """Test that shared connections are the same instance and keep their first configuration."""
+    first = RabbitMQConnection(host="first-host")
+    second = RabbitMQConnection(host="second-host")
+
+    assert first is second
+    assert second.host == "first-host"
+
+
+def test_shared_connection_keeps_open_connection():
+    """Test that instantiating the singleton again does not drop its connection."""
+    first = RabbitMQConnection()
+    first._connection = object()
+
+    assert RabbitMQConnection()._connection is first._connection
+
+
+def test_non_shared_connections_are_independent():
+    """Test that shared=False returns a dedicated connection object."""
+    shared = RabbitMQConnection()
+    dedicated = RabbitMQConnection(shared=False, host="other-host")
+
+    assert dedicated is not shared
+    assert dedicated.host == "other-host"
+    assert RabbitMQConnection(shared=False) is not dedicated
+
+
+def test_get_shard_queue_name():
+    """Test that messages are routed to a stable shard queue."""
+    assert get_shard_queue_name("queue", "row-1", num_shards=1) == "queue"
+
+    shard_queue = get_shard_queue_name("queue", "row-1", num_shards=4)
+    assert shard_queue in {f"queue.{shard}" for shard in range(4)}
+    assert get_shard_queue_name("queue", "row-1", num_shards=4) == shard_queue
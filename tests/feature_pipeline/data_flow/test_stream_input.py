@@ -0,0 +1,106 @@
+# tests/feature_pipeline/data_flow/test_stream_input.py
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.feature_pipeline.data_flow.stream_input import RabbitMQPartition, RabbitMQSource, get_idempotency_key
+
+
+@pytest.fixture
+def mock_connection():
+    """Fixture for a mocked RabbitMQConnection whose channel delivers the queued bodies on process_data_events."""
+    connection = MagicMock()
+    connection.is_connected.return_value = True
+    channel = MagicMock()
+    connection.get_channel.return_value = channel
+    connection.pending = []
+
+    def process_data_events(time_limit=0):
+        on_message = channel.basic_consume.call_args.kwargs["on_message_callback"]
+        for delivery_tag, body in connection.pending:
+            on_message(channel, SimpleNamespace(delivery_tag=delivery_tag), None, body)
+        connection.pending = []
+
+    connection.process_data_events.side_effect = process_data_events
+
+    with patch("src.feature_pipeline.data_flow.stream_input.RabbitMQConnection", return_value=connection):
+        yield connection
+
+
+def test_partition_consumes_with_prefetch(mock_connection):
+    """Test that the partition consumes with manual acks and the configured prefetch count."""
+    RabbitMQPartition(queue_name="queue", prefetch_count=50, batch_size=10)
+
+    channel = mock_connection.get_channel.return_value
+    channel.basic_qos.assert_called_once_with(prefetch_count=50)
+    assert channel.basic_consume.call_args.kwargs["queue"] == "queue"
+    assert channel.basic_consume.call_args.kwargs["auto_ack"] is False
+
+
+def _message(row_id: int) -> bytes:
+    return json.dumps({"table": "articles", "operation": "INSERT", "data": {"id": row_id}}).encode()
+
+
+def test_next_batch_returns_up_to_batch_size(mock_connection):
+    """Test that next_batch returns at most batch_size messages."""
+    partition = RabbitMQPartition(queue_name="queue", prefetch_count=50, batch_size=2)
+    mock_connection.pending = [(tag, _message(tag)) for tag in (1, 2, 3)]
+
+    assert [message["data"]["id"] for message in partition.next_batch(None)] == [1, 2]
+    assert [message["data"]["id"] for message in partition.next_batch(None)] == [3]
+    assert partition.next_batch(None) == []
+
+
+def test_acks_lag_one_epoch(mock_connection):
+    """Test that messages emitted in an epoch are acked when the next epoch is snapshotted."""
+    partition = RabbitMQPartition(queue_name="queue", prefetch_count=50, batch_size=10)
+    channel = mock_connection.get_channel.return_value
+
+    mock_connection.pending = [(1, _message(1)), (2, _message(2))]
+    partition.next_batch(None)
+    assert partition.snapshot() == {"articles:INSERT:1:", "articles:INSERT:2:"}
+    channel.basic_ack.assert_not_called()
+
+    mock_connection.pending = [(3, _message(3))]
+    partition.next_batch(None)
+    assert partition.snapshot() == {"articles:INSERT:3:"}
+    channel.basic_ack.assert_called_once_with(delivery_tag=2, multiple=True)
+
+
+def test_redelivered_messages_are_not_emitted_twice(mock_connection):
+    """Test that redeliveries of unacked messages after a reconnect or restart are skipped but still acked."""
+    partition = RabbitMQPartition(
+        queue_name="queue", prefetch_count=50, batch_size=10, resume_state={"articles:INSERT:1:"}
+    )
+    channel = mock_connection.get_channel.return_value
+
+    mock_connection.pending = [(1, _message(1)), (2, _message(2))]
+    assert [message["data"]["id"] for message in partition.next_batch(None)] == [2]
+
+    partition.snapshot()
+    partition.snapshot()
+    channel.basic_ack.assert_called_once_with(delivery_tag=2, multiple=True)
+    assert partition.snapshot() == set()
+
+
+def test_get_idempotency_key():
+    """Test that the idempotency key is derived from the row, not from the delivery."""
+    message = {"table": "articles", "operation": "INSERT", "data": {"id": "abc", "updated_at": "2024-01-01"}}
+
+    assert get_idempotency_key(message) == "articles:INSERT:abc:2024-01-01"
+    assert get_idempotency_key({"table": "articles"}) == get_idempotency_key({"table": "articles"})
+
+
+def test_source_lists_partitions(monkeypatch):
+    """Test that the source exposes one partition per consumer, or one per shard queue."""
+    from src.feature_pipeline.data_flow import stream_input
+
+    monkeypatch.setattr(stream_input.settings, "RABBITMQ_QUEUE_NAME", "queue")
+    monkeypatch.setattr(stream_input.settings, "RABBITMQ_NUM_PARTITIONS", 3)
+    monkeypatch.setattr(stream_input.settings, "RABBITMQ_NUM_SHARDS", 1)
+    assert RabbitMQSource().list_parts() == ["queue#0", "queue#1", "queue#2"]
+
+    monkeypatch.setattr(stream_input.settings, "RABBITMQ_NUM_SHARDS", 2)
+    assert RabbitMQSource().list_parts() == ["queue.0", "queue.1"]
@@ -0,0 +1,116 @@
+# tests/feature_pipeline/data_flow/test_stream_output.py
+import uuid
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from qdrant_client.models import UpdateResult, UpdateStatus
+
+from src.feature_pipeline.data_flow import stream_output
+from src.feature_pipeline.data_flow.stream_output import QdrantCleanedDataSink, QdrantVectorDataSink
+from src.feature_pipeline.models.clean import ArticleCleanedModel, PostCleanedModel
+from src.feature_pipeline.models.embedded_chunk import ArticleEmbeddedChunkModel
+
+
+def _article_chunk(collection_id: str = "collection-1") -> ArticleEmbeddedChunkModel:
+    return ArticleEmbeddedChunkModel(
+        entry_id=str(uuid.uuid4()),
+        platform="medium",
+        link="https://medium.com/article",
+        chunk_id=str(uuid.uuid4()),
+        chunk_content="content",
+        embedded_content=np.zeros(4),
+        author_id="author",
+        type="articles",
+        collection_id=collection_id,
+    )
+
+
+@pytest.fixture
+def connection():
+    """Fixture for a mocked connector whose upserts are acknowledged."""
+    connection = MagicMock()
+    connection.write_data.return_value = UpdateResult(operation_id=1, status=UpdateStatus.ACKNOWLEDGED)
+    return connection
+
+
+@pytest.fixture
+def invalidations():
+    return MagicMock()
+
+
+@pytest.fixture
+def sink(connection, invalidations, monkeypatch):
+    monkeypatch.setattr(stream_output.settings, "QDRANT_UPSERT_CHUNK_SIZE", 2)
+    sink = QdrantVectorDataSink(connection=connection, invalidations=invalidations)
+    yield sink
+    sink.close()
+
+
+def test_vector_sink_upserts_chunks_without_waiting(sink, connection):
+    """Test that the points of a collection are merged and upserted in chunks with wait=False."""
+    sink.write_batch([("vector_articles", [_article_chunk(), _article_chunk()]), ("vector_articles", [_article_chunk()])])
+
+    calls = connection.write_data.call_args_list
+    assert [len(call.kwargs["points"].ids) for call in calls] == [2, 1]
+    assert all(call.kwargs["collection_name"] == "vector_articles" and call.kwargs["wait"] is False for call in calls)
+
+
+def test_vector_sink_raises_when_an_upsert_fails(sink, connection):
+    """Test that a failed upload fails the whole batch, so its epoch is not committed."""
+    connection.write_data.side_effect = [UpdateResult(operation_id=1, status=UpdateStatus.ACKNOWLEDGED), ConnectionError]
+
+    with pytest.raises(ConnectionError):
+        sink.write_batch([("vector_articles", [_article_chunk(), _article_chunk(), _article_chunk()])])
+
+
+def test_vector_sink_announces_written_collections(sink, invalidations):
+    """Test that the collection_ids of the written chunks are announced to the retrieval caches."""
+    sink.write_batch([("vector_articles", [_article_chunk("collection-1"), _article_chunk("collection-2")])])
+
+    invalidations.publish.assert_called_once_with({"collection-1", "collection-2"})
+
+
+def test_vector_sink_does_not_announce_failed_writes(sink, connection, invalidations):
+    """Test that nothing is announced when an upsert fails."""
+    connection.write_data.side_effect = RuntimeError("unavailable")
+
+    with pytest.raises(RuntimeError):
+        sink.write_batch([("vector_articles", [_article_chunk()])])
+
+    invalidations.publish.assert_not_called()
+
+
+def test_cleaned_sink_writes_mixed_batches_to_their_collections(connection):
+    """Test that a batch mixing data types is written to one collection per type."""
+    article = ArticleCleanedModel(
+        entry_id=str(uuid.uuid4()),
+        platform="medium",
+        link="https://medium.com/article",
+        cleaned_content="content",
+        author_id="author",
+        type="articles",
+        collection_id="collection-1",
+    )
+    post = PostCleanedModel(
+        entry_id=str(uuid.uuid4()), platform="linkedin", cleaned_content="content", author_id="author", type="posts"
+    )
+
+    QdrantCleanedDataSink(connection=connection).write_batch([post, article])
+
+    written = {call.kwargs["collection_name"]: call.kwargs["points"].ids for call in connection.write_data.call_args_list}
+    assert written == {"cleaned_posts": [post.entry_id], "cleaned_articles": [article.entry_id]}
+
+
+def test_vector_sink_offloads_chunk_texts_with_slim_payloads(connection, monkeypatch):
+    """Test that with slim payloads the chunk texts go to the content store and the points only reference them."""
+    monkeypatch.setattr(stream_output.core_settings, "QDRANT_SLIM_PAYLOADS", True)
+    contents = MagicMock()
+    contents.offload.side_effect = lambda payloads, field: [{"content_ref": "ref"} for _ in payloads]
+    sink = QdrantVectorDataSink(connection=connection, contents=contents)
+
+    sink.write_batch([("vector_articles", [_article_chunk(), _article_chunk()])])
+    sink.close()
+
+    assert contents.offload.call_args.kwargs["field"] == "content"
+    assert connection.write_data.call_args.kwargs["points"].payloads == [{"content_ref": "ref"}] * 2
@@ -0,0 +1,85 @@
+# tests/feature_pipeline/utils/test_embedding_cache.py
+import numpy as np
+import pytest
+
+from src.feature_pipeline.utils.embedding_cache import EmbeddingCache
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "embeddings.sqlite")
+
+
+@pytest.fixture
+def cache(cache_path):
+    """Fixture for an EmbeddingCache backed by a temporary SQLite file."""
+    cache = EmbeddingCache(path=cache_path, model_id="test-model", max_entries=100, lru_size=10)
+    yield cache
+    cache.close()
+
+
+def test_get_many_miss(cache):
+    """Test that unknown chunk ids are reported as misses."""
+    assert cache.get_many(["unknown"]) == {}
+    assert cache.stats()["misses"] == 1
+
+
+def test_put_then_get_from_memory(cache):
+    """Test that freshly stored embeddings are served from the in-process LRU."""
+    cache.put_many({"chunk-1": np.array([0.1, 0.2, 0.3])})
+
+    found = cache.get_many(["chunk-1"])
+
+    np.testing.assert_allclose(found["chunk-1"], [0.1, 0.2, 0.3], rtol=1e-6)
+    assert cache.stats()["memory_hits"] == 1
+
+
+def test_get_from_disk_after_restart(cache, cache_path):
+    """Test that embeddings survive a restart and are served from disk."""
+    cache.put_many({"chunk-1": np.array([1.0, 2.0])})
+    cache.close()
+
+    reopened = EmbeddingCache(path=cache_path, model_id="test-model", max_entries=100, lru_size=10)
+    found = reopened.get_many(["chunk-1", "chunk-2"])
+
+    np.testing.assert_allclose(found["chunk-1"], [1.0, 2.0])
+    assert "chunk-2" not in found
+    assert reopened.stats()["disk_hits"] == 1
+    assert reopened.stats()["misses"] == 1
+    reopened.close()
+
+
+def test_keyed_by_model_id(cache, cache_path):
+    """Test that embeddings produced by another model are not returned."""
+    cache.put_many({"chunk-1": np.array([1.0, 2.0])})
+
+    other_model = EmbeddingCache(path=cache_path, model_id="other-model", max_entries=100, lru_size=10)
+
+    assert other_model.get_many(["chunk-1"]) == {}
+    other_model.close()
+
+
+def test_eviction_bounded_by_max_entries(cache_path):
+    """Test that the least recently used entries are evicted once max_entries is exceeded."""
+    cache = EmbeddingCache(path=cache_path, model_id="test-model", max_entries=2, lru_size=0)
+    cache.put_many({"chunk-1": np.array([1.0])})
+    cache.put_many({"chunk-2": np.array([2.0])})
+    cache.put_many({"chunk-3": np.array([3.0])})
+
+    found = cache.get_many(["chunk-1", "chunk-2", "chunk-3"])
+
+    assert set(found) == {"chunk-2", "chunk-3"}
+    cache.close()
+
+
+def test_eviction_checked_every_evict_interval_rows(cache_path):
+    """Test that the size bound is only enforced once evict_interval rows were written since the last check."""
+    cache = EmbeddingCache(path=cache_path, model_id="test-model", max_entries=1, lru_size=0, evict_interval=3)
+    cache.put_many({"chunk-1": np.array([1.0]), "chunk-2": np.array([2.0])})
+
+    assert set(cache.get_many(["chunk-1", "chunk-2"])) == {"chunk-1", "chunk-2"}
+
+    cache.put_many({"chunk-3": np.array([3.0])})
+
+    assert set(cache.get_many(["chunk-1", "chunk-2", "chunk-3"])) == {"chunk-3"}
+    cache.close()
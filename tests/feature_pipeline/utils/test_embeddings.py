@@ -0,0 +1,93 @@
+# tests/feature_pipeline/utils/test_embeddings.py
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from src.feature_pipeline.utils import embeddings
+
+
+def count_words(text: str) -> int:
+    return len(text.split())
+
+
+@pytest.fixture(autouse=True)
+def word_tokens(monkeypatch):
+    """Fixture counting one token per word, so the tests don't need the tiktoken encoding."""
+    monkeypatch.setattr(embeddings, "length_function_tiktoken", count_words)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Fixture for an OpenAI client returning the length of every input as its embedding, in reverse order."""
+
+    def create(input, model):
+        data = [SimpleNamespace(index=index, embedding=[float(len(text))]) for index, text in enumerate(input)]
+        return SimpleNamespace(data=list(reversed(data)))
+
+    client = MagicMock()
+    client.embeddings.create.side_effect = create
+    monkeypatch.setattr(embeddings, "get_openai_client", lambda: client)
+    return client
+
+
+def test_batch_by_tokens_stays_within_the_token_budget():
+    """Test that no batch holds more tokens than the budget."""
+    texts = ["a b c", "d e", "f g h i", "j", "k l m"]
+
+    batches = embeddings.batch_by_tokens(texts, max_batch_size=10, max_batch_tokens=5)
+
+    assert batches == [[0, 1], [2, 3], [4]]
+    assert all(sum(count_words(texts[index]) for index in batch) <= 5 for batch in batches)
+
+
+def test_batch_by_tokens_stays_within_the_batch_size():
+    """Test that no batch holds more texts than the batch size."""
+    batches = embeddings.batch_by_tokens(["a"] * 5, max_batch_size=2, max_batch_tokens=100)
+
+    assert batches == [[0, 1], [2, 3], [4]]
+
+
+def test_batch_by_tokens_sends_an_oversized_text_alone():
+    """Test that a text above the token budget gets a batch of its own."""
+    texts = ["a", "b c d e f g h", "i"]
+
+    batches = embeddings.batch_by_tokens(texts, max_batch_size=10, max_batch_tokens=3)
+
+    assert batches == [[0], [1], [2]]
+
+
+def test_embedd_texts_maps_embeddings_back_by_index(client, monkeypatch):
+    """Test that embeddings returned out of order are matched to their inputs by index."""
+    monkeypatch.setattr(embeddings.settings, "EMBEDDING_BATCH_SIZE", 10)
+    monkeypatch.setattr(embeddings.settings, "EMBEDDING_BATCH_MAX_TOKENS", 100)
+    texts = ["a", "bb", "ccc"]
+
+    result = embeddings.embedd_texts(texts)
+
+    assert [vector.tolist() for vector in result] == [[1.0], [2.0], [3.0]]
+    assert all(isinstance(vector, np.ndarray) for vector in result)
+
+
+def test_embedd_texts_makes_one_call_per_batch(client, monkeypatch):
+    """Test that every batch is embedded with exactly one API call."""
+    monkeypatch.setattr(embeddings.settings, "EMBEDDING_BATCH_SIZE", 2)
+    monkeypatch.setattr(embeddings.settings, "EMBEDDING_BATCH_MAX_TOKENS", 100)
+    texts = ["a", "bb", "ccc", "dddd", "eeeee"]
+
+    result = embeddings.embedd_texts(texts)
+
+    assert client.embeddings.create.call_count == 3
+    assert [call.kwargs["input"] for call in client.embeddings.create.call_args_list] == [
+        ["a", "bb"],
+        ["ccc", "dddd"],
+        ["eeeee"],
+    ]
+    assert [vector.tolist() for vector in result] == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+
+
+def test_embedd_texts_without_texts_makes_no_call(client):
+    """Test that an empty input is not sent to the API."""
+    assert embeddings.embedd_texts([]) == []
+    client.embeddings.create.assert_not_called()
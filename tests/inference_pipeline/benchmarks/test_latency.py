@@ -0,0 +1,62 @@
+# tests/inference_pipeline/benchmarks/test_latency.py
+import pytest
+
+from src.inference_pipeline.benchmarks.latency import FakeQueryExpansion, StageTimings, run_benchmark
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("target", ["twin", "api"])
+@pytest.mark.parametrize("pipelined", [True, False])
+async def test_benchmark_reports_every_stage(target, pipelined):
+    """Test that a small run completes without errors and reports each stage of the inference path."""
+    result = await run_benchmark(
+        num_chunks=50,
+        num_requests=4,
+        concurrency_levels=[1, 2],
+        target=target,
+        num_collections=3,
+        dimensions=16,
+        expansion_latency_ms=0,
+        embed_latency_ms=0,
+        rerank_latency_ms=0,
+        llm_latency_ms=0,
+        pipelined=pipelined,
+    )
+
+    assert [level["concurrency"] for level in result["levels"]] == [1, 2]
+    for level in result["levels"]:
+        assert level["errors"] == 0
+        assert level["latency"]["calls"] == 4
+        assert set(level["stages"]) == {"expansion", "embed", "search", "rerank", "generate"}
+        assert level["stages"]["generate"]["calls"] == 4
+
+
+@pytest.mark.asyncio
+async def test_benchmark_with_slim_payloads_hydrates_the_candidates():
+    """Test that with slim payloads the chunk texts are fetched from the content store before reranking."""
+    result = await run_benchmark(
+        num_chunks=50,
+        num_requests=4,
+        concurrency_levels=[2],
+        slim_payloads=True,
+        dimensions=16,
+        expansion_latency_ms=0,
+        embed_latency_ms=0,
+        rerank_latency_ms=0,
+        content_latency_ms=0,
+        llm_latency_ms=0,
+    )
+
+    (level,) = result["levels"]
+    assert level["errors"] == 0
+    assert level["stages"]["hydrate"]["calls"] == level["stages"]["rerank"]["calls"] == 4
+
+
+@pytest.mark.asyncio
+async def test_fake_query_expansion_is_deterministic():
+    """Test that the fake expansion yields the same queries when streamed and generated at once."""
+    expansion = FakeQueryExpansion(StageTimings())
+
+    streamed = [query async for query in expansion.astream_queries("a b c", to_expand_to_n=2)]
+
+    assert streamed == await expansion.agenerate_response("a b c", to_expand_to_n=2) == ["b c a", "c a b"]